@@ -13,6 +13,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 from pathlib import Path
 import environ
 import os
+from apps.config.cache import get_cache_config
 from apps.config.db import get_database_config
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -28,10 +29,10 @@ env = environ.Env(
 environ.Env.read_env(os.path.join(BASE_DIR, '.env'))
 
 # SECURITY WARNING: keep the secret key used in production secret!
-SECRET_KEY = env('DEBUG')
+SECRET_KEY = env('SECRET_KEY')
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = env('SECRET_KEY')
+DEBUG = env('DEBUG')
 
 ALLOWED_HOSTS = []
 
@@ -85,6 +86,16 @@ WSGI_APPLICATION = 'RecrApp.wsgi.application'
 
 DATABASES = get_database_config()
 
+# Cache, CACHE_BACKEND=locmem (default) or CACHE_BACKEND=file with CACHE_LOCATION
+# locmem is per process, so it only suits a single worker: with
+# WEB_CONCURRENCY above 1 the settings refuse it, use file instead.
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+CACHES = get_cache_config()
+
+# seconds a rendered table fragment is kept, versioning does the invalidation
+FRAGMENT_CACHE_TIMEOUT = env.int('FRAGMENT_CACHE_TIMEOUT', default=3600)
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -133,6 +144,46 @@ STATIC_URL = '/static/'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# 'named' keeps resume_file_path names, 'content' stores each distinct file
+# once under its SHA-256 (apps.jobs.storage)
+RESUME_STORAGE_MODE = env('RESUME_STORAGE_MODE', default='named')
+
+# Text of uploaded resumes is extracted in a process pool: 'background',
+# 'sync' (inline, for debugging) or 'off' (apps.jobs.extraction)
+RESUME_EXTRACTION_MODE = env('RESUME_EXTRACTION_MODE', default='background')
+RESUME_EXTRACTION_WORKERS = env.int('RESUME_EXTRACTION_WORKERS', default=2)
+
+# First page previews of resumes, same modes (apps.jobs.thumbnails)
+RESUME_THUMBNAIL_MODE = env('RESUME_THUMBNAIL_MODE', default='background')
+RESUME_THUMBNAIL_WIDTH = env.int('RESUME_THUMBNAIL_WIDTH', default=200)
+
+# Model filling Resume.category of uploads, trained with the
+# train_resume_classifier command (apps.jobs.categories)
+RESUME_CLASSIFIER_PATH = env(
+    'RESUME_CLASSIFIER_PATH',
+    default=os.path.join(BASE_DIR, '.cache', 'resume_category.npz'),
+)
+
+# Local Feather copy of the resume dataset, built by cache_resume_dataset;
+# load_resumes reads it instead of the hf:// CSV when it exists
+# (apps.jobs.loaders)
+RESUME_DATASET_CACHE = env(
+    'RESUME_DATASET_CACHE',
+    default=os.path.join(BASE_DIR, '.cache', 'resumes.arrow'),
+)
+
+# Who sends resume downloads: 'django' streams them itself, 'nginx' hands
+# them to an internal location at the prefix (X-Accel-Redirect), 'apache'
+# to mod_xsendfile (apps.jobs.downloads)
+RESUME_DOWNLOAD_BACKEND = env('RESUME_DOWNLOAD_BACKEND', default='django')
+RESUME_DOWNLOAD_ACCEL_PREFIX = env(
+    'RESUME_DOWNLOAD_ACCEL_PREFIX', default='/protected-media/'
+)
+
+# Chunked resume uploads (apps.jobs.uploads), sizes in bytes
+RESUME_UPLOAD_MAX_SIZE = env.int('RESUME_UPLOAD_MAX_SIZE', default=10 * 1024 * 1024)
+RESUME_UPLOAD_MAX_CHUNK = env.int('RESUME_UPLOAD_MAX_CHUNK', default=1024 * 1024)
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
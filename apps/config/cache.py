@@ -0,0 +1,38 @@
+# apps/config/cache.py
+from django.core.exceptions import ImproperlyConfigured
+from environ import Env
+from pathlib import Path
+
+env = Env()
+BASE_DIR = Path(__file__).resolve().parent.parent.parent  # adjust if needed
+env_file = BASE_DIR / ".env"
+env.read_env(env_file)
+
+CACHE_BACKENDS = {
+    'locmem': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'recrapp',
+    },
+    'file': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': env('CACHE_LOCATION', default=str(BASE_DIR / '.cache')),
+    },
+}
+
+
+# backends every process of the server sees, the data versions that key
+# the cached fragments and API ETags must be shared between workers
+SHARED_BACKENDS = {'file'}
+
+
+def get_cache_config():
+    # Choose backend key from environment variable, local memory by default
+    backend = env('CACHE_BACKEND', default='locmem')
+    workers = env.int('WEB_CONCURRENCY', default=1)
+    if workers > 1 and backend not in SHARED_BACKENDS:
+        raise ImproperlyConfigured(
+            f"CACHE_BACKEND={backend} is private to each process, but "
+            f"WEB_CONCURRENCY={workers}: workers would serve stale fragments. "
+            f"Use one of {sorted(SHARED_BACKENDS)}."
+        )
+    return {'default': CACHE_BACKENDS[backend]}
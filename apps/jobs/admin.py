@@ -1,15 +1,22 @@
 from django.contrib import admin
-from .models import JobApplication, Resume, JobApplicationDetails
+from .models import JobApplication, Resume, JobApplicationDetails, ApplicationStat
 
 
 @admin.register(JobApplication)
 class JobApplicationAdmin(admin.ModelAdmin):
-    list_display = ("job_name", "company", "status",
+    list_display = ("job_name", "company", "owner", "status",
                     "apply_date", "valid_to", "valid_days")
     list_filter = ("status", "company", "country")
     search_fields = ("job_name", "company", "city")
     filter_horizontal = ("user",)
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_valid_days()
+
+    @admin.display(description="Valid days", ordering="remaining_days")
+    def valid_days(self, obj):
+        return obj.remaining_days
+
 
 @admin.register(Resume)
 class ResumeAdmin(admin.ModelAdmin):
@@ -21,3 +28,10 @@ class ResumeAdmin(admin.ModelAdmin):
 class JobApplicationDetailsAdmin(admin.ModelAdmin):
     list_display = ("job_application", "salary_range")
     filter_horizontal = ("resume",)
+
+
+@admin.register(ApplicationStat)
+class ApplicationStatAdmin(admin.ModelAdmin):
+    list_display = ("user", "dimension", "value", "count")
+    list_filter = ("dimension",)
+    search_fields = ("user__username", "value")
@@ -0,0 +1,351 @@
+import hashlib
+import json
+from django.conf import settings
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import JsonResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from django.views import View
+
+from apps.jobs.bulk import bulk_set_status
+from apps.jobs.caching import last_modified
+from apps.jobs.forms import JobApplicationForm, JobApplicationDetailsImportForm, \
+    BulkStatusForm
+from apps.jobs.models import JobApplication, JobApplicationDetails, ResumeUpload
+from apps.jobs.uploads import UploadError, append_chunk, finalize_upload, \
+    start_upload
+
+
+APPLICATION_FIELDS = [
+    'id', 'job_name', 'company', 'country', 'city', 'apply_date', 'valid_to',
+    'portal', 'link', 'status',
+]
+DETAILS_FIELDS = ['job_application_body', 'comments', 'salary_range']
+MAX_PER_PAGE = 1000
+
+
+def application_values(user):
+    """Applications of `user` as flat dicts, details joined in the same query"""
+    return JobApplication.objects.filter(owner=user).values(
+        *APPLICATION_FIELDS,
+        'details__id',
+        *(f'details__{field}' for field in DETAILS_FIELDS),
+    )
+
+
+def serialize(row: dict) -> dict:
+    """Nest the details__ columns of a values() row under 'details'"""
+    record = {field: row[field] for field in APPLICATION_FIELDS}
+    record['details'] = {
+        field: row[f'details__{field}'] for field in DETAILS_FIELDS
+    } if row['details__id'] else None
+    return record
+
+
+def error_response(errors: dict, status: int = 400) -> JsonResponse:
+    return JsonResponse({'errors': errors}, status=status)
+
+
+def value_errors(data: dict) -> dict:
+    """
+    {field: [message]} for the values of an application, and of its
+    'details' object, that are not a string or null. The forms expect what
+    an HTML form would post and fail on other JSON types.
+    """
+    message = ['Expected a string or null.']
+    errors = {
+        field: message
+        for field, value in data.items()
+        if field != 'details' and not isinstance(value, (str, type(None)))
+    }
+    details = data.get('details')
+    if isinstance(details, dict):
+        details_errors = value_errors(details)
+        if details_errors:
+            errors['details'] = details_errors
+    return errors
+
+
+class JsonApiMixin(LoginRequiredMixin):
+    """Session authenticated JSON endpoints"""
+    raise_exception = True  # 403 instead of a redirect to the login page
+
+    def read_json(self, request):
+        """Return the JSON object in the request body or None if there is none"""
+        try:
+            data = json.loads(request.body or b'null')
+        except ValueError:
+            return None
+        return data if isinstance(data, dict) else None
+
+
+class ApplicationApiMixin(JsonApiMixin):
+    """
+    GET responses carry an ETag and Last-Modified derived from the time of
+    the user's last change stored in DataVersion (see apps.jobs.caching),
+    so a client repeating a request with If-None-Match gets a 304 after a
+    single primary key lookup, whichever worker serves it.
+    """
+    def conditional_get(self, request, build_response):
+        modified = last_modified(request.user.pk)
+        etag = '"{}"'.format(
+            hashlib.md5(
+                f"{modified.isoformat()}:{request.get_full_path()}".encode()
+            ).hexdigest()
+        )
+        response = get_conditional_response(
+            request, etag=etag, last_modified=modified.timestamp()
+        )
+        if response is None:
+            response = build_response()
+        if response.status_code in (200, 304):
+            response['ETag'] = etag
+            response['Last-Modified'] = http_date(modified.timestamp())
+            patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    def save(self, data: dict, job_app=None):
+        """
+        Validate `data` with the forms of the HTML views and save it.
+
+        Returns:
+            tuple: (saved JobApplication or None, {field: [messages]})
+        """
+        details_data = data.pop('details', None)
+        form = JobApplicationForm(data=data, instance=job_app)
+        details_form = None
+        if details_data is not None:
+            if not isinstance(details_data, dict):
+                return None, {'details': ['Expected an object.']}
+            details = JobApplicationDetails.objects.filter(
+                job_application=job_app
+            ).first() if job_app else None
+            details_form = JobApplicationDetailsImportForm(
+                data=details_data, instance=details
+            )
+        errors = dict(form.errors)
+        if details_form is not None and not details_form.is_valid():
+            errors['details'] = details_form.errors
+        if errors:
+            return None, errors
+
+        job_app = form.save(commit=False)
+        if job_app.pk is None:
+            job_app.owner = self.request.user
+        job_app.save()
+        if details_form is not None:
+            details = details_form.save(commit=False)
+            details.job_application = job_app
+            details.save()
+        return job_app, {}
+
+    def application_response(self, pk, status=200):
+        row = application_values(self.request.user).filter(pk=pk).first()
+        if row is None:
+            return error_response({'id': ['Not found.']}, status=404)
+        return JsonResponse(serialize(row), status=status)
+
+
+class ApplicationListApiView(ApplicationApiMixin, View):
+    """
+    GET  /jobs/api/applications/?sort=&order=&page=&per_page=
+    POST /jobs/api/applications/ with a JSON application, details optional
+    """
+    default_per_page = 20
+
+    def get_page(self):
+        """Return (page, per_page) from the query string, clamped to sane values"""
+        try:
+            page = max(int(self.request.GET.get('page', 1)), 1)
+        except ValueError:
+            page = 1
+        try:
+            per_page = int(self.request.GET.get('per_page', self.default_per_page))
+        except ValueError:
+            per_page = self.default_per_page
+        return page, min(max(per_page, 1), MAX_PER_PAGE)
+
+    def get_rows(self):
+        sort_by = self.request.GET.get('sort')
+        if sort_by not in JobApplication.SORTABLE_FIELDS:
+            sort_by = 'apply_date'
+        prefix = '' if self.request.GET.get('order') == 'asc' else '-'
+        page, per_page = self.get_page()
+        offset = (page - 1) * per_page
+        rows = list(
+            application_values(self.request.user)
+            .order_by(f'{prefix}{sort_by}', f'{prefix}id')
+            [offset:offset + per_page + 1]
+        )
+        return page, rows[:per_page], len(rows) > per_page
+
+    def get(self, request, *args, **kwargs):
+        def build_response():
+            page, rows, has_next = self.get_rows()
+            return JsonResponse({
+                'page': page,
+                'next_page': page + 1 if has_next else None,
+                'results': [serialize(row) for row in rows],
+            })
+        return self.conditional_get(request, build_response)
+
+    def post(self, request, *args, **kwargs):
+        data = self.read_json(request)
+        if data is None:
+            return error_response({'__all__': ['Expected a JSON object.']})
+        errors = value_errors(data)
+        if errors:
+            return error_response(errors)
+        job_app, errors = self.save(data)
+        if errors:
+            return error_response(errors)
+        return self.application_response(job_app.pk, status=201)
+
+
+class ApplicationDetailApiView(ApplicationApiMixin, View):
+    """
+    GET   /jobs/api/applications/<pk>/
+    PATCH /jobs/api/applications/<pk>/ with the fields to change
+    """
+    http_method_names = ['get', 'patch', 'head', 'options']
+
+    def get(self, request, pk, *args, **kwargs):
+        return self.conditional_get(
+            request, lambda: self.application_response(pk)
+        )
+
+    def patch(self, request, pk, *args, **kwargs):
+        job_app = JobApplication.objects.filter(owner=request.user, pk=pk).first()
+        if job_app is None:
+            return error_response({'id': ['Not found.']}, status=404)
+        data = self.read_json(request)
+        if data is None:
+            return error_response({'__all__': ['Expected a JSON object.']})
+        errors = value_errors(data)
+        if errors:
+            return error_response(errors)
+
+        # a partial update is validated as the full form with stored values
+        current = {
+            field: getattr(job_app, field) for field in JobApplicationForm().fields
+        }
+        merged = {**current, **data}
+        if isinstance(data.get('details'), dict):
+            stored = application_values(request.user).filter(pk=pk).first()
+            merged['details'] = {
+                **{field: stored[f'details__{field}'] for field in DETAILS_FIELDS},
+                **data['details'],
+            }
+        _, errors = self.save(merged, job_app)
+        if errors:
+            return error_response(errors)
+        return self.application_response(pk)
+
+
+class ApplicationBulkStatusApiView(ApplicationApiMixin, View):
+    """
+    POST /jobs/api/applications/status/ with {"ids": [...], "status": "..."}
+    """
+
+    def post(self, request, *args, **kwargs):
+        data = self.read_json(request)
+        if data is None:
+            return error_response({'__all__': ['Expected a JSON object.']})
+        form = BulkStatusForm(data=data)
+        if not form.is_valid():
+            return error_response(form.errors)
+        updated = bulk_set_status(
+            request.user, form.cleaned_data['ids'], form.cleaned_data['status']
+        )
+        return JsonResponse({'updated': updated})
+
+
+def upload_state(upload: ResumeUpload) -> dict:
+    return {'id': upload.pk, 'offset': upload.received, 'size': upload.size}
+
+
+def upload_error_response(error: UploadError) -> JsonResponse:
+    return JsonResponse(
+        {'errors': {'__all__': [str(error)]}, **error.details},
+        status=error.status,
+    )
+
+
+class ResumeUploadApiView(JsonApiMixin, View):
+    """
+    POST /jobs/api/uploads/ with {"file_name", "size", "job_title"} starts
+    a chunked resume upload and returns its id and the chunk size limit.
+    """
+
+    def post(self, request, *args, **kwargs):
+        data = self.read_json(request)
+        if data is None:
+            return error_response({'__all__': ['Expected a JSON object.']})
+        try:
+            size = int(data.get('size'))
+        except (TypeError, ValueError):
+            return error_response({'size': ['Expected the file size in bytes.']})
+        try:
+            upload = start_upload(
+                request.user,
+                str(data.get('file_name') or ''),
+                size,
+                job_title=str(data.get('job_title') or '')[:64],
+            )
+        except UploadError as e:
+            return upload_error_response(e)
+        return JsonResponse(
+            {**upload_state(upload), 'max_chunk': settings.RESUME_UPLOAD_MAX_CHUNK},
+            status=201,
+        )
+
+
+class ResumeUploadChunkApiView(JsonApiMixin, View):
+    """
+    GET /jobs/api/uploads/<pk>/ tells where to continue after a dropped
+    connection, PUT /jobs/api/uploads/<pk>/?offset=N appends the raw bytes
+    of the request body at offset N.
+    """
+    http_method_names = ['get', 'put', 'head', 'options']
+
+    def get(self, request, pk, *args, **kwargs):
+        upload = ResumeUpload.objects.filter(pk=pk, user=request.user).first()
+        if upload is None:
+            return error_response({'id': ['Not found.']}, status=404)
+        return JsonResponse(upload_state(upload))
+
+    def put(self, request, pk, *args, **kwargs):
+        try:
+            offset = int(request.GET.get('offset', ''))
+            length = int(request.META.get('CONTENT_LENGTH') or 0) or None
+        except ValueError:
+            return error_response({'offset': ['Expected a byte offset.']})
+        try:
+            # the body is streamed into storage, never read into memory whole
+            upload = append_chunk(pk, request.user, offset, request, length)
+        except UploadError as e:
+            return upload_error_response(e)
+        return JsonResponse(upload_state(upload))
+
+
+class ResumeUploadFinalizeApiView(JsonApiMixin, View):
+    """
+    POST /jobs/api/uploads/<pk>/finalize/ with optional {"description",
+    "sha256"} creates the Resume once every byte has arrived.
+    """
+
+    def post(self, request, pk, *args, **kwargs):
+        data = self.read_json(request) or {}
+        try:
+            resume, digest = finalize_upload(
+                pk,
+                request.user,
+                description=str(data.get('description') or ''),
+                expected_sha256=str(data.get('sha256') or ''),
+            )
+        except UploadError as e:
+            return upload_error_response(e)
+        return JsonResponse(
+            {'id': resume.pk, 'file': resume.file.name, 'sha256': digest},
+            status=201,
+        )
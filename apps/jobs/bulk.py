@@ -0,0 +1,39 @@
+from collections import Counter
+from django.db import transaction
+
+from apps.jobs.caching import bump_data_version
+from apps.jobs.models import JobApplication
+from apps.jobs.stats import apply_stats_delta
+
+
+def bulk_set_status(user, ids, status: str) -> int:
+    """
+    Move the job applications `ids` of `user` to `status` with one UPDATE.
+
+    Ids owned by someone else and applications already in `status` are left
+    alone. The stats are adjusted from the old statuses of the locked rows
+    and the user's cached fragments are dropped, no instance is loaded.
+
+    Returns:
+        int: number of applications whose status changed
+    """
+    if status not in dict(JobApplication.STATUS_CHOICES):
+        raise ValueError(f"Unknown status: {status}")
+    with transaction.atomic():
+        rows = (
+            JobApplication.objects
+            .filter(owner=user, pk__in=ids)
+            .exclude(status=status)
+        )
+        # lock the rows so the stats delta matches what the UPDATE changes
+        previous = Counter(rows.select_for_update().values_list('status', flat=True))
+        if not previous:
+            return 0
+        updated = rows.update(status=status)
+
+        delta = Counter({('status', status): updated})
+        for old_status, count in previous.items():
+            delta[('status', old_status)] -= count
+        apply_stats_delta(user.pk, delta)
+        bump_data_version(user.pk)
+    return updated
@@ -0,0 +1,125 @@
+import time
+from datetime import datetime, timezone
+from functools import partial
+from django.conf import settings
+from django.core.cache import cache
+from django.core.cache.utils import make_template_fragment_key
+from django.db import transaction
+
+from apps.jobs.models import DataVersion
+
+
+VERSION_KEY = "jobs:{scope}-version:{user_id}"
+STATS_KEY = "jobs:fragment-cache:{event}"
+EVENTS = ('hits', 'misses')
+
+
+def data_version(user_id: int, scope: str = 'data') -> int:
+    """
+    Return the current data version of a user, part of every fragment key.
+
+    The version is the time of the last change in nanoseconds. A missing
+    version (first use, eviction, restart of a local-memory cache) starts
+    from the clock, never from a number an older fragment was keyed on.
+    A narrower `scope` such as 'resumes' changes only with that data.
+    """
+    key = VERSION_KEY.format(scope=scope, user_id=user_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key, time.time_ns())
+    return version
+
+
+def _bump_cached_versions(user_ids: set, scope: str) -> None:
+    now = time.time_ns()
+    for user_id in user_ids:
+        key = VERSION_KEY.format(scope=scope, user_id=user_id)
+        version = cache.get(key, 0)
+        cache.set(key, max(now, version + 1), timeout=None)
+
+
+def bump_data_version(*user_ids, scope: str = 'data') -> None:
+    """
+    Record a change to the data of the given users, dropping their
+    fragments. A change of the 'data' scope is also stored in DataVersion,
+    in the caller's transaction, with one upsert.
+
+    The cached versions only move once that transaction commits: a request
+    rendering in between still reads the old rows, and must store them
+    under the old version, not under one that marks them as current.
+    """
+    user_ids = {user_id for user_id in user_ids if user_id is not None}
+    if not user_ids:
+        return
+    if scope == 'data':
+        modified = datetime.fromtimestamp(time.time_ns() / 1e9, tz=timezone.utc)
+        DataVersion.objects.bulk_create(
+            [DataVersion(user_id=user_id, modified=modified) for user_id in user_ids],
+            update_conflicts=True,
+            unique_fields=['user'],
+            update_fields=['modified'],
+        )
+    transaction.on_commit(partial(_bump_cached_versions, user_ids, scope))
+
+
+def last_modified(user_id: int) -> datetime:
+    """
+    Return the time of the last change to the data of a user, read from
+    the database so that all workers agree on it. Data not changed since
+    versions were first stored dates from the epoch.
+    """
+    modified = (
+        DataVersion.objects
+        .filter(user_id=user_id)
+        .values_list('modified', flat=True)
+        .first()
+    )
+    return modified or datetime.fromtimestamp(0, tz=timezone.utc)
+
+
+def fragment_key(name: str, user_id: int, vary_on=()) -> str:
+    return make_template_fragment_key(
+        f"{name}:{user_id}:{data_version(user_id)}", vary_on
+    )
+
+
+def _count(event: str) -> None:
+    key = STATS_KEY.format(event=event)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, timeout=None)
+
+
+def cached_fragment(name: str, user_id: int, vary_on, render) -> str:
+    """
+    Return the fragment `name` of a user from the cache, calling `render()`
+    to build and store it on a miss.
+
+    Args:
+        name (str): fragment name, e.g. 'application_rows'
+        user_id (int): owner of the rendered data
+        vary_on (list): values that select one variant, e.g. page and sort
+        render (callable): returns the fragment content
+    """
+    key = fragment_key(name, user_id, vary_on)
+    content = cache.get(key)
+    if content is not None:
+        _count('hits')
+        return content
+    _count('misses')
+    content = render()
+    cache.set(key, content, settings.FRAGMENT_CACHE_TIMEOUT)
+    return content
+
+
+def fragment_stats() -> dict:
+    """Return {'hits': n, 'misses': n} counted since the last reset"""
+    keys = {STATS_KEY.format(event=event): event for event in EVENTS}
+    found = cache.get_many(keys)
+    return {event: found.get(key, 0) for key, event in keys.items()}
+
+
+def reset_fragment_stats() -> None:
+    cache.delete_many([STATS_KEY.format(event=event) for event in EVENTS])
@@ -0,0 +1,123 @@
+import os
+from functools import lru_cache
+from time import perf_counter
+from django.conf import settings
+
+from apps.jobs.caching import bump_data_version
+from apps.jobs.classifier import TfidfClassifier
+from apps.jobs.models import Resume
+
+
+TEXT_FIELDS = ('job_title', 'description', 'summary')
+
+
+def resume_text(resume: Resume) -> str:
+    return "\n".join(getattr(resume, field) or '' for field in TEXT_FIELDS)
+
+
+@lru_cache(maxsize=1)
+def _load(path: str, mtime_ns: int) -> TfidfClassifier:
+    return TfidfClassifier.load(path)
+
+
+def get_classifier():
+    """
+    The category model at RESUME_CLASSIFIER_PATH, loaded on first use and
+    kept for the life of the process (until the file is replaced), or None
+    when no model has been trained yet.
+    """
+    path = settings.RESUME_CLASSIFIER_PATH
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return _load(path, mtime_ns)
+
+
+def train_classifier(validation: float = 0.1, **options) -> dict:
+    """
+    Train the category model on every resume that has a category and save
+    it to RESUME_CLASSIFIER_PATH. Every n-th resume is first held out to
+    measure the accuracy, then the model is refit on all of them.
+
+    Args:
+        validation (float): share of resumes held out, 0 to skip
+        options: passed to TfidfClassifier.fit
+    Returns:
+        dict: numbers of resumes, classes and terms, holdout accuracy
+            (None when skipped), artifact size in bytes and seconds spent
+    """
+    start = perf_counter()
+    rows = list(
+        Resume.objects
+        .exclude(category='')
+        .order_by('pk')
+        .only('category', *TEXT_FIELDS)
+    )
+    texts = [resume_text(resume) for resume in rows]
+    labels = [resume.category for resume in rows]
+    if len(set(labels)) < 2:
+        raise ValueError("At least two categories are needed to train on.")
+
+    accuracy = None
+    step = round(1 / validation) if validation else 0
+    if step and len(rows) >= 2 * step:
+        held_out = set(range(0, len(rows), step))
+        train = [i for i in range(len(rows)) if i not in held_out]
+        model = TfidfClassifier.fit(
+            [texts[i] for i in train], [labels[i] for i in train], **options
+        )
+        predicted = model.predict([texts[i] for i in held_out])
+        expected = [labels[i] for i in held_out]
+        accuracy = sum(p == e for p, e in zip(predicted, expected)) / len(expected)
+
+    model = TfidfClassifier.fit(texts, labels, **options)
+    model.save(settings.RESUME_CLASSIFIER_PATH)
+    return {
+        'resumes': len(rows),
+        'classes': len(model.classes),
+        'terms': len(model.terms),
+        'accuracy': accuracy,
+        'size': os.path.getsize(settings.RESUME_CLASSIFIER_PATH),
+        'seconds': perf_counter() - start,
+    }
+
+
+def predict_category(resume: Resume) -> str:
+    """Category the model gives `resume`, '' without a model"""
+    classifier = get_classifier()
+    if classifier is None:
+        return ''
+    return classifier.predict([resume_text(resume)])[0]
+
+
+def categorize_resumes(classifier: TfidfClassifier, batch_size: int = 1000) -> dict:
+    """
+    Fill the empty categories in primary key order, `batch_size` resumes
+    scored and updated at a time.
+
+    Returns:
+        dict: numbers of scanned and updated resumes, seconds spent
+    """
+    result = {'scanned': 0, 'updated': 0, 'seconds': 0.0}
+    start = perf_counter()
+    last_pk = 0
+    while True:
+        batch = list(
+            Resume.objects
+            .filter(category='', pk__gt=last_pk)
+            .order_by('pk')
+            .only('user_id', *TEXT_FIELDS)
+            [:batch_size]
+        )
+        if not batch:
+            break
+        last_pk = batch[-1].pk
+        categories = classifier.predict([resume_text(resume) for resume in batch])
+        for resume, category in zip(batch, categories):
+            resume.category = category
+        result['updated'] += Resume.objects.bulk_update(batch, ['category'])
+        result['scanned'] += len(batch)
+        bump_data_version(*{resume.user_id for resume in batch})
+    result['seconds'] = perf_counter() - start
+    return result
@@ -0,0 +1,191 @@
+"""
+TF-IDF + softmax regression text classifier in plain NumPy.
+
+Django-free so it can be trained and used anywhere; apps.jobs.categories
+and apps.jobs.matching feed it resumes. Documents are handled as sparse
+(doc, term, value) triples sorted by document, so memory grows with the
+number of words in a batch and not with the size of the vocabulary.
+"""
+import os
+import re
+import tempfile
+from collections import Counter
+
+import numpy as np
+
+
+TOKEN_RE = re.compile(r"[^\W\d_]{2,}")  # words of two or more letters
+MAX_CHARS = 20000  # of a document, the start of a resume says enough
+
+
+def tokenize(text: str) -> list:
+    return TOKEN_RE.findall((text or '')[:MAX_CHARS].lower())
+
+
+def build_vocabulary(texts: list, max_features: int = 20000, min_df: int = 2):
+    """
+    Return the sorted `max_features` terms found in at least `min_df` of
+    `texts` and their smoothed inverse document frequencies.
+    """
+    df = Counter()
+    for text in texts:
+        df.update(set(tokenize(text)))
+    terms = sorted(
+        term for term, count in df.most_common(max_features) if count >= min_df
+    )
+    idf = np.log((1 + len(texts)) / (1 + np.array(
+        [df[term] for term in terms], dtype=np.float64
+    ))) + 1.0
+    return terms, idf
+
+
+def tfidf_rows(texts: list, vocabulary: dict, idf) -> tuple:
+    """
+    TF-IDF rows of `texts` as (doc, term, value) arrays sorted by doc,
+    values scaled to unit length per document. Words missing from
+    `vocabulary` ({term: index}) are ignored.
+    """
+    ids, lengths = [], []
+    for text in texts:
+        doc = [vocabulary[t] for t in tokenize(text) if t in vocabulary]
+        ids.extend(doc)
+        lengths.append(len(doc))
+    size = max(len(vocabulary), 1)
+    keys = np.repeat(np.arange(len(texts), dtype=np.int64), lengths) * size
+    keys += np.asarray(ids, dtype=np.int64)
+    keys, counts = np.unique(keys, return_counts=True)
+    doc, term = np.divmod(keys, size)
+    values = (1.0 + np.log(counts)) * idf[term]
+    norms = np.sqrt(np.bincount(doc, weights=values ** 2, minlength=len(texts)))
+    values /= norms[doc]
+    return doc, term, values
+
+
+class TfidfClassifier:
+    """
+    Linear classifier over sublinear, L2 normalized TF-IDF features.
+
+    Args:
+        terms (list): vocabulary, position is the feature index
+        idf (ndarray): inverse document frequency of each term
+        weights (ndarray): (terms, classes) coefficients
+        bias (ndarray): intercept of each class
+        classes (list): labels, in the column order of `weights`
+    """
+
+    def __init__(self, terms, idf, weights, bias, classes):
+        self.terms = list(terms)
+        self.vocabulary = {term: i for i, term in enumerate(self.terms)}
+        self.idf = np.asarray(idf, dtype=np.float32)
+        self.weights = np.asarray(weights, dtype=np.float32)
+        self.bias = np.asarray(bias, dtype=np.float32)
+        self.classes = list(classes)
+
+    def transform(self, texts: list) -> tuple:
+        return tfidf_rows(texts, self.vocabulary, self.idf)
+
+    @staticmethod
+    def _dot(doc, term, values, columns, rows: int) -> np.ndarray:
+        # sparse rows times dense weights, one bincount per class; the
+        # weights come transposed so every class gathers from one array
+        return np.stack([
+            np.bincount(doc, weights=values * column[term], minlength=rows)
+            for column in columns
+        ], axis=1)
+
+    def decision_function(self, texts: list) -> np.ndarray:
+        """(len(texts), classes) scores, the higher the more likely"""
+        doc, term, values = self.transform(texts)
+        columns = np.ascontiguousarray(self.weights.T)
+        return self._dot(doc, term, values, columns, len(texts)) + self.bias
+
+    def predict(self, texts: list) -> list:
+        if not texts:
+            return []
+        best = self.decision_function(texts).argmax(axis=1)
+        return [self.classes[i] for i in best]
+
+    @classmethod
+    def fit(
+        cls, texts: list, labels: list, max_features: int = 20000,
+        min_df: int = 2, epochs: int = 200, learning_rate: float = 4.0,
+        l2: float = 1e-5,
+    ):
+        """
+        Learn the vocabulary, IDF and a multinomial logistic regression by
+        full-batch gradient descent with momentum.
+
+        Args:
+            texts (list): training documents
+            labels (list): label of each document
+            max_features (int): keep only this many most frequent terms
+            min_df (int): ignore terms found in fewer documents
+            epochs (int): gradient steps
+            learning_rate (float): step size
+            l2 (float): weight decay
+        """
+        terms, idf = build_vocabulary(texts, max_features, min_df)
+        classes = sorted(set(labels))
+        model = cls(
+            terms, idf, np.zeros((len(terms), len(classes))),
+            np.zeros(len(classes)), classes,
+        )
+
+        rows = len(texts)
+        doc, term, values = model.transform(texts)
+        index = {label: i for i, label in enumerate(classes)}
+        targets = np.zeros((rows, len(classes)))
+        targets[np.arange(rows), [index[label] for label in labels]] = 1.0
+        # (classes, terms), transposed like in decision_function
+        weights = np.zeros((len(classes), len(terms)))
+        bias = np.zeros(len(classes))
+        velocity_w, velocity_b = np.zeros_like(weights), np.zeros_like(bias)
+        for _ in range(epochs):
+            scores = cls._dot(doc, term, values, weights, rows) + bias
+            scores -= scores.max(axis=1, keepdims=True)
+            probabilities = np.exp(scores)
+            probabilities /= probabilities.sum(axis=1, keepdims=True)
+            error = np.ascontiguousarray(((probabilities - targets) / rows).T)
+            gradient_w = np.stack([
+                np.bincount(term, weights=values * column[doc], minlength=len(terms))
+                for column in error
+            ]) + l2 * weights
+            velocity_w = 0.9 * velocity_w - learning_rate * gradient_w
+            velocity_b = 0.9 * velocity_b - learning_rate * error.sum(axis=1)
+            weights += velocity_w
+            bias += velocity_b
+
+        model.weights = weights.T.astype(np.float32)
+        model.bias = bias.astype(np.float32)
+        return model
+
+    def save(self, path: str) -> None:
+        """Write a compressed .npz, weights as float16, atomically"""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                np.savez_compressed(
+                    file,
+                    terms=np.array(self.terms, dtype=str),
+                    idf=self.idf,
+                    weights=self.weights.astype(np.float16),
+                    bias=self.bias,
+                    classes=np.array(self.classes, dtype=str),
+                )
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    @classmethod
+    def load(cls, path: str):
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                data['terms'].tolist(),
+                data['idf'],
+                data['weights'],
+                data['bias'],
+                data['classes'].tolist(),
+            )
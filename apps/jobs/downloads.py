@@ -0,0 +1,139 @@
+import os
+import re
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import content_disposition_header, http_date, parse_etags
+
+from apps.jobs.storage import is_blob, resume_storage
+
+
+# large enough to keep the number of read() calls low when the server has
+# no wsgi.file_wrapper, small enough to never hold a whole PDF in memory
+CHUNK_SIZE = 64 * 1024
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def file_etag(name: str, stat: os.stat_result) -> str:
+    """Strong ETag of a stored file, its SHA-256 for blobs"""
+    if is_blob(name):
+        return '"{}"'.format(os.path.splitext(os.path.basename(name))[0])
+    return '"{:x}-{:x}"'.format(stat.st_size, stat.st_mtime_ns)
+
+
+def parse_range(header: str, size: int):
+    """
+    Return the (first, last) byte positions of a single range `header`, or
+    None to send the whole file. Multiple ranges and malformed headers are
+    ignored, as RFC 9110 allows.
+
+    Raises:
+        RangeNotSatisfiable: the range starts past the end of the file
+    """
+    match = RANGE_RE.match(header or '')
+    if not match or match.groups() == ('', ''):
+        return None
+    first, last = match.groups()
+    if not first:  # suffix range, the last N bytes
+        length = int(last)
+        if length == 0:
+            raise RangeNotSatisfiable()
+        return max(size - length, 0), size - 1
+    first = int(first)
+    last = min(int(last), size - 1) if last else size - 1
+    if first > last:
+        if first >= size:
+            raise RangeNotSatisfiable()
+        return None
+    return first, last
+
+
+def iter_range(file, first: int, last: int):
+    """Read bytes first..last of `file` in CHUNK_SIZE pieces, then close it"""
+    try:
+        file.seek(first)
+        remaining = last - first + 1
+        while remaining > 0:
+            chunk = file.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+    finally:
+        file.close()
+
+
+def offloaded_response(name: str, path: str) -> HttpResponse:
+    """Empty response telling the front proxy which file to send"""
+    response = HttpResponse(content_type='application/pdf')
+    if settings.RESUME_DOWNLOAD_BACKEND == 'nginx':
+        prefix = settings.RESUME_DOWNLOAD_ACCEL_PREFIX.rstrip('/')
+        response['X-Accel-Redirect'] = f"{prefix}/{name}"
+    else:
+        response['X-Sendfile'] = path
+    return response
+
+
+def file_download(request, name: str, filename: str) -> HttpResponse:
+    """
+    Respond with the stored resume file `name`, saved by the browser as
+    `filename`. The caller must already have checked the user may read it.
+
+    With RESUME_DOWNLOAD_BACKEND 'nginx' or 'apache' the transfer is handed to
+    the proxy through X-Accel-Redirect / X-Sendfile, which handles ranges and
+    validators itself. Otherwise the file is streamed from disk: whole files
+    through FileResponse (sendfile() where the server has wsgi.file_wrapper),
+    single byte ranges as 206 responses, both with ETag and Last-Modified.
+    Returns None when the file is missing.
+    """
+    path = resume_storage.path(name)
+    disposition = content_disposition_header(True, filename)
+
+    if settings.RESUME_DOWNLOAD_BACKEND != 'django':
+        response = offloaded_response(name, path)
+        response['Content-Disposition'] = disposition
+        return response
+
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    etag = file_etag(name, stat)
+    response = get_conditional_response(
+        request, etag=etag, last_modified=int(stat.st_mtime)
+    )
+    if response is not None:
+        response['ETag'] = etag
+        return response
+
+    byte_range = None
+    if_range = request.headers.get('If-Range')
+    if if_range is None or etag in parse_etags(if_range):
+        try:
+            byte_range = parse_range(request.headers.get('Range'), stat.st_size)
+        except RangeNotSatisfiable:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{stat.st_size}'
+            return response
+
+    file = open(path, 'rb')
+    if byte_range is None:
+        response = FileResponse(file, content_type='application/pdf')
+        response.block_size = CHUNK_SIZE
+    else:
+        first, last = byte_range
+        response = StreamingHttpResponse(
+            iter_range(file, first, last), status=206, content_type='application/pdf'
+        )
+        response['Content-Length'] = last - first + 1
+        response['Content-Range'] = f'bytes {first}-{last}/{stat.st_size}'
+    response['Content-Disposition'] = disposition
+    response['Accept-Ranges'] = 'bytes'
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(stat.st_mtime)
+    response['Cache-Control'] = 'private, no-cache'
+    return response
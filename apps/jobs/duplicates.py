@@ -0,0 +1,88 @@
+from django.db.models import Count, Min
+
+from apps.jobs.models import JobApplication
+from apps.jobs.utils import application_fingerprint
+
+
+def fingerprint_of(job_app: JobApplication) -> str:
+    return application_fingerprint(job_app.link, job_app.company, job_app.job_name)
+
+
+def find_duplicate(user, fingerprint: str):
+    """
+    Return the oldest application of `user` with `fingerprint`, or None.
+    One probe of the (owner, fingerprint) index.
+    """
+    return (
+        JobApplication.objects
+        .filter(owner=user, fingerprint=fingerprint)
+        .only('id', 'job_name', 'company', 'apply_date')
+        .order_by('id')
+        .first()
+    )
+
+
+def existing_fingerprints(user, fingerprints) -> dict:
+    """Return {fingerprint: id of an application of `user`} for those found"""
+    rows = (
+        JobApplication.objects
+        .filter(owner=user, fingerprint__in=set(fingerprints))
+        .order_by('-id')
+        .values_list('fingerprint', 'id')
+    )
+    return dict(rows)  # the oldest id wins, it comes last
+
+
+def backfill_fingerprints(batch_size: int = 1000) -> dict:
+    """
+    Compute the fingerprint of every application whose stored one is
+    missing or out of date, in primary key order, `batch_size` at a time.
+
+    Returns:
+        dict: numbers of scanned and updated applications
+    """
+    result = {'scanned': 0, 'updated': 0}
+    last_pk = 0
+    while True:
+        batch = list(
+            JobApplication.objects
+            .filter(pk__gt=last_pk)
+            .order_by('pk')
+            .only('link', 'company', 'job_name', 'fingerprint')
+            [:batch_size]
+        )
+        if not batch:
+            break
+        last_pk = batch[-1].pk
+        changed = []
+        for job_app in batch:
+            fingerprint = fingerprint_of(job_app)
+            if job_app.fingerprint != fingerprint:
+                job_app.fingerprint = fingerprint
+                changed.append(job_app)
+        JobApplication.objects.bulk_update(changed, ['fingerprint'])
+        result['scanned'] += len(batch)
+        result['updated'] += len(changed)
+    return result
+
+
+def duplicate_groups(batch_size: int = 1000):
+    """
+    Yield one dict per posting a user applied to more than once: owner_id,
+    fingerprint, count, first_id and the job_name and company of the group,
+    read from the database `batch_size` groups at a time.
+    """
+    groups = (
+        JobApplication.objects
+        .exclude(fingerprint='')
+        .values('owner_id', 'fingerprint')
+        .annotate(
+            count=Count('id'),
+            first_id=Min('id'),
+            job_name=Min('job_name'),
+            company=Min('company'),
+        )
+        .filter(count__gt=1)
+        .order_by('owner_id', 'fingerprint')
+    )
+    yield from groups.iterator(chunk_size=batch_size)
@@ -0,0 +1,93 @@
+import csv
+import json
+from collections import defaultdict
+from itertools import islice
+from django.core.serializers.json import DjangoJSONEncoder
+
+from apps.jobs.models import JobApplication, JobApplicationDetails
+
+
+EXPORT_FIELDS = [
+    'id', 'job_name', 'company', 'country', 'city', 'apply_date', 'valid_to',
+    'portal', 'link', 'status', 'job_application_body', 'comments',
+    'salary_range', 'resumes',
+]
+DETAILS_FIELDS = {
+    'job_application_body': 'details__job_application_body',
+    'comments': 'details__comments',
+    'salary_range': 'details__salary_range',
+}
+
+
+class Echo:
+    """File-like object that hands back what csv.writer writes to it"""
+
+    def write(self, value):
+        return value
+
+
+def _resume_names(details_ids: list) -> dict:
+    """
+    Return {details_id: [resume names]} for a batch, in one query. A resume
+    without a file name, e.g. one uploaded with the form, goes by its
+    description.
+    """
+    Through = JobApplicationDetails.resume.through
+    names = defaultdict(list)
+    rows = (
+        Through.objects
+        .filter(jobapplicationdetails_id__in=details_ids)
+        .order_by('jobapplicationdetails_id', 'resume_id')
+        .values_list(
+            'jobapplicationdetails_id', 'resume__file_name', 'resume__description'
+        )
+    )
+    for details_id, file_name, description in rows:
+        names[details_id].append(file_name or description)
+    return names
+
+
+def iter_export_rows(user, chunk_size: int = 2000):
+    """
+    Yield one dict per job application of `user`, details and resume names
+    included. Rows are streamed from a database cursor `chunk_size` at a
+    time, so memory use does not depend on the size of the history.
+    """
+    columns = {field: field for field in EXPORT_FIELDS if field != 'resumes'}
+    columns.update(DETAILS_FIELDS)
+    rows = (
+        JobApplication.objects
+        .filter(owner=user)
+        .order_by('pk')
+        .values('details__id', *columns.values())
+        .iterator(chunk_size=chunk_size)
+    )
+    while batch := list(islice(rows, chunk_size)):
+        resumes = _resume_names(
+            [row['details__id'] for row in batch if row['details__id']]
+        )
+        for row in batch:
+            record = {field: row[column] for field, column in columns.items()}
+            record['resumes'] = resumes.get(row['details__id'], [])
+            yield record
+
+
+def iter_csv(records):
+    """Encode records as CSV lines, resume names joined with ';'"""
+    writer = csv.writer(Echo())
+    yield writer.writerow(EXPORT_FIELDS)
+    for record in records:
+        record['resumes'] = ';'.join(record['resumes'])
+        yield writer.writerow([record[field] for field in EXPORT_FIELDS])
+
+
+def iter_jsonl(records):
+    """Encode records as JSON Lines"""
+    for record in records:
+        yield json.dumps(record, cls=DjangoJSONEncoder, ensure_ascii=False) + '\n'
+
+
+EXPORT_FORMATS = {
+    'csv': (iter_csv, 'text/csv'),
+    'jsonl': (iter_jsonl, 'application/x-ndjson'),
+}
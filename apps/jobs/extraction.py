@@ -0,0 +1,178 @@
+import logging
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from multiprocessing import get_context
+from time import perf_counter
+from django.conf import settings
+from django.db import connections
+from django.db.models import Q
+
+from apps.jobs.caching import bump_data_version
+from apps.jobs.categories import get_classifier, resume_text
+from apps.jobs.models import Resume
+from apps.jobs.pdf import extract_pdf_text
+from apps.jobs.search import index_resumes
+
+
+logger = logging.getLogger(__name__)
+
+# resumes with a file whose text has not been extracted yet
+MISSING_TEXT = (Q(summary__isnull=True) | Q(summary='')) & ~Q(file='') \
+    & Q(file__isnull=False)
+
+_executor = None
+
+
+def process_pool(workers: int = None) -> ProcessPoolExecutor:
+    """
+    New pool of spawned processes; spawn instead of fork so the workers do
+    not inherit the database connections or threads of the web process.
+    """
+    return ProcessPoolExecutor(
+        max_workers=workers or settings.RESUME_EXTRACTION_WORKERS,
+        mp_context=get_context('spawn'),
+    )
+
+
+def get_executor() -> ProcessPoolExecutor:
+    """Process pool of this web process, started on the first upload"""
+    global _executor
+    if _executor is None:
+        _executor = process_pool()
+    return _executor
+
+
+def imap_ordered(func, iterable, workers: int = 1, window: int = None):
+    """
+    Yield func(item) for every item in input order, each one as soon as it
+    and the results before it are done. At most `window` items (4 per
+    worker by default) are in flight, so neither the input nor the results
+    pile up in memory when the consumer is slower. With one worker `func`
+    runs inline, without a pool.
+    """
+    if workers <= 1:
+        yield from map(func, iterable)
+        return
+    window = window or workers * 4
+    pending = deque()
+    with process_pool(workers) as pool:
+        try:
+            for item in iterable:
+                pending.append(pool.submit(func, item))
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:  # consumer stopped early
+                future.cancel()
+
+
+def awaits_text(resume: Resume) -> bool:
+    """Whether the summary of `resume` is still to be extracted from its file"""
+    return (
+        bool(resume.file) and not resume.summary
+        and settings.RESUME_EXTRACTION_MODE != 'off'
+    )
+
+
+def store_text(resume_id: int, text: str) -> bool:
+    """
+    Save extracted text unless the resume got a summary in the meantime.
+    A resume without a category gets one predicted from the new text.
+    """
+    resume = Resume.objects.filter(MISSING_TEXT, pk=resume_id).first()
+    if resume is None or not text:
+        return False
+    resume.summary = text
+    fields = ['summary'] if resume.category else ['summary', 'category']
+    resume.save(update_fields=fields)  # signals categorize, refresh search and caches
+    return True
+
+
+def _store_result(resume_id: int, future) -> None:
+    # runs on the pool's result thread, which has its own connection
+    try:
+        text, _ = future.result()
+        store_text(resume_id, text)
+    except Exception:
+        logger.exception("Text extraction of resume %s failed", resume_id)
+    finally:
+        connections.close_all()
+
+
+def schedule_extraction(resume: Resume) -> None:
+    """
+    Extract the text of the file of `resume` into its summary.
+
+    With RESUME_EXTRACTION_MODE = 'background' the PDF is parsed in the
+    process pool and the caller returns at once; 'sync' does it inline
+    (tests, debugging) and 'off' not at all.
+    """
+    mode = settings.RESUME_EXTRACTION_MODE
+    if mode == 'off' or not resume.file:
+        return
+    path = resume.file.path
+    if mode == 'sync':
+        store_text(resume.pk, extract_pdf_text(path)[0])
+        return
+    future = get_executor().submit(extract_pdf_text, path)
+    future.add_done_callback(partial(_store_result, resume.pk))
+
+
+def backfill_text(batch_size: int = 100, workers: int = None) -> dict:
+    """
+    Extract the text of every resume that has none, walking the table in
+    primary key order one batch at a time. Each batch is parsed in parallel
+    and written back with one bulk UPDATE, together with the predicted
+    category of the filled resumes that have none.
+
+    Returns:
+        dict: numbers of scanned and filled resumes, pages and seconds spent
+    """
+    workers = workers or settings.RESUME_EXTRACTION_WORKERS
+    result = {'scanned': 0, 'filled': 0, 'pages': 0, 'seconds': 0.0}
+    start = perf_counter()
+    last_pk = 0
+    classifier = get_classifier()
+    with process_pool(workers) as pool:
+        while True:
+            batch = list(
+                Resume.objects
+                .filter(MISSING_TEXT, pk__gt=last_pk)
+                .order_by('pk')
+                .only('pk', 'user_id', 'file', 'description', 'job_title', 'category')
+                [:batch_size]
+            )
+            if not batch:
+                break
+            last_pk = batch[-1].pk
+            paths = [resume.file.path for resume in batch]
+            chunksize = max(1, len(paths) // (workers * 4))
+
+            filled = []
+            for resume, (text, pages) in zip(
+                batch, pool.map(extract_pdf_text, paths, chunksize=chunksize)
+            ):
+                result['pages'] += pages
+                if text:
+                    resume.summary = text
+                    filled.append(resume)
+            uncategorized = [resume for resume in filled if not resume.category]
+            if classifier is not None and uncategorized:
+                categories = classifier.predict(
+                    [resume_text(resume) for resume in uncategorized]
+                )
+                for resume, category in zip(uncategorized, categories):
+                    resume.category = category
+            Resume.objects.bulk_update(filled, ['summary', 'category'])
+            index_resumes(filled)
+            users = {resume.user_id for resume in filled}
+            bump_data_version(*users)
+            bump_data_version(*users, scope='resumes')
+
+            result['scanned'] += len(batch)
+            result['filled'] += len(filled)
+    result['seconds'] = perf_counter() - start
+    return result
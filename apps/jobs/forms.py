@@ -6,10 +6,17 @@ from .models import JobApplication, JobApplicationDetails, Resume
 class JobApplicationForm(forms.ModelForm):
     class Meta:
         model = JobApplication
-        exclude = ['user']
+        exclude = ['user', 'owner']
 
 
 class JobApplicationDetailsForm(forms.ModelForm):
+    UPLOAD_NEW = 'upload_new'
+
+    # id of one of the user's resumes, picked through jobs:resume_lookup
+    resume = forms.CharField(
+        required=False,
+        widget=forms.HiddenInput(attrs={'id': 'resumeInput'}),
+    )
     new_resume = forms.FileField(
         required=False,
         widget=forms.ClearableFileInput(attrs={
@@ -20,16 +27,80 @@ class JobApplicationDetailsForm(forms.ModelForm):
 
     class Meta:
         model = JobApplicationDetails
-        exclude = ['job_application']
+        exclude = ['job_application', 'resume']
 
     def __init__(self, *args, user=None, **kwargs):
         super().__init__(*args, **kwargs)
-        choices = []
-        if user:
-            resumes = Resume.objects.filter(user=user)
-            choices = [(r.id, r.description) for r in resumes]
-        choices.insert(0, ('upload_new', '➕ Upload new resume'))
-        self.fields['resume'].choices = choices
+        self.user = user
+
+    def clean_resume(self):
+        """Return the id of an existing resume of the user, UPLOAD_NEW or None"""
+        value = self.cleaned_data['resume']
+        if value in ('', self.UPLOAD_NEW):
+            return value or None
+        try:
+            resume_id = int(value)
+        except ValueError:
+            resume_id = None
+        # one primary key lookup, never the list of all the user's resumes
+        if resume_id is None or self.user is None or not Resume.objects.filter(
+            user=self.user, pk=resume_id
+        ).exists():
+            raise forms.ValidationError('Select one of your resumes.')
+        return resume_id
+
+
+class JobApplicationDetailsImportForm(forms.ModelForm):
+    """Details columns of an imported row, without the per-user resume choices"""
+
+    class Meta:
+        model = JobApplicationDetails
+        fields = ['job_application_body', 'comments', 'salary_range']
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # any subset of the details columns may be filled in
+        for field in self.fields.values():
+            field.required = False
+
+
+class ImportJobApplicationsForm(forms.Form):
+    file = forms.FileField(
+        widget=forms.ClearableFileInput(attrs={'accept': '.csv,text/csv'})
+    )
+
+
+class MultipleIntegerField(forms.Field):
+    """List of integers posted as repeated values, e.g. ?ids=1&ids=2"""
+    widget = forms.MultipleHiddenInput
+    default_error_messages = {
+        'invalid': 'Enter a list of whole numbers.',
+        'too_many': 'Select at most %(limit)d items.',
+    }
+
+    def __init__(self, *, max_items=None, **kwargs):
+        self.max_items = max_items
+        super().__init__(**kwargs)
+
+    def to_python(self, value):
+        if not value:
+            return []
+        try:
+            values = [int(item) for item in value]
+        except (TypeError, ValueError):
+            raise forms.ValidationError(self.error_messages['invalid'], code='invalid')
+        if self.max_items is not None and len(values) > self.max_items:
+            raise forms.ValidationError(
+                self.error_messages['too_many'],
+                code='too_many',
+                params={'limit': self.max_items},
+            )
+        return values
+
+
+class BulkStatusForm(forms.Form):
+    ids = MultipleIntegerField(max_items=1000)
+    status = forms.ChoiceField(choices=JobApplication.STATUS_CHOICES)
 
 
 class ResumeListForm(forms.ModelForm):
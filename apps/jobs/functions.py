@@ -0,0 +1,23 @@
+from django.db.models import Func, IntegerField
+
+
+class DaysBetween(Func):
+    """
+    DaysBetween(end, start): whole number of days from `start` to `end`.
+
+    PostgreSQL subtracts dates natively, SQLite goes through julianday().
+    """
+
+    arity = 2
+    output_field = IntegerField()
+    template = "(%(expressions)s)"
+    arg_joiner = " - "
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return self.as_sql(
+            compiler,
+            connection,
+            template="CAST(julianday(%(expressions)s) AS INTEGER)",
+            arg_joiner=") - julianday(",
+            **extra_context,
+        )
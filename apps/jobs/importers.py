@@ -0,0 +1,169 @@
+import csv
+from collections import Counter
+from itertools import islice
+from django.core.exceptions import ValidationError
+from django.db import transaction
+
+from apps.jobs.caching import bump_data_version
+from apps.jobs.duplicates import existing_fingerprints, fingerprint_of
+from apps.jobs.forms import JobApplicationForm, JobApplicationDetailsImportForm
+from apps.jobs.models import JobApplication, JobApplicationDetails
+from apps.jobs.search import index_new_applications
+from apps.jobs.stats import apply_stats_deltas, stat_keys
+
+
+class ImportResult:
+    """
+    Outcome of an import: number of created rows, per-row errors and the
+    rows repeating an application the user already has or an earlier row
+    """
+
+    def __init__(self):
+        self.created = 0
+        self.errors = []  # (line number, {field: [messages]})
+        self.duplicates = []  # line numbers
+
+    @property
+    def ok(self):
+        return not self.errors
+
+
+class RowValidator:
+    """
+    Clean plain dict rows with the fields of a ModelForm class.
+
+    Runs the same field cleaning and clean_<field> hooks as
+    `form_class(data=row).is_valid()`, but on one form instance, because
+    building and deep-copying a bound form per row caps an import at about
+    a thousand rows per second.
+    """
+
+    def __init__(self, form_class):
+        self.form = form_class()
+        self.model = form_class._meta.model
+
+    def clean(self, row: dict) -> tuple:
+        """Return (unsaved model instance or None, {field: [messages]})"""
+        form = self.form
+        form.cleaned_data = {}
+        errors = {}
+        for name, field in form.fields.items():
+            try:
+                form.cleaned_data[name] = field.clean(row.get(name))
+                hook = getattr(form, f"clean_{name}", None)
+                if hook is not None:
+                    form.cleaned_data[name] = hook()
+            except ValidationError as e:
+                errors[name] = e.messages
+        if errors:
+            return None, errors
+        return self.model(**form.cleaned_data), {}
+
+
+def validate_rows(rows, first_line: int = 2):
+    """
+    Validate each dict with JobApplicationForm semantics.
+
+    Yields (line number, job application, details or None, errors) where the
+    unsaved instances are None when the row is invalid. Details are only
+    built when the row has any details column filled in.
+    """
+    application_validator = RowValidator(JobApplicationForm)
+    details_validator = RowValidator(JobApplicationDetailsImportForm)
+    details_fields = JobApplicationDetailsImportForm._meta.fields
+    for line, row in enumerate(rows, start=first_line):
+        job_app, errors = application_validator.clean(row)
+        details = None
+        if any(row.get(field) for field in details_fields):
+            details, details_errors = details_validator.clean(row)
+            errors.update(details_errors)
+        if errors:
+            yield line, None, None, errors
+        else:
+            yield line, job_app, details, {}
+
+
+def _write_batch(user, batch: list) -> None:
+    """Insert one batch of validated (job application, details) pairs"""
+    job_apps = [job_app for job_app, _ in batch]
+    for job_app in job_apps:
+        job_app.owner = user
+    JobApplication.objects.bulk_create(job_apps)
+
+    Through = JobApplication.user.through
+    Through.objects.bulk_create(
+        Through(jobapplication_id=job_app.pk, user_id=user.pk)
+        for job_app in job_apps
+    )
+
+    details = []
+    for job_app, job_details in batch:
+        if job_details is not None:
+            job_details.job_application = job_app
+            details.append(job_details)
+    JobApplicationDetails.objects.bulk_create(details)
+
+    # bulk_create sends no signals, so keep stats, search and caches in step here
+    index_new_applications(batch)
+    bump_data_version(user.pk)
+    delta = Counter()
+    for job_app in job_apps:
+        delta.update(stat_keys(job_app))
+    apply_stats_deltas({user.pk: delta})
+
+
+def import_applications(
+    user, rows, batch_size: int = 1000, strict: bool = False,
+    skip_duplicates: bool = False,
+):
+    """
+    Import job applications for `user` from an iterable of column dicts.
+
+    Valid rows are written with batched bulk_create calls for the
+    applications, their M2M through rows and details, all in one
+    transaction. Invalid rows are reported in the result; with `strict`
+    any invalid row rolls the whole import back. Rows whose fingerprint
+    matches an existing application or an earlier row are reported as
+    duplicates, one fingerprint index lookup per batch, and left out
+    with `skip_duplicates`.
+
+    Returns:
+        ImportResult: number of created applications, per-row errors and
+            duplicate lines
+    """
+    result = ImportResult()
+    validated = validate_rows(rows)
+    with transaction.atomic():
+        while chunk := list(islice(validated, batch_size)):
+            seen = set()  # earlier batches are in the table already
+            valid = []
+            for line, job_app, details, errors in chunk:
+                if errors:
+                    result.errors.append((line, errors))
+                else:
+                    job_app.fingerprint = fingerprint_of(job_app)
+                    valid.append((line, job_app, details))
+            known = existing_fingerprints(
+                user, [job_app.fingerprint for _, job_app, _ in valid]
+            )
+            batch = []
+            for line, job_app, details in valid:
+                if job_app.fingerprint in known or job_app.fingerprint in seen:
+                    result.duplicates.append(line)
+                    if skip_duplicates:
+                        continue
+                seen.add(job_app.fingerprint)
+                batch.append((job_app, details))
+            if batch and not (strict and result.errors):
+                _write_batch(user, batch)
+                result.created += len(batch)
+        if strict and result.errors:
+            transaction.set_rollback(True)
+            result.created = 0
+    return result
+
+
+def read_csv(file):
+    """Yield the rows of a text CSV file as dicts, empty cells dropped"""
+    for row in csv.DictReader(file):
+        yield {key: value for key, value in row.items() if key and value != ''}
@@ -0,0 +1,252 @@
+import json
+import os
+from itertools import islice, tee
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from pyarrow import feather
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import transaction
+
+from apps.jobs.caching import bump_data_version
+from apps.jobs.extraction import imap_ordered
+from apps.jobs.models import Resume
+from apps.jobs.pdf import html_to_pdf
+from apps.jobs.search import index_resumes
+from apps.jobs.utils import strip_to_lower_batch
+
+
+DATASET_URL = "hf://datasets/opensporks/resumes/Resume/Resume.csv"
+RESUME_COLUMNS = ['Resume_str', 'Resume_html', 'Category']
+CACHE_SUFFIXES = ('.arrow', '.feather')
+
+
+class Checkpoint:
+    """
+    Progress of one load_resumes run in a small JSON file, rewritten
+    atomically after every committed batch. A file left by a run with other
+    parameters is ignored.
+    """
+
+    def __init__(self, path: str, params: dict):
+        self.path = path
+        self.params = params
+        self.done = 0
+
+    def load(self) -> int:
+        """Return the number of sampled rows a previous run already stored"""
+        try:
+            with open(self.path) as file:
+                state = json.load(file)
+        except (FileNotFoundError, ValueError):
+            return 0
+        if state.get('params') == self.params:
+            self.done = state['done']
+        return self.done
+
+    def save(self, done: int) -> None:
+        self.done = done
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, 'w') as file:
+            json.dump({'params': self.params, 'done': done}, file)
+        os.replace(tmp, self.path)
+
+    def clear(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def count_rows(filepath: str, chunksize: int) -> int:
+    """Number of data rows of a CSV, read one small column at a time"""
+    return sum(
+        len(chunk)
+        for chunk in pd.read_csv(filepath, usecols=['Category'], chunksize=chunksize)
+    )
+
+
+def sample_positions(rows: int, total: int, seed: int) -> np.ndarray:
+    """Sorted positions of `total` distinct rows, the same for the same seed"""
+    if total > rows:
+        raise ValueError(f"The dataset has only {rows} rows.")
+    rng = np.random.default_rng(seed)
+    return np.sort(rng.choice(rows, size=total, replace=False))
+
+
+def iter_sampled_rows(filepath: str, positions: np.ndarray, chunksize: int):
+    """
+    Yield (position, row) for the sampled positions, in order, reading the
+    CSV `chunksize` rows and only the needed columns at a time.
+    """
+    offset = 0
+    chunks = pd.read_csv(filepath, usecols=RESUME_COLUMNS, chunksize=chunksize)
+    for chunk in chunks:
+        first, last = np.searchsorted(positions, [offset, offset + len(chunk)])
+        picked = chunk.iloc[positions[first:last] - offset]
+        for position, row in zip(positions[first:last], picked.itertuples()):
+            yield int(position), row
+        offset += len(chunk)
+        if last == len(positions):
+            break
+
+
+def build_dataset_cache(source: str, path: str, chunksize: int = 1000) -> dict:
+    """
+    Copy the resume columns of the CSV at `source` (a local path or any
+    fsspec URL such as hf://) into an uncompressed Feather file at `path`,
+    `chunksize` rows at a time. The file replaces an older one only once
+    it is complete, and records the source it was made from.
+
+    Returns:
+        dict: numbers of rows and bytes written, seconds spent
+    """
+    start = perf_counter()
+    schema = pa.schema([(column, pa.string()) for column in RESUME_COLUMNS])
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = f"{path}.tmp"
+    rows = 0
+    with pa.OSFile(tmp, 'wb') as sink:
+        # Feather v2 is the Arrow IPC file format, left uncompressed so
+        # readers can memory map it
+        pinned = schema.with_metadata({'source': source})
+        with pa.ipc.new_file(sink, pinned) as writer:
+            chunks = pd.read_csv(
+                source, usecols=RESUME_COLUMNS, dtype=str, chunksize=chunksize
+            )
+            for chunk in chunks:
+                writer.write_batch(pa.RecordBatch.from_pandas(
+                    chunk[RESUME_COLUMNS], schema=schema, preserve_index=False
+                ))
+                rows += len(chunk)
+    os.replace(tmp, path)
+    return {
+        'rows': rows,
+        'size': os.path.getsize(path),
+        'seconds': perf_counter() - start,
+    }
+
+
+def is_dataset_cache(filepath: str) -> bool:
+    return filepath.endswith(CACHE_SUFFIXES)
+
+
+def dataset_cache_source(filepath: str) -> str:
+    """The source a Feather cache was built from, read from its schema"""
+    schema = pa.ipc.open_file(pa.memory_map(filepath)).schema
+    return (schema.metadata or {}).get(b'source', b'').decode()
+
+
+def open_dataset_cache(filepath: str) -> pa.Table:
+    """
+    The resume columns of a Feather cache, memory mapped: opening it reads
+    only the metadata, row data is paged in when rows are taken.
+    """
+    return feather.read_table(filepath, columns=RESUME_COLUMNS, memory_map=True)
+
+
+def iter_cached_rows(table: pa.Table, positions: np.ndarray, chunksize: int):
+    """
+    Yield (position, row) for the sorted positions of a cached dataset,
+    taking `chunksize` rows by index at a time.
+    """
+    for start in range(0, len(positions), chunksize):
+        picked = positions[start:start + chunksize]
+        frame = table.take(pa.array(picked)).to_pandas()
+        yield from zip(map(int, picked), frame.itertuples())
+
+
+def load_resumes(
+    filepath: str, total: int, batch_size: int = 200, workers: int = 1,
+    seed: int = 42, checkpoint_path: str = None, render=None, progress=None,
+) -> dict:
+    """
+    Create `total` resumes from random rows of the resume dataset, spread
+    over the existing users.
+
+    `filepath` is the dataset CSV, or a Feather cache of it made by
+    build_dataset_cache, which needs no network and no row count pass, and
+    from which only the sampled rows are read. The CSV is streamed
+    `batch_size` rows at a time, PDFs are rendered by
+    `workers` processes while earlier ones are stored, and each batch of
+    resumes is written with one bulk_create in its own transaction. Memory
+    use depends on `batch_size`, not on `total`. After every batch the
+    number of stored rows goes to the checkpoint file, so a rerun with the
+    same arguments skips them; the file is removed when the run completes.
+
+    Args:
+        filepath (str): CSV with Resume_str, Resume_html and Category columns,
+            or its .arrow/.feather cache
+        total (int): number of resumes to create
+        batch_size (int): rows read, rendered and inserted at a time
+        workers (int): processes rendering the PDFs
+        seed (int): picks the sampled rows and their owners
+        checkpoint_path (str): progress file, None to not keep one
+        render (callable): HTML to PDF bytes, html_to_pdf by default
+        progress (callable): called with the number of stored resumes
+    Returns:
+        dict: numbers of created and skipped (already stored) resumes,
+            seconds spent
+    """
+    render = render or html_to_pdf
+    params = {'filepath': filepath, 'total': total, 'seed': seed}
+    checkpoint = Checkpoint(checkpoint_path, params) if checkpoint_path else None
+    done = checkpoint.load() if checkpoint else 0
+    result = {'created': 0, 'skipped': done, 'seconds': 0.0}
+    start = perf_counter()
+
+    users = list(User.objects.only('id', 'username').order_by('pk'))
+    if not users:
+        raise ValueError("There are no users to assign the resumes to.")
+    if is_dataset_cache(filepath):
+        table = open_dataset_cache(filepath)
+        positions = sample_positions(table.num_rows, total, seed)
+        sampled = iter_cached_rows(table, positions[done:], batch_size)
+    else:
+        positions = sample_positions(count_rows(filepath, batch_size), total, seed)
+        sampled = iter_sampled_rows(filepath, positions[done:], batch_size)
+    owners = np.random.default_rng(seed + 1).integers(len(users), size=total)
+
+    # the rows already stored are not read again, the tee only holds the
+    # rows whose PDFs are in flight
+    rows, html = tee(sampled)
+    pdfs = imap_ordered(render, (row.Resume_html for _, row in html), workers)
+    stream = zip(range(done, total), rows, pdfs)
+    while batch := list(islice(stream, batch_size)):
+        resumes = []
+        titles = strip_to_lower_batch(
+            [row.Resume_str for _, (_, row), _ in batch], forget_last=2
+        )
+        for (n, (position, row), pdf), title in zip(batch, titles):
+            user = users[owners[n]]
+            name = f"{user.username}_resume_{position}.pdf"
+            resumes.append(Resume(
+                user=user,
+                description=row.Resume_str[:128],
+                job_title=title[:64],
+                file_name=name,
+                file=SimpleUploadedFile(name, pdf, content_type='application/pdf'),
+                category=str(row.Category).capitalize(),
+            ))
+        with transaction.atomic():
+            Resume.objects.bulk_create(resumes)
+            # bulk_create sends no signals, keep search and caches in step here
+            index_resumes(resumes)
+            users_changed = {resume.user_id for resume in resumes}
+            bump_data_version(*users_changed)
+            bump_data_version(*users_changed, scope='resumes')
+        done += len(resumes)
+        result['created'] += len(resumes)
+        if checkpoint:
+            checkpoint.save(done)
+        if progress:
+            progress(done)
+
+    if checkpoint:
+        checkpoint.clear()
+    result['seconds'] = perf_counter() - start
+    return result
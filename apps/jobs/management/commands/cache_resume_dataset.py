@@ -0,0 +1,40 @@
+from django.conf import settings
+from django.core.management import BaseCommand
+
+from apps.jobs.loaders import DATASET_URL, build_dataset_cache
+
+
+class Command(BaseCommand):
+    help = 'Copy the resume dataset into a local Feather file for load_resumes'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--source',
+            type=str,
+            default=DATASET_URL,
+            help='Resume dataset CSV, a local path or an hf:// URL',
+        )
+        parser.add_argument(
+            '--output',
+            type=str,
+            default=settings.RESUME_DATASET_CACHE,
+            help='Feather file to write, RESUME_DATASET_CACHE by default',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Number of CSV rows converted at a time',
+        )
+
+    def handle(self, *args, **kwargs):
+        result = build_dataset_cache(
+            kwargs['source'], kwargs['output'], chunksize=kwargs['chunk_size']
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ Cached {result['rows']} resumes from {kwargs['source']} in "
+                f"{kwargs['output']} ({result['size'] / 2**20:.1f} MiB, "
+                f"{result['seconds']:.1f} s)."
+            )
+        )
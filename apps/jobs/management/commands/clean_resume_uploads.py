@@ -0,0 +1,34 @@
+from datetime import timedelta
+from django.core.management import BaseCommand
+
+from apps.jobs.uploads import remove_stale_uploads
+
+
+class Command(BaseCommand):
+    help = 'Delete chunked resume uploads abandoned before completion, with their files'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--hours',
+            type=float,
+            default=24,
+            help='Remove uploads that received no chunk for this many hours',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report what would be removed',
+        )
+
+    def handle(self, *args, **kwargs):
+        """Remove the stale ResumeUpload rows and their partial files"""
+        result = remove_stale_uploads(
+            timedelta(hours=kwargs['hours']), dry_run=kwargs['dry_run']
+        )
+        prefix = "Would remove" if kwargs['dry_run'] else "Removed"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ {prefix} {result['removed']} stale uploads, "
+                f"{result['freed_bytes']} bytes."
+            )
+        )
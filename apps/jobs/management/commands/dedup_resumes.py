@@ -0,0 +1,32 @@
+from django.core.management import BaseCommand
+
+from apps.jobs.storage import dedup_resume_files
+
+
+class Command(BaseCommand):
+    help = (
+        'Move resume files into the content-addressed layout, sharing '
+        'duplicates. Only files a resume points at are scanned; files no '
+        'resume refers to are left where they are.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report what would be deduplicated',
+        )
+
+    def handle(self, *args, **kwargs):
+        """Hash every resume file and keep one copy per distinct content"""
+        result = dedup_resume_files(dry_run=kwargs['dry_run'])
+        prefix = "Would free" if kwargs['dry_run'] else "Freed"
+
+        if result['missing']:
+            self.stderr.write(f"{result['missing']} resume files are missing.")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ Scanned {result['scanned']} files, {result['deduplicated']} "
+                f"duplicates. {prefix} {result['freed_bytes']} bytes."
+            )
+        )
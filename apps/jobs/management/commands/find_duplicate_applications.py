@@ -0,0 +1,45 @@
+from itertools import islice
+from django.contrib.auth.models import User
+from django.core.management import BaseCommand
+
+from apps.jobs.duplicates import backfill_fingerprints, duplicate_groups
+
+
+class Command(BaseCommand):
+    help = 'Compute missing application fingerprints and list repeated applications'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of applications (or duplicate groups) read at a time',
+        )
+
+    def handle(self, *args, **kwargs):
+        """Backfill fingerprints in batches, then report duplicates per user"""
+        batch_size = kwargs['batch_size']
+        result = backfill_fingerprints(batch_size=batch_size)
+        self.stdout.write(
+            f"Fingerprinted {result['updated']} of {result['scanned']} applications."
+        )
+
+        groups = duplicate_groups(batch_size=batch_size)
+        total = 0
+        while batch := list(islice(groups, batch_size)):
+            usernames = dict(
+                User.objects
+                .filter(pk__in={group['owner_id'] for group in batch})
+                .values_list('pk', 'username')
+            )
+            for group in batch:
+                self.stdout.write(
+                    f"{usernames[group['owner_id']]}: {group['job_name']} at "
+                    f"{group['company']}, {group['count']} applications "
+                    f"(first id {group['first_id']})"
+                )
+            total += len(batch)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"✅ Found {total} postings applied to more than once.")
+        )
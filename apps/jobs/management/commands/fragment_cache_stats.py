@@ -0,0 +1,28 @@
+from django.core.management import BaseCommand
+
+from apps.jobs.caching import fragment_stats, reset_fragment_stats
+
+
+class Command(BaseCommand):
+    help = 'Report hits and misses of the per-user table fragment cache'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help='Zero the counters after reporting them',
+        )
+
+    def handle(self, *args, **kwargs):
+        stats = fragment_stats()
+        total = stats['hits'] + stats['misses']
+        ratio = stats['hits'] / total if total else 0.0
+        if kwargs['reset']:
+            reset_fragment_stats()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ Fragment cache: {stats['hits']} hits, {stats['misses']} misses "
+                f"({ratio:.1%} hit rate)."
+            )
+        )
@@ -0,0 +1,72 @@
+import csv
+from django.contrib.auth.models import User
+from django.core.management import BaseCommand, CommandError
+
+from apps.jobs.importers import import_applications, read_csv
+
+
+class Command(BaseCommand):
+    help = 'Import job applications of one user from a CSV file'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'username',
+            type=str,
+            help='Owner of the imported job applications',
+        )
+        parser.add_argument(
+            'filepath',
+            type=str,
+            help='CSV file with a header row of JobApplication field names',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of rows written per bulk INSERT',
+        )
+        parser.add_argument(
+            '--strict',
+            action='store_true',
+            help='Import nothing if any row is invalid',
+        )
+        parser.add_argument(
+            '--skip-duplicates',
+            action='store_true',
+            help='Leave out rows repeating an application the user already has',
+        )
+
+    def handle(self, *args, **kwargs):
+        """Validate every row, then bulk insert the valid ones"""
+        try:
+            user = User.objects.get(username=kwargs['username'])
+        except User.DoesNotExist:
+            raise CommandError(f"User {kwargs['username']} does not exist")
+
+        try:
+            with open(kwargs['filepath'], newline='', encoding='utf-8-sig') as file:
+                result = import_applications(
+                    user,
+                    read_csv(file),
+                    batch_size=kwargs['batch_size'],
+                    strict=kwargs['strict'],
+                    skip_duplicates=kwargs['skip_duplicates'],
+                )
+        except UnicodeDecodeError as e:
+            raise CommandError(f"The file is not UTF-8 encoded: {e}")
+        except csv.Error as e:
+            raise CommandError(f"The file is not a valid CSV file: {e}")
+
+        for line, errors in result.errors:
+            for field, messages in errors.items():
+                self.stderr.write(f"Line {line}, {field}: {' '.join(messages)}")
+        for line in result.duplicates:
+            self.stderr.write(f"Line {line}: duplicate of an earlier application")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ Imported {result.created} job applications, "
+                f"{len(result.errors)} rows rejected, "
+                f"{len(result.duplicates)} duplicates."
+            )
+        )
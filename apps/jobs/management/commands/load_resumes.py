@@ -1,23 +1,19 @@
-import numpy as np
-import pandas as pd
-from random import choice
+import os
 from sys import stdout
-from weasyprint import HTML
 from tqdm import tqdm
-from django.contrib.auth.models import User
-from django.core.files.uploadedfile import SimpleUploadedFile
-from django.core.management import BaseCommand
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
 
-from apps.jobs.models import Resume
-from apps.jobs.utils import strip_to_lower
+from apps.jobs.loaders import (
+    DATASET_URL, dataset_cache_source, is_dataset_cache, load_resumes,
+)
 
 
-FILE_PATH = "hf://datasets/opensporks/resumes/Resume/Resume.csv"
-np.random.seed(42)
+CHECKPOINT_PATH = os.path.join(settings.BASE_DIR, '.cache', 'load_resumes.json')
 
 
 class Command(BaseCommand):
-    help = 'Create random users'
+    help = 'Create random resumes'
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -28,56 +24,81 @@ class Command(BaseCommand):
         parser.add_argument(
             '--filepath',
             type=str,
-            help='Path to the directory containing resume files',
-            default=FILE_PATH,
+            help=(
+                'Resume dataset CSV or its .arrow/.feather cache, by default '
+                'the cache built by cache_resume_dataset if there is one'
+            ),
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Number of processes rendering the PDFs',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=200,
+            help='Rows read, rendered and inserted per transaction',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=42,
+            help='Seed picking the rows and their users',
+        )
+        parser.add_argument(
+            '--checkpoint',
+            type=str,
+            default=CHECKPOINT_PATH,
+            help='Progress file an interrupted run resumes from',
+        )
+        parser.add_argument(
+            '--restart',
+            action='store_true',
+            help='Ignore the progress of an interrupted run',
         )
 
     def handle(self, *args, **kwargs):
         """Create random resumes associated with random users"""
         total = kwargs['total']
+        workers = kwargs['workers']
         filepath = kwargs['filepath']
-
-        # Get data and prepare
-        df = pd.read_csv(filepath)
-        sample_df = df.sample(n=total).reset_index(drop=True)
-        sample_df["job_title"] = (
-            sample_df["Resume_str"]
-            .apply(strip_to_lower, forget_last=2)
-        )
-        sample_df["Category"] = sample_df["Category"].str.capitalize()
-        sample_df["Resume_pdf"] = sample_df["Resume_html"].apply(
-            lambda x: HTML(string=x).write_pdf()
-        )
-
-        # Get users
-        total_created = 0
-        users = list(User.objects.all())
-
-        # Assign resumes
-        resumes = []
-        for i, resume_row in tqdm(
-            sample_df.iterrows(),
-            desc="Assigning resumes",
-            unit="resume",
-            file=stdout,
-        ):
-            user = choice(users)
-            resume = Resume(
-                user=user,
-                description=resume_row["Resume_str"][:128],
-                job_title=resume_row["job_title"][:64],
-                file_name=f"{user.username}_resume_{i}.pdf",
-                file=SimpleUploadedFile(
-                    name=f"{user.username}_resume_{i}.pdf",
-                    content=resume_row["Resume_pdf"],
-                    content_type='application/pdf'
-                ),
-                category=resume_row["Category"],
+        if filepath is None:
+            cached = os.path.exists(settings.RESUME_DATASET_CACHE)
+            filepath = settings.RESUME_DATASET_CACHE if cached else DATASET_URL
+        if is_dataset_cache(filepath):
+            self.stdout.write(
+                f"Reading {filepath}, cached from {dataset_cache_source(filepath)}"
             )
-            resumes.append(resume)
-            total_created += 1
-        Resume.objects.bulk_create(resumes)
+        if kwargs['restart'] and os.path.exists(kwargs['checkpoint']):
+            os.remove(kwargs['checkpoint'])
+
+        with tqdm(
+            desc="Assigning resumes", unit="resume", total=total, file=stdout
+        ) as bar:
+            try:
+                result = load_resumes(
+                    filepath,
+                    total,
+                    batch_size=kwargs['batch_size'],
+                    workers=workers,
+                    seed=kwargs['seed'],
+                    checkpoint_path=kwargs['checkpoint'],
+                    progress=lambda done: bar.update(done - bar.n),
+                )
+            except ValueError as error:
+                raise CommandError(str(error))
 
+        created, seconds = result['created'], result['seconds']
+        resumed = (
+            f" Resumed after {result['skipped']} stored ones."
+            if result['skipped'] else ""
+        )
         self.stdout.write(
-            self.style.SUCCESS(f"✅ Created {total_created} users.")
+            self.style.SUCCESS(
+                f"✅ Created {created} resumes, PDFs rendered in "
+                f"{seconds:.1f} s ({created / (seconds or 1e-9):.1f}/sec) "
+                f"by {workers} workers.{resumed}"
+            )
         )
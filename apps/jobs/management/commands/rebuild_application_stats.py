@@ -0,0 +1,35 @@
+from django.contrib.auth.models import User
+from django.core.management import BaseCommand, CommandError
+
+from apps.jobs.stats import rebuild_stats
+
+
+class Command(BaseCommand):
+    help = 'Rebuild per-user job application statistics from scratch'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user',
+            type=str,
+            action='append',
+            help='Only rebuild stats of the user with this username (repeatable)',
+        )
+
+    def handle(self, *args, **kwargs):
+        """Recompute ApplicationStat rows from the job applications table"""
+        usernames = kwargs['user']
+        user_ids = None
+        if usernames:
+            user_ids = list(
+                User.objects
+                .filter(username__in=usernames)
+                .values_list('id', flat=True)
+            )
+            if len(user_ids) != len(set(usernames)):
+                raise CommandError(f"Unknown username in {usernames}")
+
+        total_written = rebuild_stats(user_ids)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"✅ Rebuilt {total_written} statistics.")
+        )
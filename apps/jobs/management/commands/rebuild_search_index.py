@@ -0,0 +1,23 @@
+from django.core.management import BaseCommand
+
+from apps.jobs.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search index of job applications and resumes'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of search documents written per INSERT',
+        )
+
+    def handle(self, *args, **kwargs):
+        """Recreate every SearchDocument from the source tables"""
+        total_indexed = rebuild_search_index(batch_size=kwargs['batch_size'])
+
+        self.stdout.write(
+            self.style.SUCCESS(f"✅ Indexed {total_indexed} documents.")
+        )
@@ -0,0 +1,36 @@
+from django.core.management import BaseCommand
+
+from apps.jobs.thumbnails import render_all_thumbnails
+
+
+class Command(BaseCommand):
+    help = 'Pre-render the first page previews of all resumes'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=100,
+            help='Number of resumes read and updated at a time',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='Number of rendering processes (RESUME_EXTRACTION_WORKERS)',
+        )
+
+    def handle(self, *args, **kwargs):
+        """Render missing previews in parallel, existing ones are kept"""
+        result = render_all_thumbnails(
+            batch_size=kwargs['batch_size'], workers=kwargs['workers']
+        )
+
+        if result['failed']:
+            self.stderr.write(f"{result['failed']} resumes could not be rendered.")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ Checked {result['scanned']} resumes, {result['updated']} "
+                f"previews updated in {result['seconds']:.1f} s."
+            )
+        )
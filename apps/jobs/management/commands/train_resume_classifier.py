@@ -0,0 +1,50 @@
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+
+from apps.jobs.categories import train_classifier
+
+
+class Command(BaseCommand):
+    help = 'Train the resume category model on the resumes that have a category'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--validation',
+            type=float,
+            default=0.1,
+            help='Share of resumes held out to measure the accuracy, 0 to skip',
+        )
+        parser.add_argument(
+            '--epochs',
+            type=int,
+            default=200,
+            help='Number of gradient descent steps',
+        )
+        parser.add_argument(
+            '--max-features',
+            type=int,
+            default=20000,
+            help='Size of the vocabulary',
+        )
+
+    def handle(self, *args, **kwargs):
+        """Fit TF-IDF and the linear model, save them to RESUME_CLASSIFIER_PATH"""
+        try:
+            result = train_classifier(
+                validation=kwargs['validation'],
+                epochs=kwargs['epochs'],
+                max_features=kwargs['max_features'],
+            )
+        except ValueError as error:
+            raise CommandError(str(error))
+
+        if result['accuracy'] is not None:
+            self.stdout.write(f"Holdout accuracy: {result['accuracy']:.1%}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ Trained on {result['resumes']} resumes, {result['classes']} "
+                f"categories, {result['terms']} terms in {result['seconds']:.1f} s. "
+                f"Saved {result['size'] // 1024} KiB to "
+                f"{settings.RESUME_CLASSIFIER_PATH}."
+            )
+        )
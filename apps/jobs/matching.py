@@ -0,0 +1,105 @@
+from collections import OrderedDict
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.jobs.caching import data_version
+from apps.jobs.categories import TEXT_FIELDS
+from apps.jobs.classifier import build_vocabulary, tfidf_rows
+from apps.jobs.models import Resume
+
+
+VECTORS_KEY = "jobs:resume-vectors:{user_id}:{version}"
+LOCAL_SIZE = 64  # users whose vectors stay unpickled in this process
+
+_local = OrderedDict()
+
+
+class ResumeVectors:
+    """
+    TF-IDF vectors of the resumes of one user over their own vocabulary,
+    rows as sorted (doc, term, value) arrays. Row i is resume ids[i].
+    """
+
+    def __init__(self, ids, terms, idf, doc, term, values):
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.terms = terms
+        self.idf = np.asarray(idf, dtype=np.float32)
+        self.doc = np.asarray(doc, dtype=np.int32)
+        self.term = np.asarray(term, dtype=np.int32)
+        self.values = np.asarray(values, dtype=np.float32)
+        self.vocabulary = {t: i for i, t in enumerate(terms)}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['vocabulary']  # rebuilt on load, cheaper than pickling it
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.vocabulary = {t: i for i, t in enumerate(self.terms)}
+
+    @classmethod
+    def build(cls, user_id: int):
+        rows = list(
+            Resume.objects
+            .filter(user_id=user_id)
+            .order_by('pk')
+            .values_list('pk', *TEXT_FIELDS)
+        )
+        texts = ["\n".join(field or '' for field in row[1:]) for row in rows]
+        terms, idf = build_vocabulary(texts, max_features=50000, min_df=1)
+        vocabulary = {t: i for i, t in enumerate(terms)}
+        doc, term, values = tfidf_rows(texts, vocabulary, idf)
+        return cls([row[0] for row in rows], terms, idf, doc, term, values)
+
+    def similarities(self, text: str) -> np.ndarray:
+        """Cosine similarity of every resume to `text`, in row order"""
+        _, term, values = tfidf_rows([text], self.vocabulary, self.idf)
+        query = np.zeros(len(self.terms), dtype=np.float32)
+        query[term] = values
+        return np.bincount(
+            self.doc, weights=self.values * query[self.term], minlength=len(self.ids)
+        )
+
+
+def resume_vectors(user_id: int) -> ResumeVectors:
+    """
+    Vectors of the resumes of a user, built once per change to their
+    resumes: kept in this process and in the shared cache, keyed on the
+    'resumes' data version that resume saves and deletes bump.
+    """
+    version = data_version(user_id, scope='resumes')
+    local = _local.get(user_id)
+    if local is not None and local[0] == version:
+        _local.move_to_end(user_id)
+        return local[1]
+
+    key = VECTORS_KEY.format(user_id=user_id, version=version)
+    vectors = cache.get(key)
+    if vectors is None:
+        vectors = ResumeVectors.build(user_id)
+        cache.set(key, vectors, settings.FRAGMENT_CACHE_TIMEOUT)
+    _local[user_id] = (version, vectors)
+    _local.move_to_end(user_id)
+    while len(_local) > LOCAL_SIZE:
+        _local.popitem(last=False)
+    return vectors
+
+
+def rank_resumes(user_id: int, text: str, limit: int = 5) -> list:
+    """
+    Return up to `limit` (resume_id, score) pairs of the user's resumes
+    most similar to a job posting, best first, zero scores left out.
+    """
+    vectors = resume_vectors(user_id)
+    if not len(vectors.ids):
+        return []
+    scores = vectors.similarities(text)
+    limit = min(limit, len(scores))
+    best = np.argpartition(-scores, limit - 1)[:limit]
+    best = best[np.argsort(-scores[best], kind='stable')]
+    return [
+        (int(vectors.ids[i]), float(scores[i])) for i in best if scores[i] > 0
+    ]
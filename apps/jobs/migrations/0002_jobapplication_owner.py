@@ -0,0 +1,57 @@
+# Generated by Django 5.2.5 on 2026-10-18 14:58
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def populate_owner(apps, schema_editor):
+    JobApplication = apps.get_model('jobs', 'JobApplication')
+    Through = JobApplication.user.through
+    first_user = (
+        Through.objects
+        .filter(jobapplication_id=OuterRef('pk'))
+        .order_by('id')
+        .values('user_id')[:1]
+    )
+    JobApplication.objects.filter(owner__isnull=True).update(
+        owner_id=Subquery(first_user)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobapplication',
+            name='owner',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='owned_job_applications', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.RunPython(populate_owner, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['owner', 'apply_date', 'id'], name='jobapp_owner_apply_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['owner', 'valid_to', 'id'], name='jobapp_owner_valid_to_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['owner', 'status', 'id'], name='jobapp_owner_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['owner', 'job_name', 'id'], name='jobapp_owner_job_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['owner', 'company', 'id'], name='jobapp_owner_company_idx'),
+        ),
+    ]
@@ -0,0 +1,103 @@
+# Generated by Django 5.2.5 on 2026-10-18 15:04
+
+import django.contrib.postgres.search
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+POSTGRES_SQL = [
+    """
+    CREATE INDEX searchdoc_vector_gin_idx
+    ON jobs_searchdocument USING GIN (search_vector)
+    """,
+    """
+    CREATE TRIGGER jobs_searchdocument_vector_update
+    BEFORE INSERT OR UPDATE OF title, body ON jobs_searchdocument
+    FOR EACH ROW EXECUTE FUNCTION
+    tsvector_update_trigger(search_vector, 'pg_catalog.english', title, body)
+    """,
+]
+POSTGRES_REVERSE_SQL = [
+    "DROP TRIGGER IF EXISTS jobs_searchdocument_vector_update ON jobs_searchdocument",
+    "DROP INDEX IF EXISTS searchdoc_vector_gin_idx",
+]
+
+SQLITE_SQL = [
+    """
+    CREATE VIRTUAL TABLE jobs_searchdocument_fts USING fts5(
+        title, body,
+        content='jobs_searchdocument', content_rowid='id',
+        tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER jobs_searchdocument_fts_insert
+    AFTER INSERT ON jobs_searchdocument BEGIN
+        INSERT INTO jobs_searchdocument_fts(rowid, title, body)
+        VALUES (new.id, new.title, new.body);
+    END
+    """,
+    """
+    CREATE TRIGGER jobs_searchdocument_fts_delete
+    AFTER DELETE ON jobs_searchdocument BEGIN
+        INSERT INTO jobs_searchdocument_fts(jobs_searchdocument_fts, rowid, title, body)
+        VALUES ('delete', old.id, old.title, old.body);
+    END
+    """,
+    """
+    CREATE TRIGGER jobs_searchdocument_fts_update
+    AFTER UPDATE ON jobs_searchdocument BEGIN
+        INSERT INTO jobs_searchdocument_fts(jobs_searchdocument_fts, rowid, title, body)
+        VALUES ('delete', old.id, old.title, old.body);
+        INSERT INTO jobs_searchdocument_fts(rowid, title, body)
+        VALUES (new.id, new.title, new.body);
+    END
+    """,
+]
+SQLITE_REVERSE_SQL = [
+    "DROP TRIGGER IF EXISTS jobs_searchdocument_fts_insert",
+    "DROP TRIGGER IF EXISTS jobs_searchdocument_fts_delete",
+    "DROP TRIGGER IF EXISTS jobs_searchdocument_fts_update",
+    "DROP TABLE IF EXISTS jobs_searchdocument_fts",
+]
+
+
+def run_vendor_sql(postgres_sql, sqlite_sql):
+    def run(apps, schema_editor):
+        vendor = schema_editor.connection.vendor
+        statements = {'postgresql': postgres_sql, 'sqlite': sqlite_sql}.get(vendor, [])
+        for statement in statements:
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0003_applicationstat'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('application', 'Job application'), ('resume', 'Resume')], max_length=16)),
+                ('object_id', models.BigIntegerField()),
+                ('title', models.CharField(max_length=256)),
+                ('body', models.TextField(blank=True, default='')),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(editable=False, null=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_documents', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', 'kind'], name='searchdoc_user_kind_idx')],
+                'constraints': [models.UniqueConstraint(fields=('kind', 'object_id'), name='unique_search_document')],
+            },
+        ),
+        migrations.RunPython(
+            run_vendor_sql(POSTGRES_SQL, SQLITE_SQL),
+            run_vendor_sql(POSTGRES_REVERSE_SQL, SQLITE_REVERSE_SQL),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.5 on 2026-10-18 15:35
+
+import apps.jobs.models
+import apps.jobs.utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0005_resumeupload'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumeBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(max_length=64, unique=True)),
+                ('name', models.CharField(max_length=255, unique=True)),
+                ('size', models.BigIntegerField()),
+                ('ref_count', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.AlterField(
+            model_name='resume',
+            name='file',
+            field=models.FileField(blank=True, null=True, storage=apps.jobs.models.select_resume_storage, upload_to=apps.jobs.utils.resume_file_path),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-18 15:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0006_resumeblob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resume',
+            name='thumbnail',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.5 on 2026-10-18 18:40
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def populate_owner(apps, schema_editor):
+    """
+    Give the applications saved without an owner since 0002 the first
+    user of their M2M. Applications without any user were visible to no
+    one and are deleted.
+    """
+    JobApplication = apps.get_model('jobs', 'JobApplication')
+    Through = JobApplication.user.through
+    first_user = (
+        Through.objects
+        .filter(jobapplication_id=OuterRef('pk'))
+        .order_by('id')
+        .values('user_id')[:1]
+    )
+    JobApplication.objects.filter(owner__isnull=True).update(
+        owner_id=Subquery(first_user)
+    )
+    JobApplication.objects.filter(owner__isnull=True).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0008_jobapplication_fingerprint'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_owner, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='jobapplication',
+            name='owner',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='owned_job_applications', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
@@ -0,0 +1,90 @@
+# Generated by Django 5.2.5 on 2026-10-18 19:05
+
+import hashlib
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from django.db import migrations
+
+
+# a copy of apps.jobs.utils.application_fingerprint as of this migration,
+# so later changes to the live function do not change what it writes
+
+TRACKING_PARAM_RE = re.compile(
+    r"^(utm_\w+|gclid|fbclid|msclkid|mc_\w+|ref|refid|trk\w*|trackingid)$",
+    re.IGNORECASE,
+)
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def canonical_link(url):
+    if not url:
+        return ''
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or '').removeprefix('www.')
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port and port != DEFAULT_PORTS.get(parts.scheme.lower()):
+        host = f"{host}:{port}"
+    query = urlencode(sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not TRACKING_PARAM_RE.match(key)
+    ))
+    link = host + parts.path.rstrip('/')
+    return f"{link}?{query}" if query else link
+
+
+def normalize_text(text):
+    return ' '.join((text or '').casefold().split())
+
+
+def application_fingerprint(link, company, job_name):
+    key = '\n'.join(
+        [canonical_link(link), normalize_text(company), normalize_text(job_name)]
+    )
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+
+def backfill_fingerprints(apps, schema_editor):
+    """
+    Fingerprint the applications 0008 added the column to with '', so
+    duplicates of them are found without running find_duplicate_applications
+    first. Same walk as apps.jobs.duplicates.backfill_fingerprints, on the
+    historical model.
+    """
+    JobApplication = apps.get_model('jobs', 'JobApplication')
+    last_pk = 0
+    while True:
+        batch = list(
+            JobApplication.objects
+            .filter(pk__gt=last_pk)
+            .order_by('pk')
+            .only('link', 'company', 'job_name', 'fingerprint')
+            [:1000]
+        )
+        if not batch:
+            break
+        last_pk = batch[-1].pk
+        changed = []
+        for job_app in batch:
+            fingerprint = application_fingerprint(
+                job_app.link, job_app.company, job_app.job_name
+            )
+            if job_app.fingerprint != fingerprint:
+                job_app.fingerprint = fingerprint
+                changed.append(job_app)
+        JobApplication.objects.bulk_update(changed, ['fingerprint'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0010_dataversion'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_fingerprints, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-18 19:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0011_backfill_fingerprints'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resumeupload',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.5 on 2026-10-18 19:40
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F, Q
+
+
+def fill_file_names(apps, schema_editor):
+    """
+    Resumes uploaded with the application form were saved with the upload
+    name in `description` only, which is where the file name is taken from
+    """
+    Resume = apps.get_model('jobs', 'Resume')
+    (
+        Resume.objects
+        .filter(Q(file_name='') | Q(file_name__isnull=True))
+        .exclude(Q(file='') | Q(file__isnull=True))
+        .update(file_name=F('description'))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0012_resumeupload_updated_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_file_names, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='resume',
+            index=models.Index(models.F('user'), django.db.models.functions.text.Lower('file_name'), name='resume_user_file_name_idx'),
+        ),
+    ]
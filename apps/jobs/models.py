@@ -1,7 +1,28 @@
-from django.db import models
+from datetime import timedelta
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models, transaction
+from django.db.models.functions import Greatest, Lower
 from django.contrib.auth.models import User
+from django.urls import reverse
 from django.utils import timezone
-from apps.jobs.utils import resume_file_path
+from apps.jobs.functions import DaysBetween
+from apps.jobs.utils import application_fingerprint, resume_file_path
+
+
+class JobApplicationQuerySet(models.QuerySet):
+    def with_valid_days(self):
+        """Annotate `remaining_days`, days until valid_to clamped to 0, in SQL"""
+        today = models.Value(timezone.now().date(), output_field=models.DateField())
+        return self.annotate(
+            remaining_days=Greatest(
+                DaysBetween(models.F('valid_to'), today), models.Value(0)
+            )
+        )
+
+    def expiring_within(self, days: int):
+        """Applications still valid that expire within `days` days from today"""
+        today = timezone.now().date()
+        return self.filter(valid_to__range=(today, today + timedelta(days=days)))
 
 
 class JobApplication(models.Model):
@@ -12,7 +33,21 @@ class JobApplication(models.Model):
         ('rejected', 'Rejected'),
     ]
 
+    # columns the application list may be sorted by, each one backed by an
+    # (owner, column, id) index so sorting never falls back to a filesort
+    SORTABLE_FIELDS = ('apply_date', 'valid_to', 'status', 'job_name', 'company')
+    # columns the duplicate detection fingerprint is built from
+    FINGERPRINT_FIELDS = {'link', 'company', 'job_name'}
+
+    # `owner` decides who sees an application: lists, search, stats and the
+    # API all filter on it. The older `user` M2M mirrors it and is kept in
+    # step by signals; adding someone else to it grants no access.
     user = models.ManyToManyField(User, related_name='job_applications')
+    owner = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='owned_job_applications',
+    )
     job_name = models.CharField(max_length=64, null=False)
     company = models.CharField(max_length=64, null=False)
     country = models.CharField(max_length=32, null=True)
@@ -22,31 +57,142 @@ class JobApplication(models.Model):
     portal = models.CharField(max_length=32, null=True)
     link = models.URLField(max_length=128, null=True)
     status = models.CharField(max_length=32, choices=STATUS_CHOICES, default='applied')
+    # application_fingerprint() of link, company and job_name, set on save
+    fingerprint = models.CharField(max_length=32, default='', editable=False)
+
+    objects = JobApplicationQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['owner', 'apply_date', 'id'], name='jobapp_owner_apply_date_idx'
+            ),
+            models.Index(
+                fields=['owner', 'valid_to', 'id'], name='jobapp_owner_valid_to_idx'
+            ),
+            models.Index(
+                fields=['owner', 'status', 'id'], name='jobapp_owner_status_idx'
+            ),
+            models.Index(
+                fields=['owner', 'job_name', 'id'], name='jobapp_owner_job_name_idx'
+            ),
+            models.Index(
+                fields=['owner', 'company', 'id'], name='jobapp_owner_company_idx'
+            ),
+            models.Index(
+                fields=['owner', 'fingerprint'], name='jobapp_owner_fingerprint_idx'
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.fingerprint = application_fingerprint(
+            self.link, self.company, self.job_name
+        )
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and self.FINGERPRINT_FIELDS & set(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'fingerprint'}
+        super().save(*args, **kwargs)
 
     @property
     def valid_days(self):
-        """Return number of days from today until valid_to date"""
+        """
+        Return number of days from today until valid_to date.
+        Lists should use JobApplication.objects.with_valid_days() instead.
+        """
         today = timezone.now().date()
         delta = self.valid_to - today
         return delta.days if delta.days >= 0 else 0  # don't return negative
 
 
+def select_resume_storage():
+    from apps.jobs.storage import resume_storage  # imports ResumeBlob lazily
+    return resume_storage
+
+
 class Resume(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='resumes')
     description = models.CharField(max_length=128)
     job_title = models.CharField(max_length=64, null=True)
     file_name = models.CharField(max_length=128, null=True, default='')
-    file = models.FileField(upload_to=resume_file_path, blank=True, null=True)
+    file = models.FileField(
+        upload_to=resume_file_path,
+        storage=select_resume_storage,
+        blank=True,
+        null=True,
+    )
     summary = models.TextField(null=True)
     category = models.CharField(
         max_length=64,
         default='',
         # choices=[],
     )
+    # storage name of the first page preview, see apps.jobs.thumbnails
+    thumbnail = models.CharField(max_length=255, blank=True, default='')
+
+    class Meta:
+        indexes = [
+            # the case-insensitive file name prefix search of the resume picker
+            models.Index(
+                models.F('user'), Lower('file_name'), name='resume_user_file_name_idx'
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        # the storage counts a blob reference while the file is saved; it
+        # has to roll back with the row if the insert or update fails
+        with transaction.atomic():
+            super().save(*args, **kwargs)
 
     def __str__(self):
         return self.file_name
 
+    @property
+    def thumbnail_url(self):
+        """Content-hash URL of the preview, or the URL that renders it first"""
+        if self.thumbnail:
+            digest = self.thumbnail.rsplit('.', 2)[-2]
+            return reverse('jobs:resume_thumbnail', args=[self.pk, digest])
+        return reverse('jobs:resume_thumbnail_render', args=[self.pk])
+
+
+class ResumeBlob(models.Model):
+    """
+    One file of the content-addressed resume storage, shared by every Resume
+    whose file has the same SHA-256. See apps.jobs.storage.
+    """
+    sha256 = models.CharField(max_length=64, unique=True)
+    name = models.CharField(max_length=255, unique=True)
+    size = models.BigIntegerField()
+    ref_count = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.name} ({self.ref_count} references)"
+
+
+class ResumeUpload(models.Model):
+    """
+    A resume arriving in chunks, see apps.jobs.uploads. The bytes are
+    appended to `path` in the media storage, where the finished Resume will
+    point; `received` is the offset the next chunk has to start at.
+    Uploads nobody finishes are removed by `manage.py clean_resume_uploads`.
+    """
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='resume_uploads'
+    )
+    file_name = models.CharField(max_length=128)
+    job_title = models.CharField(max_length=64, blank=True, default='')
+    path = models.CharField(max_length=255)
+    size = models.BigIntegerField()
+    received = models.BigIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    # time of the last chunk, see apps.jobs.uploads.remove_stale_uploads
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.file_name} ({self.received}/{self.size})"
+
 
 class JobApplicationDetails(models.Model):
     job_application = models.OneToOneField(
@@ -58,3 +204,93 @@ class JobApplicationDetails(models.Model):
     job_application_body = models.TextField(null=True)
     comments = models.TextField(null=True)
     salary_range = models.CharField(max_length=32, null=True)
+
+
+class ApplicationStat(models.Model):
+    """
+    Per-user count of job applications for one value of one dimension,
+    e.g. (user, 'status', 'rejected') -> 12. Maintained incrementally by
+    apps.jobs.stats, rebuilt with `manage.py rebuild_application_stats`.
+    """
+    DIMENSION_CHOICES = [
+        ('status', 'Status'),
+        ('company', 'Company'),
+        ('portal', 'Portal'),
+    ]
+
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='application_stats'
+    )
+    dimension = models.CharField(max_length=16, choices=DIMENSION_CHOICES)
+    value = models.CharField(max_length=64, blank=True, default='')
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'dimension', 'value'],
+                name='unique_application_stat',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username} {self.dimension}={self.value}: {self.count}"
+
+
+class DataVersion(models.Model):
+    """
+    Time of the last change to the job application data of a user, written
+    next to the cached data version by apps.jobs.caching.bump_data_version.
+    Every worker reads the same row, so API validators are derived from it.
+    """
+    # no foreign key constraint: signals bump the owner of each application
+    # a cascading user delete removes, after the user's rows were collected
+    user = models.OneToOneField(
+        User,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        primary_key=True,
+        related_name='+',
+    )
+    modified = models.DateTimeField()
+
+
+class SearchDocument(models.Model):
+    """
+    Denormalized full-text search entry for one JobApplication or Resume.
+
+    The text index itself lives in the database: on PostgreSQL a trigger
+    fills `search_vector` (GIN indexed), on SQLite triggers mirror the rows
+    into the jobs_searchdocument_fts FTS5 table. See apps.jobs.search.
+    """
+    KIND_CHOICES = [
+        ('application', 'Job application'),
+        ('resume', 'Resume'),
+    ]
+
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='search_documents'
+    )
+    kind = models.CharField(max_length=16, choices=KIND_CHOICES)
+    object_id = models.BigIntegerField()
+    title = models.CharField(max_length=256)
+    body = models.TextField(blank=True, default='')
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['kind', 'object_id'],
+                name='unique_search_document',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['user', 'kind'], name='searchdoc_user_kind_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.object_id}: {self.title}"
@@ -0,0 +1,128 @@
+import json
+from django.core.paginator import InvalidPage
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.utils.encoding import force_bytes, force_str
+from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
+
+
+NEXT = "n"
+PREVIOUS = "p"
+
+
+class KeysetPage:
+    """
+    One page of a keyset paginated queryset.
+
+    Unlike django.core.paginator.Page it knows nothing about page numbers or
+    the total count, only the opaque cursors pointing to its neighbours.
+    """
+
+    def __init__(self, object_list, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __repr__(self):
+        return f"<KeysetPage of {len(self.object_list)} objects>"
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class KeysetPaginator:
+    """
+    Paginate a queryset on a stable (sort_field, pk) key instead of OFFSET.
+
+    Every page is a single indexed range query of `per_page + 1` rows, no
+    matter how deep the user navigates, and no COUNT(*) is issued.
+
+    Args:
+        queryset (QuerySet): queryset to paginate, its ordering is replaced
+        sort_field (str): name of a non-nullable concrete field to sort by
+        descending (bool): sort direction of both key columns
+        per_page (int): number of objects on a page
+    """
+
+    def __init__(self, queryset, sort_field, descending=True, per_page=20):
+        field = queryset.model._meta.get_field(sort_field)
+        if field.null:
+            raise ValueError(
+                f"Cannot paginate on nullable field '{sort_field}'."
+            )
+        self.queryset = queryset
+        self.field = field
+        self.sort_field = sort_field
+        self.descending = descending
+        self.per_page = per_page
+
+    def encode_cursor(self, obj, direction: str) -> str:
+        """Return opaque token pointing just past `obj` in `direction`"""
+        payload = [direction, getattr(obj, self.field.attname), obj.pk]
+        data = json.dumps(payload, cls=DjangoJSONEncoder)
+        return urlsafe_base64_encode(force_bytes(data))
+
+    def decode_cursor(self, cursor: str) -> tuple:
+        """Return (direction, value, pk) stored in `cursor` token"""
+        try:
+            direction, value, pk = json.loads(force_str(urlsafe_base64_decode(cursor)))
+            if direction not in (NEXT, PREVIOUS):
+                raise ValueError(direction)
+            return direction, self.field.to_python(value), int(pk)
+        except Exception:
+            raise InvalidPage("That cursor is not valid")
+
+    def _ordering(self, reverse: bool = False) -> list:
+        descending = self.descending != reverse
+        prefix = "-" if descending else ""
+        return [f"{prefix}{self.sort_field}", f"{prefix}pk"]
+
+    def _seek(self, value, pk, reverse: bool = False) -> Q:
+        lookup = "lt" if self.descending != reverse else "gt"
+        # the redundant inclusive bound lets the planner range scan the index
+        return Q(**{f"{self.sort_field}__{lookup}e": value}) & (
+            Q(**{f"{self.sort_field}__{lookup}": value})
+            | Q(**{f"pk__{lookup}": pk})
+        )
+
+    def page(self, cursor: str | None = None) -> KeysetPage:
+        """Return the page `cursor` points to, or the first page if None"""
+        queryset = self.queryset
+        direction = NEXT
+        if cursor:
+            direction, value, pk = self.decode_cursor(cursor)
+            queryset = queryset.filter(
+                self._seek(value, pk, reverse=direction == PREVIOUS)
+            )
+
+        rows = list(
+            queryset.order_by(*self._ordering(reverse=direction == PREVIOUS))
+            [:self.per_page + 1]
+        )
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+
+        if direction == PREVIOUS:
+            rows.reverse()
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, bool(cursor)
+
+        next_cursor = previous_cursor = None
+        if rows and has_next:
+            next_cursor = self.encode_cursor(rows[-1], NEXT)
+        if rows and has_previous:
+            previous_cursor = self.encode_cursor(rows[0], PREVIOUS)
+        return KeysetPage(rows, next_cursor, previous_cursor)
@@ -0,0 +1,78 @@
+"""
+PDF helpers that run in worker processes.
+
+Nothing here touches Django models or settings, so the functions can be
+sent to a spawned process pool without setting up Django in the workers.
+"""
+import hashlib
+import logging
+import os
+import pypdfium2
+from pypdf import PdfReader
+
+
+logger = logging.getLogger(__name__)
+
+
+def html_to_pdf(html: str) -> bytes:
+    """Render an HTML document to the bytes of a PDF with WeasyPrint"""
+    from weasyprint import HTML  # needs Pango, loaded only where PDFs are made
+    return HTML(string=html).write_pdf()
+
+
+def extract_pdf_text(path: str) -> tuple:
+    """
+    Return (text, number of pages) of the PDF at `path`.
+
+    Unreadable files give ('', 0) instead of raising, so one broken upload
+    cannot stop a batch. pypdf fails on malformed files with all kinds of
+    errors, not only PdfReadError, so any error counts as unreadable.
+    """
+    try:
+        reader = PdfReader(path)
+        pages = [page.extract_text() or '' for page in reader.pages]
+    except Exception as e:
+        logger.warning("Cannot extract text from %s: %r", path, e)
+        return '', 0
+    return '\n'.join(text.strip() for text in pages if text.strip()), len(pages)
+
+
+def file_sha256(path: str) -> str:
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as file:
+        while data := file.read(64 * 1024):
+            sha256.update(data)
+    return sha256.hexdigest()
+
+
+def thumbnail_path(path: str, sha256: str) -> str:
+    """cv.pdf -> cv.<first 16 hex digits of the PDF's SHA-256>.png, same directory"""
+    return f"{os.path.splitext(path)[0]}.{sha256[:16]}.png"
+
+
+def render_thumbnail(path: str, width: int, sha256: str = None) -> tuple:
+    """
+    Render the first page of the PDF at `path` as a PNG `width` pixels wide
+    next to it, unless the preview of these exact bytes already exists.
+
+    Returns:
+        tuple: (SHA-256 of the PDF, PNG path or None if it cannot be rendered)
+    """
+    sha256 = sha256 or file_sha256(path)
+    target = thumbnail_path(path, sha256)
+    if os.path.exists(target):
+        return sha256, target
+    try:
+        document = pypdfium2.PdfDocument(path)
+        try:
+            page = document[0]
+            image = page.render(scale=width / page.get_width()).to_pil()
+        finally:
+            document.close()
+    except (pypdfium2.PdfiumError, IndexError, OSError) as e:
+        logger.warning("Cannot render a thumbnail of %s: %s", path, e)
+        return sha256, None
+    partial = f"{target}.{os.getpid()}.tmp"
+    image.save(partial, format='PNG', optimize=True)
+    os.replace(partial, target)  # readers never see a half written file
+    return sha256, target
@@ -0,0 +1,236 @@
+import re
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import connection, transaction
+from django.db.models import F
+
+from apps.jobs.models import JobApplication, Resume, SearchDocument
+
+
+TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+
+class SearchPage:
+    """One page of ranked search results, without a total count"""
+
+    def __init__(self, results, number, has_next):
+        self.object_list = results
+        self.number = number
+        self._has_next = has_next
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self.number > 1
+
+    def next_page_number(self):
+        return self.number + 1
+
+    def previous_page_number(self):
+        return self.number - 1
+
+
+def _join(*parts) -> str:
+    return "\n".join(part for part in parts if part)
+
+
+def _details_of(job_app: JobApplication):
+    try:
+        return job_app.details
+    except ObjectDoesNotExist:
+        return None
+
+
+def application_document(job_app: JobApplication, details=None) -> dict:
+    """
+    Return the searchable fields of a job application and its `details`,
+    passed in so that building many documents needs no query per row
+    """
+    return {
+        'title': f"{job_app.job_name} at {job_app.company}"[:256],
+        'body': _join(
+            job_app.job_name,
+            job_app.company,
+            job_app.city,
+            details and details.job_application_body,
+            details and details.comments,
+        ),
+    }
+
+
+def resume_document(resume: Resume) -> dict:
+    """Return the searchable fields of a resume"""
+    return {
+        'title': (resume.job_title or resume.description)[:256],
+        'body': _join(resume.description, resume.job_title, resume.summary),
+    }
+
+
+def index_application(job_app: JobApplication) -> None:
+    """Create or refresh the search document of `job_app`"""
+    SearchDocument.objects.update_or_create(
+        kind='application',
+        object_id=job_app.pk,
+        defaults={
+            'user_id': job_app.owner_id,
+            **application_document(job_app, _details_of(job_app)),
+        },
+    )
+
+
+def index_new_applications(batch: list) -> None:
+    """
+    Index freshly bulk-created applications, which send no post_save.
+    `batch` holds (job application, details or None) pairs.
+    """
+    SearchDocument.objects.bulk_create(
+        SearchDocument(
+            user_id=job_app.owner_id,
+            kind='application',
+            object_id=job_app.pk,
+            **application_document(job_app, details),
+        )
+        for job_app, details in batch
+    )
+
+
+def index_resume(resume: Resume) -> None:
+    """Create or refresh the search document of `resume`"""
+    SearchDocument.objects.update_or_create(
+        kind='resume',
+        object_id=resume.pk,
+        defaults={'user_id': resume.user_id, **resume_document(resume)},
+    )
+
+
+def index_resumes(resumes: list) -> None:
+    """Refresh the documents of many resumes at once, e.g. after bulk_update"""
+    SearchDocument.objects.filter(
+        kind='resume', object_id__in=[resume.pk for resume in resumes]
+    ).delete()
+    SearchDocument.objects.bulk_create(
+        SearchDocument(
+            user_id=resume.user_id,
+            kind='resume',
+            object_id=resume.pk,
+            **resume_document(resume),
+        )
+        for resume in resumes
+    )
+
+
+def remove_document(kind: str, object_id: int) -> None:
+    SearchDocument.objects.filter(kind=kind, object_id=object_id).delete()
+
+
+def _iter_documents(batch_size: int):
+    applications = (
+        JobApplication.objects
+        .select_related('details')
+        .order_by('pk')
+    )
+    for job_app in applications.iterator(chunk_size=batch_size):
+        yield SearchDocument(
+            user_id=job_app.owner_id,
+            kind='application',
+            object_id=job_app.pk,
+            **application_document(job_app, _details_of(job_app)),
+        )
+    for resume in Resume.objects.order_by('pk').iterator(chunk_size=batch_size):
+        yield SearchDocument(
+            user_id=resume.user_id,
+            kind='resume',
+            object_id=resume.pk,
+            **resume_document(resume),
+        )
+
+
+def rebuild_search_index(batch_size: int = 1000) -> int:
+    """Drop every search document and index all applications and resumes again"""
+    total = 0
+    batch = []
+    with transaction.atomic():
+        SearchDocument.objects.all().delete()
+        for document in _iter_documents(batch_size):
+            batch.append(document)
+            if len(batch) >= batch_size:
+                SearchDocument.objects.bulk_create(batch)
+                total += len(batch)
+                batch = []
+        SearchDocument.objects.bulk_create(batch)
+    return total + len(batch)
+
+
+def parse_terms(query: str) -> list:
+    """Split free text into plain word terms, dropping any query syntax"""
+    return TERM_RE.findall(query or '')
+
+
+def _postgres_search(user, query, kind, offset, limit):
+    search_query = SearchQuery(query, search_type='websearch', config='english')
+    documents = (
+        SearchDocument.objects
+        .filter(user=user, search_vector=search_query)
+        .annotate(rank=SearchRank(F('search_vector'), search_query))
+        .order_by('-rank', '-id')
+    )
+    if kind:
+        documents = documents.filter(kind=kind)
+    return list(documents[offset:offset + limit])
+
+
+def _sqlite_search(user, query, kind, offset, limit):
+    # every term quoted so FTS5 never sees user input as query syntax
+    match = " ".join(f'"{term}"' for term in parse_terms(query))
+    sql = """
+        SELECT doc.id, bm25(jobs_searchdocument_fts, 2.0, 1.0) AS score
+        FROM jobs_searchdocument_fts
+        JOIN jobs_searchdocument doc ON doc.id = jobs_searchdocument_fts.rowid
+        WHERE jobs_searchdocument_fts MATCH %s AND doc.user_id = %s
+    """
+    params = [match, user.pk]
+    if kind:
+        sql += " AND doc.kind = %s"
+        params.append(kind)
+    sql += " ORDER BY score, doc.id DESC LIMIT %s OFFSET %s"
+    params += [limit, offset]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        scores = cursor.fetchall()
+
+    documents = SearchDocument.objects.in_bulk([pk for pk, _ in scores])
+    results = []
+    for pk, score in scores:
+        document = documents[pk]
+        document.rank = -score  # bm25 is lower for better matches
+        results.append(document)
+    return results
+
+
+def search(user, query: str, kind: str = None, page: int = 1, per_page: int = 20):
+    """
+    Full-text search over the documents of `user`, best matches first.
+
+    Args:
+        user (User): owner of the searched applications and resumes
+        query (str): free text typed by the user
+        kind (str): restrict to 'application' or 'resume' documents
+        page (int): 1-based page number
+        per_page (int): number of results on a page
+    Returns:
+        SearchPage: ranked SearchDocument objects with a `rank` attribute
+    """
+    if not parse_terms(query):
+        return SearchPage([], page, False)
+    backend = (
+        _postgres_search if connection.vendor == 'postgresql' else _sqlite_search
+    )
+    results = backend(user, query, kind, (page - 1) * per_page, per_page + 1)
+    return SearchPage(results[:per_page], page, len(results) > per_page)
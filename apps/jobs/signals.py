@@ -0,0 +1,197 @@
+from collections import Counter, defaultdict
+from django.conf import settings
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.db import transaction
+from django.dispatch import receiver
+
+from apps.jobs.caching import bump_data_version
+from apps.jobs.categories import predict_category
+from apps.jobs.extraction import awaits_text, schedule_extraction
+from apps.jobs.models import JobApplication, JobApplicationDetails, Resume
+from apps.jobs.search import index_application, index_resume, remove_document
+from apps.jobs.storage import release_blob, release_thumbnail
+from apps.jobs.stats import DIMENSIONS, apply_stats_delta, stat_keys
+from apps.jobs.thumbnails import schedule_thumbnail
+
+
+@receiver(pre_save, sender=JobApplication)
+def remember_counted_values(sender, instance, raw=False, **kwargs):
+    """Keep the stored owner and dimension values to diff against after save"""
+    instance._stats_before = None
+    if raw or instance.pk is None:
+        return
+    instance._stats_before = (
+        JobApplication.objects
+        .filter(pk=instance.pk)
+        .values('owner_id', *DIMENSIONS)
+        .first()
+    )
+
+
+@receiver(post_save, sender=JobApplication)
+def update_stats_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    delta_by_user = defaultdict(Counter)
+    before = getattr(instance, '_stats_before', None)
+    if before:
+        delta_by_user[before['owner_id']].subtract(stat_keys(JobApplication(**before)))
+    delta_by_user[instance.owner_id].update(stat_keys(instance))
+    for user_id, delta in delta_by_user.items():
+        apply_stats_delta(user_id, delta)
+
+
+@receiver(post_delete, sender=JobApplication)
+def update_stats_on_delete(sender, instance, **kwargs):
+    delta = Counter()
+    delta.subtract(stat_keys(instance))
+    apply_stats_delta(instance.owner_id, delta)
+
+
+@receiver(post_save, sender=JobApplication)
+def mirror_owner_in_users(sender, instance, created, raw=False, **kwargs):
+    """Keep the owner, and only a former owner out, of the `user` M2M"""
+    if raw:
+        return
+    before = getattr(instance, '_stats_before', None)
+    moved = before is not None and before['owner_id'] != instance.owner_id
+    if moved:
+        instance.user.remove(before['owner_id'])
+    if created or moved:
+        instance.user.add(instance.owner_id)
+
+
+@receiver(m2m_changed, sender=JobApplication.user.through)
+def keep_owner_in_users(sender, instance, action, reverse, pk_set, **kwargs):
+    """Put the owner back when an M2M edit, e.g. in the admin, drops them"""
+    if action not in ('post_remove', 'post_clear'):
+        return
+    if not reverse:
+        if action == 'post_clear' or instance.owner_id in pk_set:
+            instance.user.add(instance.owner_id)
+        return
+    owned = instance.owned_job_applications.all()
+    if action == 'post_remove':
+        owned = owned.filter(pk__in=pk_set)
+    instance.job_applications.add(*owned)
+
+
+@receiver(post_save, sender=JobApplication)
+def index_application_on_save(sender, instance, raw=False, **kwargs):
+    if not raw:
+        index_application(instance)
+
+
+@receiver(post_save, sender=JobApplicationDetails)
+def index_application_on_details_save(sender, instance, raw=False, **kwargs):
+    if not raw:
+        index_application(instance.job_application)
+
+
+@receiver(post_save, sender=Resume)
+def index_resume_on_save(sender, instance, raw=False, **kwargs):
+    if not raw:
+        index_resume(instance)
+
+
+@receiver(post_delete, sender=JobApplication)
+def remove_application_document(sender, instance, **kwargs):
+    remove_document('application', instance.pk)
+
+
+@receiver(post_delete, sender=Resume)
+def remove_resume_document(sender, instance, **kwargs):
+    remove_document('resume', instance.pk)
+
+
+@receiver(post_save, sender=JobApplication)
+@receiver(post_delete, sender=JobApplication)
+def bump_version_on_application_change(sender, instance, **kwargs):
+    before = getattr(instance, '_stats_before', None) or {}
+    bump_data_version(instance.owner_id, before.get('owner_id'))
+
+
+@receiver(post_save, sender=JobApplicationDetails)
+@receiver(post_delete, sender=JobApplicationDetails)
+def bump_version_on_details_change(sender, instance, **kwargs):
+    owner_id = (
+        JobApplication.objects
+        .filter(pk=instance.job_application_id)
+        .values_list('owner_id', flat=True)
+        .first()
+    )
+    bump_data_version(owner_id)
+
+
+@receiver(m2m_changed, sender=JobApplicationDetails.resume.through)
+def bump_version_on_details_resumes_change(sender, instance, action, **kwargs):
+    if action.startswith('post_') and isinstance(instance, JobApplicationDetails):
+        bump_version_on_details_change(sender, instance)
+    elif action.startswith('post_'):
+        bump_data_version(instance.user_id)
+
+
+@receiver(post_save, sender=Resume)
+@receiver(post_delete, sender=Resume)
+def bump_version_on_resume_change(sender, instance, **kwargs):
+    bump_data_version(instance.user_id)
+    bump_data_version(instance.user_id, scope='resumes')
+
+
+@receiver(pre_save, sender=Resume)
+def remember_resume_file(sender, instance, raw=False, **kwargs):
+    instance._file_before = instance._thumbnail_before = None
+    if not raw and instance.pk is not None:
+        instance._file_before, instance._thumbnail_before = (
+            Resume.objects.filter(pk=instance.pk)
+            .values_list('file', 'thumbnail').first() or (None, None)
+        )
+        if instance._file_before != instance.file.name:
+            instance.thumbnail = ''  # the preview of the old file is stale
+
+
+@receiver(pre_save, sender=Resume)
+def categorize_resume(sender, instance, raw=False, update_fields=None, **kwargs):
+    """
+    Uploads come without a category, let the trained model pick one. A file
+    still waiting for its text is scored once store_text or backfill_text
+    has filled the summary.
+    """
+    if raw or instance.category:
+        return
+    if awaits_text(instance):
+        return
+    if update_fields is None or 'category' in update_fields:
+        instance.category = predict_category(instance)
+
+
+@receiver(post_save, sender=Resume)
+def release_replaced_resume_file(sender, instance, raw=False, **kwargs):
+    before = getattr(instance, '_file_before', None)
+    if before and before != instance.file.name:
+        release_blob(before)
+        release_thumbnail(before, instance._thumbnail_before)
+
+
+@receiver(post_save, sender=Resume)
+def extract_text_of_new_file(sender, instance, raw=False, **kwargs):
+    changed = getattr(instance, '_file_before', None) != instance.file.name
+    if raw or not instance.file or not changed or instance.summary:
+        return
+    # after commit, so the pool never sees a file of a rolled back upload
+    transaction.on_commit(lambda: schedule_extraction(instance))
+
+
+@receiver(post_save, sender=Resume)
+def render_thumbnail_of_new_file(sender, instance, raw=False, **kwargs):
+    changed = getattr(instance, '_file_before', None) != instance.file.name
+    if raw or not instance.file or not changed:
+        return
+    if settings.RESUME_THUMBNAIL_MODE != 'off':
+        transaction.on_commit(lambda: schedule_thumbnail(instance))
+
+
+@receiver(post_delete, sender=Resume)
+def release_deleted_resume_file(sender, instance, **kwargs):
+    release_blob(instance.file.name)
+    release_thumbnail(instance.file.name, instance.thumbnail)
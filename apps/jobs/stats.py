@@ -0,0 +1,123 @@
+from collections import Counter
+from django.db import transaction
+from django.db.models import Case, Count, F, Value, When
+
+from apps.jobs.models import ApplicationStat, JobApplication
+
+
+DIMENSIONS = [dimension for dimension, _ in ApplicationStat.DIMENSION_CHOICES]
+
+
+def stat_keys(job_app: JobApplication) -> list:
+    """Return the (dimension, value) pairs `job_app` is counted under"""
+    return [
+        (dimension, getattr(job_app, dimension) or '')
+        for dimension in DIMENSIONS
+    ]
+
+
+# keys per UPDATE, keeps the CASE and IN lists short for every backend
+DELTA_CHUNK = 200
+
+
+def apply_stats_delta(user_id: int, delta: Counter) -> None:
+    """Add `delta`, a Counter of (dimension, value) -> change, to one user"""
+    apply_stats_deltas({user_id: delta})
+
+
+def apply_stats_deltas(deltas: dict) -> None:
+    """
+    Add {user_id: Counter of (dimension, value) -> change} to the stats in
+    a fixed number of queries: one INSERT of the missing rows that get
+    positive changes, then one UPDATE ... CASE per dimension (and per
+    DELTA_CHUNK keys). Negative
+    changes only update existing rows, so the stats of a user being
+    deleted are never recreated.
+    """
+    changes = {
+        (user_id, dimension, value): change
+        for user_id, delta in deltas.items()
+        for (dimension, value), change in delta.items()
+        if change
+    }
+    if not changes:
+        return
+    with transaction.atomic():
+        ApplicationStat.objects.bulk_create(
+            [
+                ApplicationStat(user_id=user_id, dimension=dimension, value=value)
+                for (user_id, dimension, value), change in changes.items()
+                if change > 0
+            ],
+            ignore_conflicts=True,
+        )
+        keys = sorted(changes)
+        for start in range(0, len(keys), DELTA_CHUNK):
+            chunk = keys[start:start + DELTA_CHUNK]
+            for dimension in sorted({dimension for _, dimension, _ in chunk}):
+                rows = [
+                    (user_id, value, changes[user_id, dimension, value])
+                    for user_id, row_dimension, value in chunk
+                    if row_dimension == dimension
+                ]
+                ApplicationStat.objects.filter(
+                    dimension=dimension,
+                    user_id__in={user_id for user_id, _, _ in rows},
+                    value__in={value for _, value, _ in rows},
+                ).update(count=F('count') + Case(
+                    *(
+                        When(user_id=user_id, value=value, then=Value(change))
+                        for user_id, value, change in rows
+                    ),
+                    default=Value(0),
+                ))
+
+
+def get_user_stats(user) -> dict:
+    """
+    Return {dimension: [(value, count), ...]} for `user`, largest counts
+    first, read with a single query on the (user, dimension, value) index.
+    """
+    stats = {dimension: [] for dimension in DIMENSIONS}
+    rows = (
+        ApplicationStat.objects
+        .filter(user=user, count__gt=0)
+        .order_by('dimension', '-count', 'value')
+        .values_list('dimension', 'value', 'count')
+    )
+    for dimension, value, count in rows:
+        stats[dimension].append((value, count))
+    return stats
+
+
+def rebuild_stats(user_ids=None, batch_size: int = 1000) -> int:
+    """
+    Recompute the stats from scratch with one GROUP BY per dimension.
+    Returns the number of stat rows written.
+    """
+    applications = JobApplication.objects.all()
+    existing = ApplicationStat.objects.all()
+    if user_ids is not None:
+        applications = applications.filter(owner_id__in=user_ids)
+        existing = existing.filter(user_id__in=user_ids)
+
+    # NULL and '' are both counted under ''
+    totals = Counter()
+    for dimension in DIMENSIONS:
+        rows = (
+            applications
+            .values_list('owner_id', dimension)
+            .annotate(total=Count('id'))
+            .order_by()
+        )
+        for user_id, value, total in rows:
+            totals[(user_id, dimension, value or '')] += total
+    stats = [
+        ApplicationStat(user_id=user_id, dimension=dimension, value=value, count=count)
+        for (user_id, dimension, value), count in totals.items()
+    ]
+
+    with transaction.atomic():
+        existing.delete()
+        ApplicationStat.objects.bulk_create(stats, batch_size=batch_size)
+    return len(stats)
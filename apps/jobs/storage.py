@@ -0,0 +1,209 @@
+import hashlib
+import os
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.db import transaction
+from django.db.models import F
+from django.utils.deconstruct import deconstructible
+
+from apps.jobs.pdf import thumbnail_path
+
+
+BLOB_DIR = 'resumes/blobs'
+READ_SIZE = 64 * 1024
+
+
+def content_addressed() -> bool:
+    return settings.RESUME_STORAGE_MODE == 'content'
+
+
+def file_sha256(file) -> str:
+    """Return the hex SHA-256 of a file object, read in chunks from the start"""
+    sha256 = hashlib.sha256()
+    if hasattr(file, 'seek'):
+        file.seek(0)
+    chunks = file.chunks() if hasattr(file, 'chunks') else iter(
+        lambda: file.read(READ_SIZE), b''
+    )
+    for chunk in chunks:
+        sha256.update(chunk)
+    if hasattr(file, 'seek'):
+        file.seek(0)
+    return sha256.hexdigest()
+
+
+def blob_name(sha256: str, original_name: str) -> str:
+    """resumes/blobs/<first two hex digits>/<sha256>.<ext of the original>"""
+    ext = os.path.splitext(original_name)[1].lower()
+    return f"{BLOB_DIR}/{sha256[:2]}/{sha256}{ext}"
+
+
+def is_blob(name: str) -> bool:
+    return bool(name) and name.startswith(f"{BLOB_DIR}/")
+
+
+@deconstructible
+class ResumeStorage(FileSystemStorage):
+    """
+    Storage of resume files.
+
+    With RESUME_STORAGE_MODE = 'named' (default) it is the plain file system
+    storage and files keep the names from resume_file_path. With 'content'
+    every file is stored once under the SHA-256 of its bytes and shared by
+    all resumes with identical content; a ResumeBlob row counts the
+    references. Saving bytes that are already stored only adds a reference.
+    """
+
+    def save(self, name, content, max_length=None):
+        if not content_addressed():
+            return super().save(name, content, max_length=max_length)
+        sha256 = file_sha256(content)
+        name = blob_name(sha256, name)
+        if not self.exists(name):
+            name = self._save(name, content)
+        acquire_blob(sha256, name, content.size)
+        return name
+
+    def adopt(self, name: str, sha256: str) -> str:
+        """
+        Take over a file already written to `name` whose hash is known, e.g.
+        a finished chunked upload, and return the name resumes should use.
+        """
+        if not content_addressed():
+            return name
+        target = blob_name(sha256, name)
+        size = self.size(name)
+        if self.exists(target):
+            self.delete(name)
+        else:
+            os.makedirs(os.path.dirname(self.path(target)), exist_ok=True)
+            os.replace(self.path(name), self.path(target))
+        acquire_blob(sha256, target, size)
+        return target
+
+
+resume_storage = ResumeStorage()
+
+
+def acquire_blob(sha256: str, name: str, size: int) -> None:
+    """Count one more resume referring to the blob `name`"""
+    from apps.jobs.models import ResumeBlob  # the Resume model imports this module
+    with transaction.atomic():
+        blob, _ = ResumeBlob.objects.get_or_create(
+            sha256=sha256, defaults={'name': name, 'size': size}
+        )
+        ResumeBlob.objects.filter(pk=blob.pk).update(ref_count=F('ref_count') + 1)
+
+
+def release_blob(name: str) -> None:
+    """
+    Drop one reference to a stored blob and delete the file with the last
+    one. Names outside the blob directory are left to their owner.
+    """
+    from apps.jobs.models import ResumeBlob
+
+    if not is_blob(name):
+        return
+    with transaction.atomic():
+        blob = ResumeBlob.objects.select_for_update().filter(name=name).first()
+        if blob is None:
+            return
+        if blob.ref_count > 1:
+            ResumeBlob.objects.filter(pk=blob.pk).update(
+                ref_count=F('ref_count') - 1
+            )
+            return
+        blob.delete()
+        thumbnail = thumbnail_path(name, blob.sha256)
+        transaction.on_commit(lambda: resume_storage.delete(name))
+        transaction.on_commit(lambda: resume_storage.delete(thumbnail))
+
+
+def release_thumbnail(file_name: str, thumbnail: str) -> None:
+    """
+    Delete the preview of `file_name` once no resume shows that file, after
+    commit. The preview of a blob is shared and goes with it, see
+    release_blob.
+    """
+    if thumbnail and not is_blob(file_name):
+        transaction.on_commit(lambda: resume_storage.delete(thumbnail))
+
+
+def recount_blobs() -> int:
+    """Rebuild every ResumeBlob reference count from the resumes table"""
+    from apps.jobs.models import Resume, ResumeBlob
+    from django.db.models import Count
+
+    counts = dict(
+        Resume.objects
+        .filter(file__startswith=f"{BLOB_DIR}/")
+        .values_list('file')
+        .annotate(references=Count('id'))
+    )
+    with transaction.atomic():
+        ResumeBlob.objects.exclude(name__in=counts).delete()
+        existing = set(ResumeBlob.objects.values_list('name', flat=True))
+        for name, references in counts.items():
+            if name in existing:
+                ResumeBlob.objects.filter(name=name).update(ref_count=references)
+            elif resume_storage.exists(name):
+                ResumeBlob.objects.create(
+                    sha256=os.path.splitext(os.path.basename(name))[0],
+                    name=name,
+                    size=resume_storage.size(name),
+                    ref_count=references,
+                )
+    return len(counts)
+
+
+def dedup_resume_files(dry_run: bool = False) -> dict:
+    """
+    Move the existing resume files into the content-addressed layout.
+
+    Each file is hashed; the first file with a given hash becomes the blob
+    (hard linked, so no bytes are copied), later ones are deleted and their
+    resumes repointed. A file is only unlinked after the rows referring to
+    it point at the blob, so an interrupted run can simply be repeated.
+    Only the files of Resume rows are scanned, files in the storage that no
+    resume refers to are not touched.
+
+    Returns:
+        dict: numbers of scanned, shared and missing files and freed bytes
+    """
+    from apps.jobs.models import Resume
+
+    result = {'scanned': 0, 'deduplicated': 0, 'missing': 0, 'freed_bytes': 0}
+    names = (
+        Resume.objects
+        .exclude(file='')
+        .exclude(file__isnull=True)
+        .exclude(file__startswith=f"{BLOB_DIR}/")
+        .order_by('file')  # ordering by another column would join the DISTINCT
+        .values_list('file', flat=True)
+        .distinct()
+    )
+    blobs = set()
+    # names are read up front, the loop repoints the rows it iterates over
+    for name in list(names):
+        result['scanned'] += 1
+        if not resume_storage.exists(name):
+            result['missing'] += 1
+            continue
+        with resume_storage.open(name, 'rb') as file:
+            target = blob_name(file_sha256(file), name)
+        duplicate = target in blobs or resume_storage.exists(target)
+        blobs.add(target)
+        if duplicate:
+            result['deduplicated'] += 1
+            result['freed_bytes'] += resume_storage.size(name)
+        if dry_run:
+            continue
+        if not duplicate:
+            path = resume_storage.path(target)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.link(resume_storage.path(name), path)
+        Resume.objects.filter(file=name).update(file=target)
+        resume_storage.delete(name)
+    if not dry_run:
+        recount_blobs()
+    return result
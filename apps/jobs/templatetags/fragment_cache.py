@@ -0,0 +1,43 @@
+from django import template
+
+from apps.jobs.caching import cached_fragment
+
+register = template.Library()
+
+
+class UserFragmentNode(template.Node):
+    def __init__(self, nodelist, name, vary_on):
+        self.nodelist = nodelist
+        self.name = name
+        self.vary_on = vary_on
+
+    def render(self, context):
+        user = context['request'].user
+        vary_on = [var.resolve(context) for var in self.vary_on]
+        return cached_fragment(
+            self.name, user.pk, vary_on, lambda: self.nodelist.render(context)
+        )
+
+
+@register.tag
+def userfragment(parser, token):
+    """
+    Cache the enclosed block per user and data version, e.g.
+
+        {% userfragment application_rows page_obj.number sort_by %}
+            ...
+        {% enduserfragment %}
+
+    The cached content is dropped as soon as the user's job applications,
+    their details or resumes change, see apps.jobs.caching.
+    """
+    nodelist = parser.parse(('enduserfragment',))
+    parser.delete_first_token()
+    bits = token.split_contents()
+    if len(bits) < 2:
+        raise template.TemplateSyntaxError(
+            f"'{bits[0]}' tag requires at least a fragment name."
+        )
+    return UserFragmentNode(
+        nodelist, bits[1], [parser.compile_filter(bit) for bit in bits[2:]]
+    )
@@ -0,0 +1,68 @@
+import pytest
+from statistics import median
+from time import perf_counter
+from django.core.cache import cache
+from django.test import RequestFactory
+
+from apps.jobs.api import ApplicationListApiView
+from apps.jobs.views import ListJobApplicationView
+
+PAGE_SIZES = [20, 100, 1_000]
+REPEATS = 5
+
+
+def timed(func) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = perf_counter()
+        func()
+        timings.append(perf_counter() - start)
+    return median(timings)
+
+
+@pytest.mark.django_db
+def test_api_vs_html_list(create_user, bulk_create_applications):
+    """Latency of one page as rendered HTML, as JSON and as a 304 revalidation"""
+    user = create_user()
+    bulk_create_applications(user, max(PAGE_SIZES))
+    factory = RequestFactory()
+    api_view = ApplicationListApiView.as_view()
+
+    def get(view, path, **headers):
+        request = factory.get(path, **headers)
+        request.user = user
+        response = view(request)
+        if hasattr(response, "render"):
+            response.render()
+        return response
+
+    results = []
+    for per_page in PAGE_SIZES:
+        html_view = ListJobApplicationView.as_view(paginate_by=per_page)
+
+        def render_html():
+            cache.clear()  # rows are rendered, not served from the fragment cache
+            get(html_view, "/jobs/list/")
+
+        html_time = timed(render_html)
+        api_path = f"/jobs/api/applications/?per_page={per_page}"
+        api_time = timed(lambda: get(api_view, api_path))
+
+        etag = get(api_view, api_path)["ETag"]
+        response = get(api_view, api_path, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+        revalidate_time = timed(
+            lambda: get(api_view, api_path, HTTP_IF_NONE_MATCH=etag)
+        )
+        results.append((per_page, html_time, api_time, revalidate_time))
+
+    print("\nrows/page  html [ms]  json [ms]  304 [ms]")
+    for per_page, html_time, api_time, revalidate_time in results:
+        print(
+            f"{per_page:<10} {html_time * 1000:>9.2f}  {api_time * 1000:>9.2f}  "
+            f"{revalidate_time * 1000:>8.2f}"
+        )
+
+    for _, html_time, api_time, revalidate_time in results:
+        assert api_time < html_time
+        assert revalidate_time < api_time
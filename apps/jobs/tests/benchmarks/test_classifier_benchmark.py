@@ -0,0 +1,66 @@
+import random
+from time import perf_counter
+
+import pytest
+from django.contrib.auth.models import User
+
+from apps.jobs.categories import categorize_resumes, get_classifier, train_classifier
+from apps.jobs.models import Resume
+
+TRAIN = 1000
+TOTAL = 10000
+BATCH_SIZES = [100, 1000, 5000]
+CATEGORIES = [f"Category {i}" for i in range(24)]
+
+
+def word(number: int) -> str:
+    """Letters only, the tokenizer drops digits"""
+    return "w" + "".join(chr(ord("a") + int(digit)) for digit in str(number))
+
+
+def synthetic_resume(rng, category: int) -> str:
+    own = [word(100_000 + category * 100 + i) for i in range(30)]
+    shared = [word(i) for i in range(2000)]
+    words = rng.sample(own, 10) + rng.sample(shared, 300)
+    rng.shuffle(words)
+    return " ".join(words)
+
+
+@pytest.mark.django_db
+def test_scoring_rows_per_second(tmp_path):
+    """Batch scoring throughput, in memory and through the backfill"""
+    rng = random.Random(42)
+    user = User.objects.create_user(username="jan", password="test123")
+    Resume.objects.bulk_create(
+        Resume(
+            user=user,
+            description="CV",
+            summary=synthetic_resume(rng, i % len(CATEGORIES)),
+            category=CATEGORIES[i % len(CATEGORIES)],
+        )
+        for i in range(TRAIN)
+    )
+    result = train_classifier(validation=0.1)
+    assert result["accuracy"] > 0.9
+    classifier = get_classifier()
+
+    texts = [synthetic_resume(rng, i % len(CATEGORIES)) for i in range(TOTAL)]
+    results = []
+    for batch_size in BATCH_SIZES:
+        start = perf_counter()
+        for i in range(0, TOTAL, batch_size):
+            classifier.predict(texts[i:i + batch_size])
+        seconds = perf_counter() - start
+        results.append((f"predict/{batch_size}", TOTAL / seconds))
+
+    Resume.objects.bulk_create(
+        Resume(user=user, description="CV", summary=text) for text in texts
+    )
+    backfill = categorize_resumes(classifier, batch_size=1000)
+    assert backfill["updated"] == TOTAL
+    results.append(("backfill/1000", TOTAL / backfill["seconds"]))
+
+    print(f"\nmodel: {result['terms']} terms, {result['size'] // 1024} KiB")
+    print("batch            rows/sec")
+    for name, rows_per_second in results:
+        print(f"{name:<16} {rows_per_second:>8.0f}")
@@ -0,0 +1,41 @@
+import pandas as pd
+from time import perf_counter
+
+from apps.jobs.loaders import (
+    build_dataset_cache, count_rows, iter_cached_rows, iter_sampled_rows,
+    open_dataset_cache, sample_positions,
+)
+
+ROWS = 20000
+SAMPLE = 200
+HTML = "<div><p>Built Django services, REST APIs and data pipelines.</p></div>" * 40
+
+
+def test_sample_csv_vs_cache(tmp_path):
+    """Seconds to sample resumes from the CSV and from its Feather cache"""
+    csv = str(tmp_path / "Resume.csv")
+    pd.DataFrame({
+        "ID": range(ROWS),
+        "Resume_str": ["PYTHON DEVELOPER  Summary"] * ROWS,
+        "Resume_html": [HTML] * ROWS,
+        "Category": ["INFORMATION-TECHNOLOGY"] * ROWS,
+    }).to_csv(csv, index=False)
+    cache = str(tmp_path / "resumes.arrow")
+    built = build_dataset_cache(csv, cache)
+
+    start = perf_counter()
+    positions = sample_positions(count_rows(csv, 1000), SAMPLE, seed=42)
+    from_csv = list(iter_sampled_rows(csv, positions, 1000))
+    csv_seconds = perf_counter() - start
+
+    start = perf_counter()
+    table = open_dataset_cache(cache)
+    positions = sample_positions(table.num_rows, SAMPLE, seed=42)
+    from_cache = list(iter_cached_rows(table, positions, 1000))
+    cache_seconds = perf_counter() - start
+
+    assert [p for p, _ in from_csv] == [p for p, _ in from_cache]
+    print(f"\nbuild cache   {built['seconds']:.2f} s")
+    print(f"sample CSV    {csv_seconds:.3f} s")
+    print(f"sample cache  {cache_seconds:.3f} s  "
+          f"({csv_seconds / cache_seconds:.0f}x faster)")
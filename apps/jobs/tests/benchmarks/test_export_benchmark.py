@@ -0,0 +1,29 @@
+import pytest
+import tracemalloc
+from time import perf_counter
+
+from apps.jobs.export import iter_csv, iter_export_rows
+
+TOTAL = 100_000
+MEMORY_CEILING = 20 * 1024 * 1024
+
+
+@pytest.mark.django_db
+def test_export_memory_is_constant(create_user, bulk_create_applications):
+    """Exporting 100k applications must stay under a fixed memory ceiling"""
+    user = create_user()
+    bulk_create_applications(user, TOTAL)
+
+    tracemalloc.start()
+    start = perf_counter()
+    lines = sum(1 for _ in iter_csv(iter_export_rows(user)))
+    elapsed = perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"\nexported {lines - 1} rows in {elapsed:.2f} s, "
+        f"peak memory {peak / 1024 / 1024:.1f} MiB"
+    )
+    assert lines == TOTAL + 1
+    assert peak < MEMORY_CEILING
@@ -0,0 +1,35 @@
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from apps.jobs.extraction import backfill_text
+from apps.jobs.models import Resume
+
+TOTAL = 200
+PAGES = 5
+WORKERS = [1, 2, 4]
+
+
+@pytest.mark.django_db
+def test_backfill_pages_per_second(create_user, make_pdf, settings, tmp_path):
+    """Text extraction throughput of the backfill per number of processes"""
+    settings.MEDIA_ROOT = tmp_path
+    user = create_user()
+    content = make_pdf([f"Resume page {page} " * 40 for page in range(PAGES)])
+    Resume.objects.bulk_create(
+        Resume(
+            user=user, description="CV", job_title="Dev",
+            file=SimpleUploadedFile(f"cv_{i}.pdf", content),
+        )
+        for i in range(TOTAL)
+    )
+
+    results = []
+    for workers in WORKERS:
+        Resume.objects.update(summary=None)
+        result = backfill_text(batch_size=100, workers=workers)
+        assert result["pages"] == TOTAL * PAGES
+        results.append((workers, result["pages"] / result["seconds"]))
+
+    print("\nworkers  pages/sec")
+    for workers, pages_per_second in results:
+        print(f"{workers:<8} {pages_per_second:>9.1f}")
@@ -0,0 +1,41 @@
+import pytest
+from datetime import date, timedelta
+from django.db import connection
+from time import perf_counter
+
+from apps.jobs.importers import import_applications
+
+TOTAL = 20_000
+# rows/sec the import has to sustain on PostgreSQL
+TARGET_ROWS_PER_SEC = 10_000
+
+
+@pytest.mark.django_db
+def test_import_throughput(create_user):
+    user = create_user()
+    start_date = date(2024, 1, 1)
+    rows = [
+        {
+            "job_name": f"Job {i}",
+            "company": f"Company {i % 50}",
+            "country": "PL",
+            "city": "Warszawa",
+            "link": f"https://example.com/jobs/{i}",
+            "apply_date": str(start_date + timedelta(days=i % 365)),
+            "valid_to": str(start_date + timedelta(days=i % 365 + 30)),
+            "status": "applied",
+            "portal": "LinkedIn",
+            "comments": "imported",
+        }
+        for i in range(TOTAL)
+    ]
+
+    start = perf_counter()
+    result = import_applications(user, rows, batch_size=2000)
+    elapsed = perf_counter() - start
+
+    rate = result.created / elapsed
+    print(f"\nimported {result.created} rows in {elapsed:.2f} s: {rate:,.0f} rows/sec")
+    assert result.created == TOTAL
+    if connection.vendor == "postgresql":
+        assert rate >= TARGET_ROWS_PER_SEC
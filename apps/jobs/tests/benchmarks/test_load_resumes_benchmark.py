@@ -0,0 +1,38 @@
+import pytest
+from time import perf_counter
+
+from apps.jobs.extraction import imap_ordered
+from apps.jobs.pdf import html_to_pdf
+
+TOTAL = 80
+WORKERS = [1, 2, 4, 8]
+HTML = (
+    "<html><body><h1>Jan Kowalski {i}</h1><h2>Python developer</h2>"
+    + "<p>Built Django services, REST APIs and data pipelines.</p>" * 60
+    + "</body></html>"
+)
+
+
+def weasyprint_error():
+    try:
+        import weasyprint  # noqa: F401
+    except (ImportError, OSError) as e:  # OSError: Pango is not installed
+        return str(e)
+    return None
+
+
+@pytest.mark.skipif(weasyprint_error() is not None, reason="WeasyPrint cannot load")
+def test_render_speedup():
+    """PDFs rendered per second by the load_resumes pool per number of workers"""
+    documents = [HTML.format(i=i) for i in range(TOTAL)]
+    results = []
+    for workers in WORKERS:
+        start = perf_counter()
+        pdfs = list(imap_ordered(html_to_pdf, documents, workers=workers))
+        seconds = perf_counter() - start
+        assert all(pdf.startswith(b"%PDF") for pdf in pdfs)
+        results.append((workers, TOTAL / seconds))
+
+    print("\nworkers  PDFs/sec  speedup")
+    for workers, rate in results:
+        print(f"{workers:<8} {rate:>8.1f}  {rate / results[0][1]:>6.2f}x")
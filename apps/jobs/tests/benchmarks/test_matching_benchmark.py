@@ -0,0 +1,43 @@
+import pytest
+from random import Random
+from statistics import median
+from time import perf_counter
+from django.contrib.auth.models import User
+
+from apps.jobs.matching import rank_resumes, resume_vectors
+from apps.jobs.models import Resume
+
+TOTAL = 1000
+RUNS = 50
+WORDS = [f"w{chr(97 + i // 26)}{chr(97 + i % 26)}" for i in range(26 * 26)]
+
+
+@pytest.mark.django_db
+def test_rank_1000_resumes():
+    """Milliseconds to rank 1,000 resumes against a posting, cold and warm"""
+    rng = Random(42)
+    user = User.objects.create_user(username="jan", password="test123")
+    Resume.objects.bulk_create(
+        Resume(
+            user=user,
+            description="CV",
+            job_title=" ".join(rng.choices(WORDS, k=3)),
+            summary=" ".join(rng.choices(WORDS, k=400)),
+        )
+        for _ in range(TOTAL)
+    )
+    posting = " ".join(rng.choices(WORDS, k=300))
+
+    start = perf_counter()
+    resume_vectors(user.pk)
+    cold = (perf_counter() - start) * 1000
+
+    timings = []
+    for _ in range(RUNS):
+        start = perf_counter()
+        ranking = rank_resumes(user.pk, posting, limit=10)
+        timings.append((perf_counter() - start) * 1000)
+    assert len(ranking) == 10
+
+    print(f"\nbuild vectors: {cold:.1f} ms, rank (median of {RUNS}): "
+          f"{median(timings):.2f} ms")
@@ -0,0 +1,50 @@
+import pytest
+from statistics import median
+from time import perf_counter
+from django.core.paginator import Paginator
+
+from apps.jobs.models import JobApplication
+from apps.jobs.pagination import KeysetPaginator, NEXT
+
+SIZES = [1_000, 10_000, 50_000]
+REPEATS = 5
+
+
+def timed(func) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = perf_counter()
+        func()
+        timings.append(perf_counter() - start)
+    return median(timings)
+
+
+@pytest.mark.django_db
+def test_deep_page_latency(create_user, bulk_create_applications):
+    """Latency of the last page: offset pagination vs keyset pagination"""
+    user = create_user()
+    created = 0
+    results = []
+    for size in SIZES:
+        bulk_create_applications(user, size - created)
+        created = size
+        queryset = JobApplication.objects.filter(owner=user).order_by("-apply_date")
+
+        offset_paginator = Paginator(queryset, 20)
+        last_page = offset_paginator.num_pages
+        offset_time = timed(lambda: list(offset_paginator.page(last_page)))
+
+        keyset_paginator = KeysetPaginator(queryset, "apply_date", per_page=20)
+        anchor = queryset.order_by("-apply_date", "-pk")[size - 21]
+        cursor = keyset_paginator.encode_cursor(anchor, NEXT)
+        keyset_time = timed(lambda: list(keyset_paginator.page(cursor)))
+
+        results.append((size, offset_time, keyset_time))
+
+    print("\nrows      offset [ms]  keyset [ms]")
+    for size, offset_time, keyset_time in results:
+        print(f"{size:<9} {offset_time * 1000:>11.2f}  {keyset_time * 1000:>11.2f}")
+
+    # keyset latency must not grow with the depth of the page
+    smallest, largest = results[0][2], results[-1][2]
+    assert largest < smallest * 3
@@ -0,0 +1,46 @@
+import pytest
+from random import Random
+from statistics import median
+from time import perf_counter
+
+from apps.jobs.models import SearchDocument
+from apps.jobs.search import search
+
+TOTAL = 100_000
+USERS = 10
+WORDS = (
+    "python django developer engineer data analyst backend frontend cloud "
+    "devops manager senior junior remote warsaw krakow gdansk spark airflow "
+    "kubernetes docker postgres react typescript java kotlin scala rust golang"
+).split()
+
+
+@pytest.mark.django_db
+def test_search_latency(create_user):
+    """Median latency of ranked, user-scoped search over 100k documents"""
+    rng = Random(42)
+    users = [create_user(f"user{i}") for i in range(USERS)]
+    SearchDocument.objects.bulk_create(
+        (
+            SearchDocument(
+                user=users[i % USERS],
+                kind="application",
+                object_id=i,
+                title=" ".join(rng.choices(WORDS, k=3)),
+                body=" ".join(rng.choices(WORDS, k=40)),
+            )
+            for i in range(TOTAL)
+        ),
+        batch_size=5000,
+    )
+
+    print("\nquery                         median [ms]")
+    for query in ("rust", "python developer", "senior kubernetes remote"):
+        timings = []
+        for _ in range(5):
+            start = perf_counter()
+            page = search(users[0], query)
+            timings.append(perf_counter() - start)
+            assert len(page) == 20
+        print(f"{query:<29} {median(timings) * 1000:>11.2f}")
+        assert median(timings) < 1.0
@@ -0,0 +1,52 @@
+import pandas as pd
+from time import perf_counter
+
+from apps.jobs.utils import (
+    sanitize_name, sanitize_name_batch, strip_to_lower, strip_to_lower_batch,
+    to_camel_case, to_camel_case_batch,
+)
+
+ROWS = 20000
+BODY = "Experienced engineer • built data pipelines and Django services. " * 40
+
+
+def per_row(func, *args) -> float:
+    start = perf_counter()
+    func(*args)
+    return (perf_counter() - start) / ROWS * 1e6
+
+
+def test_batch_vs_scalar():
+    """
+    Microseconds per row of the text utilities: one by one, batched over a
+    list and batched over a Series with Series.str methods
+    """
+    resumes = pd.Series([
+        f"         SENIOR DATA ENGINEER {i}\n\n  SENIOR DATA ENGINEER  Summary {BODY}"
+        for i in range(ROWS)
+    ])
+    titles = pd.Series(strip_to_lower_batch(resumes, forget_last=2))
+
+    rows = [
+        (
+            "strip_to_lower",
+            per_row(lambda: resumes.apply(strip_to_lower, forget_last=2)),
+            per_row(strip_to_lower_batch, list(resumes), 2),
+            per_row(strip_to_lower_batch, resumes, 2),
+        ),
+        (
+            "to_camel_case",
+            per_row(lambda: [to_camel_case(title) for title in titles]),
+            per_row(to_camel_case_batch, list(titles)),
+            per_row(to_camel_case_batch, titles),
+        ),
+        (
+            "sanitize_name",
+            per_row(lambda: [sanitize_name(title) for title in titles]),
+            per_row(sanitize_name_batch, list(titles)),
+            per_row(sanitize_name_batch, titles),
+        ),
+    ]
+    print("\nus/row          scalar    list  Series")
+    for name, scalar, listed, series in rows:
+        print(f"{name:<15} {scalar:>6.2f} {listed:>7.2f} {series:>7.2f}")
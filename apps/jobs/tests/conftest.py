@@ -0,0 +1,134 @@
+# apps/jobs/tests/conftest.py
+import io
+import os
+import pytest
+from datetime import date, timedelta
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import RequestFactory
+from pypdf import PdfWriter
+from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+from apps.jobs.models import JobApplication
+from apps.jobs.views import ListJobApplicationView
+
+
+def pytest_collection_modifyitems(config, items):
+    run_benchmarks = os.environ.get("RUN_BENCHMARKS")
+    for item in items:
+        if "tests/unit/" in str(item.fspath):
+            item.add_marker(pytest.mark.unit)
+        elif "tests/integration/" in str(item.fspath):
+            item.add_marker(pytest.mark.integration)
+        elif "tests/benchmarks/" in str(item.fspath):
+            item.add_marker(pytest.mark.benchmark)
+            if not run_benchmarks:
+                item.add_marker(
+                    pytest.mark.skip(reason="set RUN_BENCHMARKS=1 to run benchmarks")
+                )
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Cached fragments and data versions must not leak between tests"""
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def no_background_extraction(settings, tmp_path):
+    """
+    Tests opt into background work, no process pool is started by default,
+    and never see a category model trained outside of them
+    """
+    settings.RESUME_EXTRACTION_MODE = "off"
+    settings.RESUME_THUMBNAIL_MODE = "off"
+    settings.RESUME_CLASSIFIER_PATH = str(tmp_path / "resume_category.npz")
+
+
+@pytest.fixture
+def make_pdf():
+    """Return the bytes of a PDF with one page per given line of text"""
+    def build(pages: list) -> bytes:
+        writer = PdfWriter()
+        font = writer._add_object(DictionaryObject({
+            NameObject("/Type"): NameObject("/Font"),
+            NameObject("/Subtype"): NameObject("/Type1"),
+            NameObject("/BaseFont"): NameObject("/Helvetica"),
+        }))
+        for text in pages:
+            page = writer.add_blank_page(width=612, height=792)
+            page[NameObject("/Resources")] = DictionaryObject({
+                NameObject("/Font"): DictionaryObject({NameObject("/F1"): font}),
+            })
+            content = DecodedStreamObject()
+            content.set_data(f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode())
+            page[NameObject("/Contents")] = writer._add_object(content)
+        buffer = io.BytesIO()
+        writer.write(buffer)
+        return buffer.getvalue()
+    return build
+
+
+@pytest.fixture
+def create_user(db):
+    def make_user(username: str = "jan", password: str = "test123"):
+        return User.objects.create_user(username=username, password=password)
+    return make_user
+
+
+@pytest.fixture
+def create_application(db):
+    def make_application(user, **kwargs):
+        fields = {
+            "owner": user,
+            "job_name": "Python Developer",
+            "company": "Acme",
+            "apply_date": date.today(),
+            "valid_to": date.today() + timedelta(days=30),
+        }
+        fields.update(kwargs)
+        job_app = JobApplication.objects.create(**fields)
+        job_app.user.add(user)
+        return job_app
+    return make_application
+
+
+@pytest.fixture
+def bulk_create_applications(db):
+    """Insert `total` applications owned by `user` without per-row queries"""
+    def make_applications(user, total: int, batch_size: int = 5000):
+        through = JobApplication.user.through
+        start = date(2020, 1, 1)
+        for offset in range(0, total, batch_size):
+            size = min(batch_size, total - offset)
+            job_apps = JobApplication.objects.bulk_create(
+                JobApplication(
+                    owner=user,
+                    job_name=f"Job {offset + i}",
+                    company=f"Company {(offset + i) % 97}",
+                    apply_date=start + timedelta(days=(offset + i) % 1000),
+                    valid_to=start + timedelta(days=(offset + i) % 1000 + 30),
+                    status=JobApplication.STATUS_CHOICES[(offset + i) % 4][0],
+                )
+                for i in range(size)
+            )
+            through.objects.bulk_create(
+                through(jobapplication_id=job_app.pk, user_id=user.pk)
+                for job_app in job_apps
+            )
+    return make_applications
+
+
+@pytest.fixture
+def list_queryset():
+    """Return the queryset ListJobApplicationView builds for given parameters"""
+    def make_queryset(user, sort=None, order=None, **params):
+        params.update({k: v for k, v in {"sort": sort, "order": order}.items() if v})
+        request = RequestFactory().get("/jobs/list/", params)
+        request.user = user
+        view = ListJobApplicationView()
+        view.setup(request)
+        return view.get_queryset()
+    return make_queryset
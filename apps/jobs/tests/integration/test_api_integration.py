@@ -0,0 +1,217 @@
+import json
+import pytest
+from datetime import date
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.jobs.models import ApplicationStat, JobApplicationDetails
+
+
+APPLICATION = {
+    "job_name": "Backend", "company": "Acme", "country": "PL", "city": "Łódź",
+    "apply_date": "2025-01-01", "valid_to": "2025-02-01", "portal": "NFJ",
+    "link": "https://a.pl", "status": "applied",
+}
+
+
+def send(client, method, url, data):
+    return getattr(client, method)(
+        url, json.dumps(data), content_type="application/json"
+    )
+
+
+@pytest.mark.django_db
+class TestApplicationListApi:
+    url = reverse("jobs:api_applications")
+
+    def test_requires_login(self, client):
+        assert client.get(self.url).status_code == 403
+
+    def test_list_own_applications(self, client, create_user, create_application):
+        user, other = create_user(), create_user("anna")
+        job_app = create_application(user)
+        JobApplicationDetails.objects.create(job_application=job_app, comments="hi")
+        create_application(other)
+        client.force_login(user)
+
+        data = client.get(self.url).json()
+        assert data["next_page"] is None
+        assert [row["id"] for row in data["results"]] == [job_app.pk]
+        assert data["results"][0]["details"]["comments"] == "hi"
+        assert data["results"][0]["apply_date"] == date.today().isoformat()
+
+    def test_pages(self, client, create_user, bulk_create_applications):
+        user = create_user()
+        bulk_create_applications(user, 25)
+        client.force_login(user)
+
+        first = client.get(self.url, {"per_page": 10, "sort": "job_name"}).json()
+        assert len(first["results"]) == 10
+        assert first["next_page"] == 2
+        last = client.get(self.url, {"per_page": 10, "page": 3}).json()
+        assert len(last["results"]) == 5
+        assert last["next_page"] is None
+
+    def test_not_modified_until_data_changes(
+        self, client, create_user, create_application
+    ):
+        user = create_user()
+        create_application(user)
+        client.force_login(user)
+
+        response = client.get(self.url)
+        etag = response["ETag"]
+        assert response["Last-Modified"]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+        assert not any(
+            "jobs_jobapplication" in q["sql"] for q in queries.captured_queries
+        )
+
+        create_application(user, job_name="Frontend")
+        response = client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+
+    def test_validators_do_not_depend_on_the_cache(
+        self, client, create_user, create_application
+    ):
+        user = create_user()
+        create_application(user)
+        client.force_login(user)
+        response = client.get(self.url)
+
+        cache.clear()  # another worker, or a restarted cache
+        again = client.get(self.url, HTTP_IF_NONE_MATCH=response["ETag"])
+        assert again.status_code == 304
+        assert again["Last-Modified"] == response["Last-Modified"]
+
+    def test_etag_varies_on_query(self, client, create_user):
+        client.force_login(create_user())
+        first = client.get(self.url)["ETag"]
+        assert client.get(self.url, {"page": 2})["ETag"] != first
+
+    def test_create(self, client, create_user):
+        user = create_user()
+        client.force_login(user)
+
+        response = send(
+            client, "post", self.url, {**APPLICATION, "details": {"comments": "hi"}}
+        )
+        assert response.status_code == 201
+        data = response.json()
+        assert data["details"]["comments"] == "hi"
+        job_app = user.owned_job_applications.get()
+        assert job_app.pk == data["id"]
+        assert list(job_app.user.all()) == [user]
+        assert ApplicationStat.objects.get(
+            user=user, dimension="status", value="applied"
+        ).count == 1
+
+    def test_create_invalid(self, client, create_user):
+        client.force_login(create_user())
+        response = send(client, "post", self.url, {**APPLICATION, "company": ""})
+        assert response.status_code == 400
+        assert "company" in response.json()["errors"]
+
+        response = client.post(self.url, "{", content_type="application/json")
+        assert response.status_code == 400
+
+    def test_create_with_non_string_values(self, client, create_user):
+        client.force_login(create_user())
+        response = send(client, "post", self.url, {
+            **APPLICATION, "apply_date": 5, "valid_to": 7,
+            "details": {"comments": ["a"], "salary_range": None},
+        })
+        assert response.status_code == 400
+        assert response.json()["errors"] == {
+            "apply_date": ["Expected a string or null."],
+            "valid_to": ["Expected a string or null."],
+            "details": {"comments": ["Expected a string or null."]},
+        }
+
+
+@pytest.mark.django_db
+class TestApplicationDetailApi:
+
+    def url(self, pk):
+        return reverse("jobs:api_application", args=[pk])
+
+    def test_retrieve(self, client, create_user, create_application):
+        user = create_user()
+        job_app = create_application(user)
+        client.force_login(user)
+
+        data = client.get(self.url(job_app.pk)).json()
+        assert data["job_name"] == job_app.job_name
+        assert data["details"] is None
+
+    def test_other_users_application_is_not_found(
+        self, client, create_user, create_application
+    ):
+        job_app = create_application(create_user())
+        client.force_login(create_user("anna"))
+        assert client.get(self.url(job_app.pk)).status_code == 404
+        response = send(client, "patch", self.url(job_app.pk), {"status": "offer"})
+        assert response.status_code == 404
+
+    def test_partial_update(self, client, create_user, create_application):
+        user = create_user()
+        job_app = create_application(
+            user, country="PL", city="Łódź", portal="NFJ", link="https://a.pl"
+        )
+        client.force_login(user)
+
+        response = send(
+            client, "patch", self.url(job_app.pk),
+            {"status": "offer", "details": {"salary_range": "10-20k"}},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "offer"
+        assert data["company"] == "Acme"
+        assert data["details"]["salary_range"] == "10-20k"
+
+        response = send(
+            client, "patch", self.url(job_app.pk), {"details": {"comments": "hi"}}
+        )
+        assert response.json()["details"] == {
+            "job_application_body": "", "comments": "hi", "salary_range": "10-20k",
+        }
+
+    def test_partial_update_invalid(self, client, create_user, create_application):
+        user = create_user()
+        job_app = create_application(
+            user, country="PL", city="Łódź", portal="NFJ", link="https://a.pl"
+        )
+        client.force_login(user)
+        response = send(client, "patch", self.url(job_app.pk), {"status": "hired"})
+        assert response.status_code == 400
+        assert "status" in response.json()["errors"]
+
+        response = send(client, "patch", self.url(job_app.pk), {"valid_to": 7})
+        assert response.status_code == 400
+        assert "valid_to" in response.json()["errors"]
+
+
+@pytest.mark.django_db
+class TestApplicationBulkStatusApi:
+    url = reverse("jobs:api_bulk_status")
+
+    def test_returns_updated_count(self, client, create_user, create_application):
+        user, other = create_user(), create_user("anna")
+        ids = [create_application(user).pk, create_application(other).pk]
+        client.force_login(user)
+
+        response = send(client, "post", self.url, {"ids": ids, "status": "rejected"})
+        assert response.json() == {"updated": 1}
+
+    def test_invalid(self, client, create_user):
+        client.force_login(create_user())
+        response = send(client, "post", self.url, {"ids": ["x"], "status": "offer"})
+        assert response.status_code == 400
+        assert "ids" in response.json()["errors"]
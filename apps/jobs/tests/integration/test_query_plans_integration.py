@@ -0,0 +1,30 @@
+import pytest
+from django.db import connection
+
+from apps.jobs.models import JobApplication
+
+
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="PostgreSQL query plan")
+@pytest.mark.django_db
+class TestSortQueryPlan:
+    @pytest.fixture(autouse=True)
+    def planner_settings(self):
+        # on near-empty test tables a sequential scan is always cheapest,
+        # so make the planner prefer any index that can serve the ORDER BY
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute("SET LOCAL enable_sort = off")
+
+    @pytest.mark.parametrize("order", ["asc", "desc"])
+    @pytest.mark.parametrize("sort", JobApplication.SORTABLE_FIELDS)
+    def test_sort_is_index_driven(
+        self, create_user, bulk_create_applications, list_queryset, sort, order
+    ):
+        user = create_user()
+        bulk_create_applications(user, 200)
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE jobs_jobapplication")
+
+        plan = list_queryset(user, sort, order)[:21].explain()
+        assert f"jobapp_owner_{sort}_idx" in plan
+        assert "Sort" not in plan
@@ -0,0 +1,86 @@
+import hashlib
+import json
+import pytest
+from django.urls import reverse
+
+from apps.jobs.models import Resume
+
+CONTENT = b"%PDF-1.4\n" + b"resume " * 2000
+
+
+@pytest.fixture
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    settings.RESUME_UPLOAD_MAX_CHUNK = 4 * 1024
+    return tmp_path
+
+
+@pytest.mark.django_db
+class TestResumeUploadApi:
+
+    def start(self, client, **data):
+        return client.post(
+            reverse("jobs:api_uploads"), json.dumps(data),
+            content_type="application/json",
+        )
+
+    def put(self, client, upload_id, offset, chunk):
+        return client.put(
+            reverse("jobs:api_upload", args=[upload_id]) + f"?offset={offset}",
+            chunk, content_type="application/octet-stream",
+        )
+
+    def test_full_protocol(self, client, create_user, media_root):
+        user = create_user()
+        client.force_login(user)
+
+        response = self.start(client, file_name="cv.pdf", size=len(CONTENT))
+        assert response.status_code == 201
+        upload = response.json()
+        assert upload["offset"] == 0
+        assert upload["max_chunk"] == 4 * 1024
+
+        offset = 0
+        while offset < len(CONTENT):
+            chunk = CONTENT[offset:offset + upload["max_chunk"]]
+            offset = self.put(client, upload["id"], offset, chunk).json()["offset"]
+
+        state = client.get(reverse("jobs:api_upload", args=[upload["id"]])).json()
+        assert state["offset"] == state["size"] == len(CONTENT)
+
+        response = client.post(
+            reverse("jobs:api_upload_finalize", args=[upload["id"]]),
+            json.dumps({"sha256": hashlib.sha256(CONTENT).hexdigest()}),
+            content_type="application/json",
+        )
+        assert response.status_code == 201
+        resume = Resume.objects.get(pk=response.json()["id"])
+        assert resume.user == user
+        assert resume.file.read() == CONTENT
+
+    def test_out_of_order_chunk(self, client, create_user, media_root):
+        client.force_login(create_user())
+        upload = self.start(client, file_name="cv.pdf", size=len(CONTENT)).json()
+        response = self.put(client, upload["id"], 100, CONTENT[100:200])
+        assert response.status_code == 409
+        assert response.json()["offset"] == 0
+
+    def test_chunk_too_large(self, client, create_user, media_root):
+        client.force_login(create_user())
+        upload = self.start(client, file_name="cv.pdf", size=len(CONTENT)).json()
+        response = self.put(client, upload["id"], 0, CONTENT)
+        assert response.status_code == 413
+
+    def test_file_too_large(self, client, create_user, media_root, settings):
+        client.force_login(create_user())
+        response = self.start(
+            client, file_name="cv.pdf", size=settings.RESUME_UPLOAD_MAX_SIZE + 1
+        )
+        assert response.status_code == 413
+
+    def test_other_users_upload(self, client, create_user, media_root):
+        client.force_login(create_user())
+        upload = self.start(client, file_name="cv.pdf", size=len(CONTENT)).json()
+        client.force_login(create_user("anna"))
+        response = self.put(client, upload["id"], 0, CONTENT[:10])
+        assert response.status_code == 404
@@ -0,0 +1,575 @@
+import pytest
+from datetime import date, timedelta
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.jobs.caching import fragment_stats
+from apps.jobs.models import Resume
+from apps.users.models import UserProfile
+
+
+@pytest.mark.django_db
+class TestListJobApplicationView:
+    url = reverse("jobs:list_of_applications")
+
+    def test_cursor_mode_pages_without_count(
+        self, client, create_user, bulk_create_applications
+    ):
+        user = create_user()
+        bulk_create_applications(user, 45)
+        client.force_login(user)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(self.url, {"pagination": "cursor"})
+        assert response.status_code == 200
+        assert not any("COUNT(" in q["sql"] for q in queries.captured_queries)
+
+        page = response.context["page_obj"]
+        assert len(page) == 20
+        assert not page.has_previous()
+
+        seen = [job_app.pk for job_app in page]
+        while page.has_next():
+            response = client.get(
+                self.url, {"pagination": "cursor", "cursor": page.next_cursor}
+            )
+            page = response.context["page_obj"]
+            seen += [job_app.pk for job_app in page]
+        assert len(seen) == len(set(seen)) == 45
+
+    def test_cursor_mode_keeps_sort_parameters(
+        self, client, create_user, bulk_create_applications
+    ):
+        user = create_user()
+        bulk_create_applications(user, 25)
+        client.force_login(user)
+
+        response = client.get(
+            self.url, {"pagination": "cursor", "sort": "job_name", "order": "asc"}
+        )
+        names = [job_app.job_name for job_app in response.context["page_obj"]]
+        assert names == sorted(names)
+        assert response.context["sort_by"] == "job_name"
+
+    def test_cursor_mode_only_lists_own_applications(
+        self, client, create_user, create_application
+    ):
+        user = create_user()
+        other = create_user("anna")
+        create_application(user)
+        create_application(other)
+        client.force_login(user)
+
+        response = client.get(self.url, {"pagination": "cursor"})
+        assert len(response.context["page_obj"]) == 1
+
+    def test_invalid_cursor_returns_404(self, client, create_user):
+        client.force_login(create_user())
+        response = client.get(self.url, {"pagination": "cursor", "cursor": "garbage"})
+        assert response.status_code == 404
+
+    def test_unknown_sort_falls_back_to_default(
+        self, client, create_user, bulk_create_applications
+    ):
+        user = create_user()
+        bulk_create_applications(user, 5)
+        client.force_login(user)
+
+        response = client.get(self.url, {"sort": "password", "order": "sideways"})
+        assert response.status_code == 200
+        assert response.context["sort_by"] == "apply_date"
+        assert response.context["order"] == "desc"
+        dates = [job_app.apply_date for job_app in response.context["object_list"]]
+        assert dates == sorted(dates, reverse=True)
+
+    def test_expiring_within_filter(self, client, create_user, create_application):
+        user = create_user()
+        today = date.today()
+        soon = create_application(user, valid_to=today + timedelta(days=3))
+        create_application(user, valid_to=today + timedelta(days=30))
+        create_application(user, valid_to=today - timedelta(days=1))
+        client.force_login(user)
+
+        response = client.get(self.url, {"expiring_within": 7})
+        assert [a.pk for a in response.context["object_list"]] == [soon.pk]
+        assert response.context["expiring_within"] == 7
+
+    def test_expiring_within_huge(self, client, create_user, create_application):
+        user = create_user()
+        job_app = create_application(user)
+        client.force_login(user)
+
+        response = client.get(self.url, {"expiring_within": 99999999})
+        assert response.status_code == 200
+        assert [a.pk for a in response.context["object_list"]] == [job_app.pk]
+
+    def test_sort_by_valid_days(self, client, create_user, create_application):
+        user = create_user()
+        today = date.today()
+        for days in (10, -5, 3):
+            create_application(user, valid_to=today + timedelta(days=days))
+        client.force_login(user)
+
+        response = client.get(self.url, {"sort": "valid_days", "order": "asc"})
+        assert [a.remaining_days for a in response.context["object_list"]] == \
+            [0, 3, 10]
+
+    @pytest.mark.django_db(transaction=True)
+    def test_rows_served_from_fragment_cache(
+        self, client, create_user, create_application
+    ):
+        user = create_user()
+        create_application(user, job_name="Backend")
+        client.force_login(user)
+
+        client.get(self.url)
+        response = client.get(self.url)
+        assert fragment_stats() == {"hits": 1, "misses": 1}
+        assert b"Backend" in response.content
+
+        create_application(user, job_name="Frontend")
+        response = client.get(self.url)
+        assert b"Frontend" in response.content
+        assert fragment_stats()["misses"] == 2
+
+    def test_fragment_cache_varies_on_page_and_sort(
+        self, client, create_user, create_application
+    ):
+        user = create_user()
+        create_application(user, job_name="Backend")
+        client.force_login(user)
+
+        client.get(self.url)
+        client.get(self.url, {"sort": "job_name", "order": "asc"})
+        client.get(self.url, {"pagination": "cursor"})
+        assert fragment_stats() == {"hits": 0, "misses": 3}
+
+    def test_fragment_cache_is_per_user(self, client, create_user, create_application):
+        user, other = create_user(), create_user("anna")
+        create_application(user, job_name="Backend")
+        create_application(other, job_name="Frontend")
+
+        client.force_login(user)
+        client.get(self.url)
+        client.force_login(other)
+        response = client.get(self.url)
+        assert b"Frontend" in response.content
+        assert b"Backend" not in response.content
+
+
+@pytest.mark.django_db
+class TestJobsHomeView:
+    url = reverse("jobs:home")
+
+    def test_requires_login(self, client):
+        response = client.get(self.url)
+        assert response.status_code == 302
+
+    def test_shows_user_stats(self, client, create_user, create_application):
+        user = create_user()
+        create_application(user, company="Acme", status="offer")
+        create_application(create_user("anna"), company="Other")
+        client.force_login(user)
+
+        response = client.get(self.url)
+        assert response.status_code == 200
+        assert response.context["total"] == 1
+        assert response.context["stats"]["company"] == [("Acme", 1)]
+
+
+@pytest.mark.django_db
+class TestSearchView:
+    url = reverse("jobs:search")
+
+    def test_search(self, client, create_user, create_application):
+        user = create_user()
+        create_application(user, job_name="Machine learning engineer")
+        client.force_login(user)
+
+        response = client.get(self.url, {"q": "learning"})
+        assert response.status_code == 200
+        assert len(response.context["page_obj"]) == 1
+        assert "Machine learning engineer" in response.content.decode()
+
+    def test_bad_page_number(self, client, create_user):
+        client.force_login(create_user())
+        response = client.get(self.url, {"q": "x", "page": "last"})
+        assert response.status_code == 200
+        assert response.context["page_obj"].number == 1
+
+
+@pytest.mark.django_db
+class TestExportJobApplicationsView:
+    url = reverse("jobs:export_applications")
+
+    @pytest.mark.parametrize("export_format", ["csv", "jsonl"])
+    def test_streams_export(
+        self, client, create_user, bulk_create_applications, export_format
+    ):
+        user = create_user()
+        bulk_create_applications(user, 30)
+        client.force_login(user)
+
+        response = client.get(self.url, {"format": export_format})
+        assert response.status_code == 200
+        assert response.streaming
+        assert f"job_applications.{export_format}" in response["Content-Disposition"]
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        assert len(lines) == 30 + (export_format == "csv")
+
+    def test_unknown_format(self, client, create_user):
+        client.force_login(create_user())
+        assert client.get(self.url, {"format": "xlsx"}).status_code == 404
+
+
+@pytest.mark.django_db
+class TestImportJobApplicationsView:
+    url = reverse("jobs:import_applications")
+
+    def test_upload(self, client, create_user):
+        user = create_user()
+        client.force_login(user)
+        upload = SimpleUploadedFile(
+            "applications.csv",
+            "job_name,company,country,city,apply_date,valid_to,portal,link,status\n"
+            "Backend,Acme,PL,Łódź,2025-01-01,2025-02-01,NFJ,https://a.pl,applied\n"
+            "Frontend,,PL,Łódź,2025-01-01,2025-02-01,NFJ,https://b.pl,applied\n"
+            .encode(),
+            content_type="text/csv",
+        )
+        response = client.post(self.url, {"file": upload})
+        assert response.status_code == 200
+        result = response.context["result"]
+        assert result.created == 1
+        assert result.errors[0][0] == 3
+        assert user.owned_job_applications.get().job_name == "Backend"
+
+    @pytest.mark.parametrize("content", [
+        # what Excel saves on a Polish Windows machine
+        "job_name,city\nBackend,Łódź\n".encode("cp1250"),
+        b"job_name\n" + b"x" * 200000 + b"\n",  # over the csv field size limit
+    ])
+    def test_unreadable_file(self, client, create_user, content):
+        user = create_user()
+        client.force_login(user)
+        upload = SimpleUploadedFile("data.csv", content, content_type="text/csv")
+        response = client.post(self.url, {"file": upload})
+        assert response.status_code == 200
+        assert response.context["form"].errors["file"]
+        assert "result" not in response.context
+        assert not user.owned_job_applications.exists()
+
+
+@pytest.mark.django_db
+class TestBulkStatusView:
+    url = reverse("jobs:bulk_status")
+
+    def test_moves_selected_and_redirects_back(
+        self, client, create_user, create_application
+    ):
+        user = create_user()
+        first, second = create_application(user), create_application(user)
+        client.force_login(user)
+
+        back = reverse("jobs:list_of_applications") + "?sort=job_name"
+        response = client.post(
+            self.url, {"ids": [first.pk, second.pk], "status": "rejected", "next": back}
+        )
+        assert response.status_code == 302
+        assert response.url == back
+        assert set(
+            user.owned_job_applications.values_list("status", flat=True)
+        ) == {"rejected"}
+
+        response = client.get(back)
+        assert b"2 job applications moved to Rejected." in response.content
+
+    @pytest.mark.django_db(transaction=True)
+    def test_list_rows_reflect_new_status(
+        self, client, create_user, create_application
+    ):
+        user = create_user()
+        job_app = create_application(user)
+        client.force_login(user)
+        list_url = reverse("jobs:list_of_applications")
+
+        client.get(list_url)  # rows are now cached
+        client.post(self.url, {"ids": [job_app.pk], "status": "offer"})
+        response = client.get(list_url)
+        assert response.context["object_list"][0].status == "offer"
+        assert b"<td>Offer</td>" in response.content
+
+    def test_invalid_status(self, client, create_user, create_application):
+        user = create_user()
+        job_app = create_application(user)
+        client.force_login(user)
+
+        response = client.post(
+            self.url, {"ids": [job_app.pk], "status": "hired"}, follow=True
+        )
+        assert response.status_code == 200
+        assert list(response.context["messages"])[0].level_tag == "error"
+        job_app.refresh_from_db()
+        assert job_app.status == "applied"
+
+    def test_get_not_allowed(self, client, create_user):
+        client.force_login(create_user())
+        assert client.get(self.url).status_code == 405
+
+
+@pytest.mark.django_db
+class TestResumeLookupView:
+    url = reverse("jobs:resume_lookup")
+
+    def test_pages_through_own_resumes(self, client, create_user):
+        user = create_user()
+        Resume.objects.bulk_create(
+            Resume(user=user, description="CV", file_name=f"cv_{i}.pdf")
+            for i in range(25)
+        )
+        Resume.objects.create(user=create_user("anna"), description="CV")
+        client.force_login(user)
+
+        first = client.get(self.url).json()
+        assert len(first["results"]) == 20
+        second = client.get(self.url, {"cursor": first["next"]}).json()
+        assert len(second["results"]) == 5
+        assert second["next"] is None
+        ids = [r["id"] for r in first["results"] + second["results"]]
+        assert len(set(ids)) == 25
+
+    def test_prefix_search(self, client, create_user):
+        user = create_user()
+        Resume.objects.create(user=user, description="CV", file_name="Backend.pdf")
+        Resume.objects.create(user=user, description="CV", file_name="frontend.pdf")
+        client.force_login(user)
+
+        results = client.get(self.url, {"q": "back"}).json()["results"]
+        assert [r["text"] for r in results] == ["Backend.pdf"]
+
+    def test_finds_resumes_uploaded_with_the_form(
+        self, client, create_user, settings, tmp_path
+    ):
+        settings.MEDIA_ROOT = tmp_path
+        user = create_user()
+        client.force_login(user)
+        response = client.post(reverse("jobs:create_application"), {
+            "job_name": "Backend", "company": "Acme", "country": "PL",
+            "city": "Łódź", "apply_date": "2025-01-01", "valid_to": "2025-02-01",
+            "portal": "NFJ", "link": "https://a.pl", "status": "applied",
+            "job_application_body": "Django", "comments": "-", "salary_range": "10k",
+            "resume": "upload_new",
+            "new_resume": SimpleUploadedFile("CV_jan.pdf", b"%PDF-1.4"),
+        })
+        assert response.status_code == 302
+
+        results = client.get(self.url, {"q": "cv"}).json()["results"]
+        assert [r["text"] for r in results] == ["CV_jan.pdf"]
+
+    def test_invalid_cursor(self, client, create_user):
+        client.force_login(create_user())
+        assert client.get(self.url, {"cursor": "garbage"}).status_code == 400
+
+
+@pytest.mark.django_db
+class TestResumeMatchView:
+    url = reverse("jobs:resume_match")
+
+    def test_ranks_own_resumes(self, client, create_user):
+        user = create_user()
+        Resume.objects.create(
+            user=user, description="CV", file_name="backend.pdf",
+            job_title="Python developer",
+        )
+        Resume.objects.create(
+            user=user, description="CV", file_name="tax.pdf", job_title="Accountant",
+        )
+        Resume.objects.create(
+            user=create_user("anna"), description="CV", job_title="Python developer",
+        )
+        client.force_login(user)
+
+        results = client.post(self.url, {"text": "Python developer"}).json()["results"]
+        assert [r["text"] for r in results] == ["backend.pdf"]
+        assert 0 < results[0]["score"] <= 1
+
+    def test_get_not_allowed(self, client, create_user):
+        client.force_login(create_user())
+        assert client.get(self.url).status_code == 405
+
+    def test_anonymous_forbidden(self, client):
+        assert client.post(self.url, {"text": "python"}).status_code == 403
+
+
+@pytest.mark.django_db
+class TestResumeDownloadView:
+    content = b"%PDF-1.4 " + bytes(range(256)) * 40
+
+    @pytest.fixture
+    def resume(self, create_user, settings, tmp_path):
+        settings.MEDIA_ROOT = tmp_path
+        return Resume.objects.create(
+            user=create_user(), description="CV", job_title="Dev",
+            file_name="Jan Kowalski.pdf",
+            file=SimpleUploadedFile("cv.pdf", self.content),
+        )
+
+    def url(self, resume):
+        return reverse("jobs:resume_download", args=[resume.pk])
+
+    def test_whole_file(self, client, resume):
+        client.force_login(resume.user)
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(self.url(resume))
+        assert response.status_code == 200
+        assert b"".join(response.streaming_content) == self.content
+        assert response["Accept-Ranges"] == "bytes"
+        assert response["ETag"]
+        assert 'filename="Jan Kowalski.pdf"' in response["Content-Disposition"]
+        # session, user, resume
+        assert len(queries) == 3
+
+    def test_byte_range(self, client, resume):
+        client.force_login(resume.user)
+        response = client.get(self.url(resume), HTTP_RANGE="bytes=100-199")
+        assert response.status_code == 206
+        assert response["Content-Range"] == f"bytes 100-199/{len(self.content)}"
+        assert response["Content-Length"] == "100"
+        assert b"".join(response.streaming_content) == self.content[100:200]
+
+    def test_range_past_the_end(self, client, resume):
+        client.force_login(resume.user)
+        response = client.get(
+            self.url(resume), HTTP_RANGE=f"bytes={len(self.content)}-"
+        )
+        assert response.status_code == 416
+        assert response["Content-Range"] == f"bytes */{len(self.content)}"
+
+    def test_stale_if_range_sends_whole_file(self, client, resume):
+        client.force_login(resume.user)
+        response = client.get(
+            self.url(resume), HTTP_RANGE="bytes=0-9", HTTP_IF_RANGE='"old"'
+        )
+        assert response.status_code == 200
+
+    def test_if_none_match(self, client, resume):
+        client.force_login(resume.user)
+        etag = client.get(self.url(resume))["ETag"]
+        response = client.get(self.url(resume), HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+        assert response["ETag"] == etag
+
+    def test_offloaded_to_nginx(self, client, resume, settings):
+        settings.RESUME_DOWNLOAD_BACKEND = "nginx"
+        client.force_login(resume.user)
+        response = client.get(self.url(resume))
+        assert response["X-Accel-Redirect"] == f"/protected-media/{resume.file.name}"
+        assert response.content == b""
+
+    def test_other_user_gets_not_found(self, client, create_user, resume):
+        client.force_login(create_user("anna"))
+        assert client.get(self.url(resume)).status_code == 404
+
+    def test_missing_file(self, client, resume):
+        client.force_login(resume.user)
+        resume.file.storage.delete(resume.file.name)
+        assert client.get(self.url(resume)).status_code == 404
+
+    def test_anonymous_redirected_to_login(self, client, resume):
+        assert client.get(self.url(resume)).status_code == 302
+
+
+@pytest.mark.django_db
+class TestResumeThumbnailView:
+
+    @pytest.fixture
+    def resume(self, create_user, make_pdf, settings, tmp_path):
+        settings.MEDIA_ROOT = tmp_path
+        return Resume.objects.create(
+            user=create_user(), description="CV", job_title="Dev",
+            file=SimpleUploadedFile("cv.pdf", make_pdf(["Jan Kowalski"])),
+        )
+
+    def test_first_request_renders_and_redirects(self, client, resume):
+        client.force_login(resume.user)
+        response = client.get(resume.thumbnail_url)
+        resume.refresh_from_db()
+        assert response.status_code == 302
+        assert response.url == resume.thumbnail_url
+        assert resume.thumbnail
+
+    def test_hashed_url_is_immutable(self, client, resume):
+        client.force_login(resume.user)
+        client.get(resume.thumbnail_url)
+        resume.refresh_from_db()
+
+        response = client.get(resume.thumbnail_url)
+        assert response.status_code == 200
+        assert response["Content-Type"] == "image/png"
+        assert "immutable" in response["Cache-Control"]
+        assert b"".join(response.streaming_content).startswith(b"\x89PNG")
+
+    def test_stale_digest_is_not_found(self, client, resume):
+        client.force_login(resume.user)
+        client.get(resume.thumbnail_url)
+        url = reverse("jobs:resume_thumbnail", args=[resume.pk, "0" * 16])
+        assert client.get(url).status_code == 404
+
+    def test_other_user_gets_not_found(self, client, create_user, resume):
+        client.get(resume.thumbnail_url)
+        client.force_login(create_user("anna"))
+        assert client.get(resume.thumbnail_url).status_code == 404
+
+
+@pytest.mark.django_db
+class TestCreateJobApplicationView:
+    url = reverse("jobs:create_application")
+
+    def test_get_does_not_list_resumes(self, client, create_user):
+        user = create_user()
+        UserProfile.objects.create(user=user, country="PL", city="Łódź")
+        client.force_login(user)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(self.url)
+        assert response.status_code == 200
+        assert not any("jobs_resume" in q["sql"] for q in queries.captured_queries)
+
+    def test_links_picked_resume(self, client, create_user):
+        user = create_user()
+        UserProfile.objects.create(user=user, country="PL", city="Łódź")
+        resume = Resume.objects.create(user=user, description="CV")
+        client.force_login(user)
+
+        response = client.post(self.url, {
+            "job_name": "Backend", "company": "Acme", "country": "PL",
+            "city": "Łódź", "apply_date": "2025-01-01", "valid_to": "2025-02-01",
+            "portal": "NFJ", "link": "https://a.pl", "status": "applied",
+            "job_application_body": "Python", "comments": "-",
+            "salary_range": "10k", "resume": resume.pk,
+        })
+        assert response.status_code == 302
+        job_app = user.owned_job_applications.get()
+        assert list(job_app.details.resume.all()) == [resume]
+
+    def test_duplicate_flagged(self, client, create_user, create_application):
+        user = create_user()
+        UserProfile.objects.create(user=user, country="PL", city="Łódź")
+        create_application(
+            user, job_name="Backend", company="Acme", link="https://a.pl/job",
+            apply_date=date(2025, 1, 1),
+        )
+        client.force_login(user)
+
+        response = client.post(self.url, {
+            "job_name": "backend", "company": "ACME", "country": "PL",
+            "city": "Łódź", "apply_date": "2025-03-01", "valid_to": "2025-04-01",
+            "portal": "NFJ", "link": "https://www.a.pl/job/", "status": "applied",
+            "job_application_body": "Python", "comments": "-", "salary_range": "10k",
+        }, follow=True)
+        assert user.owned_job_applications.count() == 2
+        assert "You already applied for Backend at Acme on 2025-01-01." in [
+            str(message) for message in response.context["messages"]
+        ]
@@ -0,0 +1,79 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.jobs.bulk import bulk_set_status
+from apps.jobs.caching import data_version
+from apps.jobs.models import JobApplication
+from apps.jobs.stats import rebuild_stats
+from apps.jobs.tests.unit.test_stats_unit import stats_snapshot
+
+
+class TestBulkSetStatusUnit:
+    pytestmark = pytest.mark.django_db(transaction=False)
+
+    def test_moves_only_own_applications(self, create_user, create_application):
+        user, other = create_user(), create_user("anna")
+        mine = [create_application(user) for _ in range(3)]
+        theirs = create_application(other)
+
+        updated = bulk_set_status(
+            user, [job_app.pk for job_app in mine] + [theirs.pk], "rejected"
+        )
+        assert updated == 3
+        assert set(
+            JobApplication.objects.filter(owner=user).values_list("status", flat=True)
+        ) == {"rejected"}
+        theirs.refresh_from_db()
+        assert theirs.status == "applied"
+
+    def test_stats_match_a_rebuild(self, create_user, create_application):
+        user = create_user()
+        ids = [
+            create_application(user, status=status).pk
+            for status in ("applied", "applied", "interview", "rejected")
+        ]
+        assert bulk_set_status(user, ids, "rejected") == 3
+
+        incremental = stats_snapshot(user)
+        rebuild_stats()
+        assert incremental == stats_snapshot(user) == {
+            ("status", "rejected"): 4,
+            ("company", "Acme"): 4,
+            ("portal", ""): 4,
+        }
+
+    def test_single_update_statement(self, create_user, bulk_create_applications):
+        user = create_user()
+        bulk_create_applications(user, 50)
+        ids = list(JobApplication.objects.values_list("pk", flat=True))
+
+        with CaptureQueriesContext(connection) as queries:
+            bulk_set_status(user, ids, "rejected")
+        updates = [
+            q["sql"] for q in queries.captured_queries
+            if q["sql"].startswith('UPDATE "jobs_jobapplication"')
+        ]
+        assert len(updates) == 1
+
+    def test_bumps_data_version(
+        self, create_user, create_application,
+        django_capture_on_commit_callbacks,
+    ):
+        user = create_user()
+        job_app = create_application(user)
+        version = data_version(user.pk)
+        with django_capture_on_commit_callbacks(execute=True):
+            bulk_set_status(user, [job_app.pk], "offer")
+        assert data_version(user.pk) != version
+
+    def test_nothing_to_change(self, create_user, create_application):
+        user = create_user()
+        job_app = create_application(user, status="offer")
+        version = data_version(user.pk)
+        assert bulk_set_status(user, [job_app.pk], "offer") == 0
+        assert data_version(user.pk) == version
+
+    def test_unknown_status(self, create_user):
+        with pytest.raises(ValueError):
+            bulk_set_status(create_user(), [1], "hired")
@@ -0,0 +1,128 @@
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+
+from apps.config.cache import get_cache_config
+from apps.jobs.caching import (
+    bump_data_version, cached_fragment, data_version, fragment_stats,
+    reset_fragment_stats,
+)
+from apps.jobs.importers import import_applications
+from apps.jobs.models import JobApplicationDetails, Resume
+
+
+class TestFragmentCacheUnit:
+
+    def test_miss_then_hit(self):
+        render_calls = []
+
+        def render():
+            render_calls.append(1)
+            return "<tr></tr>"
+
+        assert cached_fragment("rows", 1, [1, "asc"], render) == "<tr></tr>"
+        assert cached_fragment("rows", 1, [1, "asc"], render) == "<tr></tr>"
+        assert len(render_calls) == 1
+        assert fragment_stats() == {"hits": 1, "misses": 1}
+
+    def test_key_varies_on_user_and_arguments(self):
+        cached_fragment("rows", 1, [1], lambda: "a")
+        assert cached_fragment("rows", 2, [1], lambda: "b") == "b"
+        assert cached_fragment("rows", 1, [2], lambda: "c") == "c"
+        assert fragment_stats()["misses"] == 3
+
+    @pytest.mark.django_db
+    def test_bump_invalidates_only_that_user(
+        self, django_capture_on_commit_callbacks
+    ):
+        cached_fragment("rows", 1, [], lambda: "old")
+        cached_fragment("rows", 2, [], lambda: "other")
+        with django_capture_on_commit_callbacks(execute=True):
+            bump_data_version(1)
+        assert cached_fragment("rows", 1, [], lambda: "new") == "new"
+        assert cached_fragment("rows", 2, [], lambda: "changed") == "other"
+
+    @pytest.mark.django_db
+    def test_render_before_commit_keeps_old_version(
+        self, create_user, create_application,
+        django_capture_on_commit_callbacks,
+    ):
+        user = create_user()
+        with django_capture_on_commit_callbacks(execute=True):
+            with transaction.atomic():
+                create_application(user)
+                # rows rendered now may miss the uncommitted change
+                cached_fragment("rows", user.pk, [], lambda: "old")
+        assert cached_fragment("rows", user.pk, [], lambda: "new") == "new"
+
+    def test_reset_stats(self):
+        cached_fragment("rows", 1, [], lambda: "x")
+        reset_fragment_stats()
+        assert fragment_stats() == {"hits": 0, "misses": 0}
+
+
+@pytest.mark.django_db
+class TestCacheConfigUnit:
+
+    def test_locmem_for_one_worker(self, monkeypatch):
+        monkeypatch.delenv("CACHE_BACKEND", raising=False)
+        monkeypatch.setenv("WEB_CONCURRENCY", "1")
+        assert get_cache_config()["default"]["BACKEND"].endswith("LocMemCache")
+
+    def test_locmem_refused_for_many_workers(self, monkeypatch):
+        monkeypatch.delenv("CACHE_BACKEND", raising=False)
+        monkeypatch.setenv("WEB_CONCURRENCY", "4")
+        with pytest.raises(ImproperlyConfigured):
+            get_cache_config()
+        monkeypatch.setenv("CACHE_BACKEND", "file")
+        assert get_cache_config()["default"]["BACKEND"].endswith("FileBasedCache")
+
+
+@pytest.mark.django_db(transaction=True)
+class TestDataVersionSignalsUnit:
+
+    def test_application_save_and_delete(self, create_user, create_application):
+        user = create_user()
+        version = data_version(user.pk)
+        job_app = create_application(user)
+        assert data_version(user.pk) != version
+
+        version = data_version(user.pk)
+        job_app.delete()
+        assert data_version(user.pk) != version
+
+    def test_owner_change_bumps_both_users(self, create_user, create_application):
+        user, other = create_user(), create_user("anna")
+        job_app = create_application(user)
+        versions = data_version(user.pk), data_version(other.pk)
+
+        job_app.owner = other
+        job_app.save()
+        assert data_version(user.pk) != versions[0]
+        assert data_version(other.pk) != versions[1]
+
+    def test_details_and_resume_changes(self, create_user, create_application):
+        user = create_user()
+        job_app = create_application(user)
+
+        version = data_version(user.pk)
+        details = JobApplicationDetails.objects.create(job_application=job_app)
+        assert data_version(user.pk) != version
+
+        version = data_version(user.pk)
+        resume = Resume.objects.create(user=user, description="CV")
+        assert data_version(user.pk) != version
+
+        version = data_version(user.pk)
+        details.resume.add(resume)
+        assert data_version(user.pk) != version
+
+    def test_bulk_import_bumps_version(self, create_user):
+        user = create_user()
+        version = data_version(user.pk)
+        import_applications(user, [{
+            "job_name": "Backend", "company": "Acme", "country": "PL",
+            "city": "Łódź", "apply_date": "2025-01-01", "valid_to": "2025-02-01",
+            "portal": "NFJ", "link": "https://a.pl", "status": "applied",
+        }])
+        assert data_version(user.pk) != version
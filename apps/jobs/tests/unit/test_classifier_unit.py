@@ -0,0 +1,189 @@
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from apps.jobs import categories
+from apps.jobs.caching import data_version
+from apps.jobs.categories import (
+    categorize_resumes, get_classifier, predict_category, train_classifier,
+)
+from apps.jobs.extraction import backfill_text
+from apps.jobs.classifier import TfidfClassifier, tokenize
+from apps.jobs.models import Resume
+
+
+WORDS = {
+    "Engineering": "python django backend api sql docker developer",
+    "Finance": "accounting budget audit tax ledger invoices excel",
+    "Healthcare": "patient nurse clinical hospital care medical therapy",
+}
+
+
+def sample_texts(per_class: int = 10):
+    texts, labels = [], []
+    for label, words in WORDS.items():
+        words = words.split()
+        for i in range(per_class):
+            # rotate the words so no two documents are the same
+            texts.append(" ".join(words[i % 7:] + words[:i % 7] + ["team", "work"]))
+            labels.append(label)
+    return texts, labels
+
+
+def create_labelled(user, per_class: int = 10):
+    texts, labels = sample_texts(per_class)
+    Resume.objects.bulk_create(
+        Resume(user=user, description=text, job_title="", category=label)
+        for text, label in zip(texts, labels)
+    )
+
+
+class TestTfidfClassifierUnit:
+
+    def test_tokenize(self):
+        assert tokenize("Senior C# dev, 10 years; Python!") == [
+            "senior", "dev", "years", "python",
+        ]
+
+    def test_fit_and_predict(self):
+        model = TfidfClassifier.fit(*sample_texts())
+        assert model.predict([
+            "django api developer", "tax audit", "nurse in a hospital",
+        ]) == ["Engineering", "Finance", "Healthcare"]
+
+    def test_unknown_words_get_a_label(self):
+        model = TfidfClassifier.fit(*sample_texts())
+        assert model.predict(["", "zzz"])[0] in WORDS
+
+    def test_empty_batch(self):
+        assert TfidfClassifier.fit(*sample_texts()).predict([]) == []
+
+    def test_min_df_and_max_features(self):
+        model = TfidfClassifier.fit(*sample_texts(), max_features=5)
+        assert len(model.terms) == 5
+        assert "team" in model.terms
+
+    def test_save_and_load(self, tmp_path):
+        model = TfidfClassifier.fit(*sample_texts())
+        path = tmp_path / "model.npz"
+        model.save(str(path))
+        loaded = TfidfClassifier.load(str(path))
+        texts = sample_texts()[0]
+        assert loaded.predict(texts) == model.predict(texts)
+        assert loaded.terms == model.terms
+        assert list(tmp_path.iterdir()) == [path]
+
+
+class TestCategoriesUnit:
+    pytestmark = pytest.mark.django_db(transaction=False)
+
+    def test_no_model(self, create_user):
+        assert get_classifier() is None
+        resume = Resume.objects.create(user=create_user(), description="nurse")
+        assert resume.category == ""
+
+    def test_train_and_categorize_new_resume(self, create_user):
+        user = create_user()
+        create_labelled(user)
+        result = train_classifier(validation=0.2)
+        assert (result["resumes"], result["classes"]) == (30, 3)
+        assert result["accuracy"] == 1.0
+
+        resume = Resume.objects.create(
+            user=user, description="Clinical nurse", job_title="Nurse"
+        )
+        assert resume.category == "Healthcare"
+
+    def test_given_category_is_kept(self, create_user):
+        user = create_user()
+        create_labelled(user)
+        train_classifier(validation=0)
+        resume = Resume.objects.create(
+            user=user, description="python", category="Mine"
+        )
+        assert resume.category == "Mine"
+
+    def test_upload_is_categorized_by_its_text(
+        self, create_user, make_pdf, settings, tmp_path,
+        django_capture_on_commit_callbacks,
+    ):
+        settings.MEDIA_ROOT = tmp_path
+        settings.RESUME_EXTRACTION_MODE = "sync"
+        user = create_user()
+        create_labelled(user)
+        train_classifier(validation=0)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            resume = Resume.objects.create(
+                user=user,
+                description="cv.pdf",
+                job_title="CV",
+                file=SimpleUploadedFile(
+                    "cv.pdf", make_pdf(["Clinical nurse, patient care"])
+                ),
+            )
+            assert resume.category == ""  # scored once the text is there
+        resume.refresh_from_db()
+        assert resume.category == "Healthcare"
+
+    def test_backfill_categorizes_filled_resumes(
+        self, create_user, make_pdf, settings, tmp_path
+    ):
+        settings.MEDIA_ROOT = tmp_path
+        user = create_user()
+        create_labelled(user)
+        train_classifier(validation=0)
+        resume = Resume.objects.create(
+            user=user,
+            description="cv.pdf",
+            job_title="CV",
+            file=SimpleUploadedFile("cv.pdf", make_pdf(["Tax audit, budget"])),
+        )
+        Resume.objects.filter(pk=resume.pk).update(category="")
+
+        backfill_text(workers=1)
+        resume.refresh_from_db()
+        assert resume.category == "Finance"
+
+    def test_model_is_loaded_once(self, create_user):
+        create_labelled(create_user())
+        train_classifier(validation=0)
+        assert get_classifier() is get_classifier()
+        assert predict_category(Resume(description="audit")) == "Finance"
+
+    def test_needs_two_categories(self, create_user):
+        Resume.objects.create(user=create_user(), description="a", category="A")
+        with pytest.raises(ValueError):
+            train_classifier()
+
+    def test_backfill(self, create_user, django_capture_on_commit_callbacks):
+        user = create_user()
+        create_labelled(user)
+        train_classifier(validation=0)
+        Resume.objects.bulk_create(
+            Resume(user=user, description=text) for text in ["tax", "docker sql"]
+        )
+        version = data_version(user.pk)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            result = categorize_resumes(get_classifier(), batch_size=1)
+        assert (result["scanned"], result["updated"]) == (2, 2)
+        assert list(
+            Resume.objects.filter(description__in=["tax", "docker sql"])
+            .order_by("pk").values_list("category", flat=True)
+        ) == ["Finance", "Engineering"]
+        assert data_version(user.pk) != version
+
+    def test_backfill_bumps_versions_once_per_batch(self, create_user, monkeypatch):
+        user, other = create_user(), create_user("anna")
+        create_labelled(user)
+        train_classifier(validation=0)
+        Resume.objects.bulk_create(
+            Resume(user=owner, description="tax") for owner in [user, other, user]
+        )
+        bumps = []
+        monkeypatch.setattr(
+            categories, "bump_data_version", lambda *ids: bumps.append(set(ids))
+        )
+
+        categorize_resumes(get_classifier(), batch_size=2)
+        assert bumps == [{user.pk, other.pk}, {user.pk}]
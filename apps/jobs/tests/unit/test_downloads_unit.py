@@ -0,0 +1,58 @@
+import io
+
+import pytest
+
+from apps.jobs.downloads import (
+    CHUNK_SIZE, RangeNotSatisfiable, file_etag, iter_range, parse_range,
+)
+
+
+class TestParseRangeUnit:
+
+    @pytest.mark.parametrize("header, expected", [
+        ("bytes=0-99", (0, 99)),
+        ("bytes=100-", (100, 999)),
+        ("bytes=-100", (900, 999)),
+        ("bytes=-5000", (0, 999)),
+        ("bytes=900-5000", (900, 999)),
+        (None, None),
+        ("", None),
+        ("bytes=-", None),
+        ("bytes=0-1,5-6", None),
+        ("items=0-1", None),
+        ("bytes=50-10", None),
+    ])
+    def test_ranges(self, header, expected):
+        assert parse_range(header, 1000) == expected
+
+    @pytest.mark.parametrize("header", ["bytes=1000-", "bytes=-0", "bytes=2000-3000"])
+    def test_not_satisfiable(self, header):
+        with pytest.raises(RangeNotSatisfiable):
+            parse_range(header, 1000)
+
+
+class TestIterRangeUnit:
+
+    def test_reads_only_the_range_in_chunks(self):
+        data = bytes(range(256)) * 1024
+        file = io.BytesIO(data)
+        chunks = list(iter_range(file, 10, CHUNK_SIZE + 20))
+        assert [len(chunk) for chunk in chunks] == [CHUNK_SIZE, 11]
+        assert b"".join(chunks) == data[10:CHUNK_SIZE + 21]
+        assert file.closed
+
+
+class TestFileEtagUnit:
+
+    def test_blob_etag_is_its_hash(self, tmp_path):
+        sha = "ab" * 32
+        path = tmp_path / "cv.pdf"
+        path.write_bytes(b"x")
+        assert file_etag(f"resumes/blobs/ab/{sha}.pdf", path.stat()) == f'"{sha}"'
+
+    def test_named_file_etag_changes_with_the_file(self, tmp_path):
+        path = tmp_path / "cv.pdf"
+        path.write_bytes(b"x")
+        before = file_etag("resumes/cv.pdf", path.stat())
+        path.write_bytes(b"xy")
+        assert file_etag("resumes/cv.pdf", path.stat()) != before
@@ -0,0 +1,89 @@
+import pytest
+from django.db import connection
+
+from apps.jobs.duplicates import (
+    backfill_fingerprints, duplicate_groups, existing_fingerprints, find_duplicate,
+)
+from apps.jobs.models import JobApplication
+from apps.jobs.utils import application_fingerprint, canonical_link
+
+
+class TestCanonicalLinkUnit:
+
+    @pytest.mark.parametrize("url, expected", [
+        ("https://www.Example.com/jobs/42/", "example.com/jobs/42"),
+        ("http://example.com:80/jobs/42#apply", "example.com/jobs/42"),
+        ("https://example.com:8443/jobs/42", "example.com:8443/jobs/42"),
+        (
+            "https://example.com/jobs?b=2&utm_source=x&a=1&gclid=y",
+            "example.com/jobs?a=1&b=2",
+        ),
+        ("https://example.com/Jobs/42", "example.com/Jobs/42"),
+        ("", ""),
+        (None, ""),
+    ])
+    def test_canonical_link(self, url, expected):
+        assert canonical_link(url) == expected
+
+    def test_fingerprint_ignores_spelling(self):
+        assert application_fingerprint(
+            "https://www.example.com/job/?utm_medium=mail",
+            " ACME  sp. z o.o.",
+            "Python Developer",
+        ) == application_fingerprint(
+            "http://example.com/job", "acme sp. z o.o.", "python   developer"
+        )
+
+    def test_fingerprint_differs_per_posting(self):
+        assert application_fingerprint("https://a.pl/1", "Acme", "Dev") != \
+            application_fingerprint("https://a.pl/2", "Acme", "Dev")
+
+
+class TestDuplicatesUnit:
+    pytestmark = pytest.mark.django_db(transaction=False)
+
+    def test_fingerprint_set_on_save(self, create_user, create_application):
+        job_app = create_application(create_user(), link="https://a.pl/1")
+        assert job_app.fingerprint == application_fingerprint(
+            "https://a.pl/1", job_app.company, job_app.job_name
+        )
+
+        job_app.company = "Initech"
+        job_app.save(update_fields=["company"])
+        job_app.refresh_from_db()
+        assert job_app.fingerprint == application_fingerprint(
+            "https://a.pl/1", "Initech", job_app.job_name
+        )
+
+    def test_find_duplicate_of_own_applications(self, create_user, create_application):
+        user, other = create_user(), create_user("anna")
+        first = create_application(user, link="https://a.pl/1")
+        create_application(user, link="https://a.pl/1")
+        create_application(other, link="https://a.pl/2")
+
+        assert find_duplicate(user, first.fingerprint) == first
+        assert find_duplicate(other, first.fingerprint) is None
+        assert existing_fingerprints(user, [first.fingerprint, "x"]) == {
+            first.fingerprint: first.pk
+        }
+
+    @pytest.mark.skipif(connection.vendor != "sqlite", reason="SQLite query plan")
+    def test_lookup_uses_index(self, create_user):
+        plan = JobApplication.objects.filter(
+            owner=create_user(), fingerprint="x"
+        ).explain()
+        assert "jobapp_owner_fingerprint_idx" in plan
+
+    def test_backfill_and_groups(self, create_user, create_application):
+        user = create_user()
+        first = create_application(user, link="https://a.pl/1")
+        create_application(user, link="https://www.a.pl/1/")
+        create_application(user, link="https://a.pl/2")
+        JobApplication.objects.update(fingerprint="")
+
+        assert backfill_fingerprints(batch_size=2) == {"scanned": 3, "updated": 3}
+        assert backfill_fingerprints(batch_size=2) == {"scanned": 3, "updated": 0}
+        groups = list(duplicate_groups())
+        assert len(groups) == 1
+        assert groups[0]["owner_id"] == user.pk
+        assert (groups[0]["count"], groups[0]["first_id"]) == (2, first.pk)
@@ -0,0 +1,67 @@
+import csv
+import json
+import pytest
+
+from apps.jobs.export import EXPORT_FIELDS, iter_csv, iter_export_rows, iter_jsonl
+from apps.jobs.models import JobApplicationDetails, Resume
+
+
+class TestExportUnit:
+    pytestmark = pytest.mark.django_db(transaction=False)
+
+    @pytest.fixture
+    def user_with_history(self, create_user, create_application):
+        user = create_user()
+        with_details = create_application(user, job_name="Backend", city="Łódź")
+        details = JobApplicationDetails.objects.create(
+            job_application=with_details,
+            comments='said "maybe", call back',
+            salary_range="10-15k",
+        )
+        details.resume.add(
+            Resume.objects.create(user=user, description="a", file_name="a.pdf"),
+            Resume.objects.create(user=user, description="b", file_name="b.pdf"),
+        )
+        create_application(user, job_name="Frontend")
+        create_application(create_user("anna"), job_name="Not mine")
+        return user
+
+    def test_rows_include_details_and_resumes(self, user_with_history):
+        rows = list(iter_export_rows(user_with_history))
+        assert [row["job_name"] for row in rows] == ["Backend", "Frontend"]
+        assert rows[0]["salary_range"] == "10-15k"
+        assert rows[0]["resumes"] == ["a.pdf", "b.pdf"]
+        assert rows[1]["comments"] is None
+        assert rows[1]["resumes"] == []
+        assert list(rows[0]) == EXPORT_FIELDS
+
+    def test_resume_without_file_name_goes_by_description(
+        self, create_user, create_application
+    ):
+        user = create_user()
+        details = JobApplicationDetails.objects.create(
+            job_application=create_application(user)
+        )
+        details.resume.add(Resume.objects.create(user=user, description="My CV"))
+        assert next(iter_export_rows(user))["resumes"] == ["My CV"]
+
+    def test_resumes_are_fetched_per_batch(
+        self, user_with_history, django_assert_max_num_queries
+    ):
+        # one cursor for the applications plus one resume query per batch
+        with django_assert_max_num_queries(3):
+            list(iter_export_rows(user_with_history, chunk_size=1))
+
+    def test_csv(self, user_with_history):
+        lines = "".join(iter_csv(iter_export_rows(user_with_history)))
+        rows = list(csv.DictReader(lines.splitlines()))
+        assert rows[0]["comments"] == 'said "maybe", call back'
+        assert rows[0]["resumes"] == "a.pdf;b.pdf"
+        assert rows[0]["city"] == "Łódź"
+
+    def test_jsonl(self, user_with_history):
+        lines = list(iter_jsonl(iter_export_rows(user_with_history)))
+        record = json.loads(lines[0])
+        assert len(lines) == 2
+        assert record["resumes"] == ["a.pdf", "b.pdf"]
+        assert record["apply_date"].count("-") == 2
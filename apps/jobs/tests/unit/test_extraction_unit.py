@@ -0,0 +1,151 @@
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from apps.jobs import extraction, signals
+from apps.jobs.extraction import backfill_text, imap_ordered
+from apps.jobs.models import Resume, SearchDocument
+from apps.jobs.pdf import extract_pdf_text
+
+
+MALFORMED_PDF = (
+    b"%PDF-1.3\n"
+    b"1 0 obj\n<< /Type /Catalog /Pages 2 0 R >>\nendobj\n"
+    b"2 0 obj\n<< /Type /Pages /Count 1 /Kids [ 3 0 R ] >>\nendobj\n"
+    b"3 0 obj\n<< /Type /Page /Parent 2 0 R /Contents 4 0 R >>\nendobj\n"
+    b"4 0 obj\n<< /Length 10 >>\nstream\nBT 1 Tj ET\nendstream\nendobj\n"
+    b"trailer\n<< /Root 1 0 R >>\nstartxref\n0\n%%EOF\n"
+)
+
+
+@pytest.fixture
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    return tmp_path
+
+
+def make_resume(user, content, **kwargs):
+    return Resume.objects.create(
+        user=user,
+        description="CV",
+        job_title="Dev",
+        file=SimpleUploadedFile("cv.pdf", content, content_type="application/pdf"),
+        **kwargs,
+    )
+
+
+class TestExtractPdfTextUnit:
+
+    def test_text_and_pages(self, make_pdf, tmp_path):
+        path = tmp_path / "cv.pdf"
+        path.write_bytes(make_pdf(["Jan Kowalski", "Python developer"]))
+        assert extract_pdf_text(str(path)) == ("Jan Kowalski\nPython developer", 2)
+
+    def test_broken_file(self, tmp_path):
+        path = tmp_path / "cv.pdf"
+        path.write_bytes(b"not a pdf")
+        assert extract_pdf_text(str(path)) == ("", 0)
+
+    @pytest.mark.parametrize("parent", [b"/Parent 2", b"/Parent 2 2 R"])
+    def test_malformed_file(self, tmp_path, parent):
+        # pypdf raises TypeError / AttributeError here, not PdfReadError
+        path = tmp_path / "cv.pdf"
+        path.write_bytes(MALFORMED_PDF.replace(b"/Parent 2 0 R", parent))
+        assert extract_pdf_text(str(path)) == ("", 0)
+
+
+class TestScheduleExtractionUnit:
+    pytestmark = pytest.mark.django_db(transaction=False)
+
+    def test_sync_mode_fills_summary_after_commit(
+        self, create_user, make_pdf, media_root, settings,
+        django_capture_on_commit_callbacks,
+    ):
+        settings.RESUME_EXTRACTION_MODE = "sync"
+        with django_capture_on_commit_callbacks(execute=True):
+            resume = make_resume(create_user(), make_pdf(["Senior Django developer"]))
+        resume.refresh_from_db()
+        assert resume.summary == "Senior Django developer"
+        assert "Senior Django developer" in SearchDocument.objects.get(
+            kind="resume", object_id=resume.pk
+        ).body
+
+    def test_background_mode_only_submits(
+        self, create_user, make_pdf, media_root, settings, monkeypatch,
+        django_capture_on_commit_callbacks,
+    ):
+        submitted = []
+
+        class Executor:
+            def submit(self, func, *args):
+                submitted.append(args)
+                return type("Future", (), {"add_done_callback": lambda s, f: None})()
+
+        settings.RESUME_EXTRACTION_MODE = "background"
+        monkeypatch.setattr(extraction, "get_executor", lambda: Executor())
+        with django_capture_on_commit_callbacks(execute=True):
+            resume = make_resume(create_user(), make_pdf(["Text"]))
+        assert submitted == [(resume.file.path,)]
+        resume.refresh_from_db()
+        assert resume.summary is None
+
+    def test_existing_summary_is_kept(
+        self, create_user, make_pdf, media_root, settings, monkeypatch,
+        django_capture_on_commit_callbacks,
+    ):
+        settings.RESUME_EXTRACTION_MODE = "sync"
+        monkeypatch.setattr(signals, "schedule_extraction", pytest.fail)
+        with django_capture_on_commit_callbacks(execute=True):
+            resume = make_resume(create_user(), make_pdf(["Text"]), summary="Mine")
+        resume.refresh_from_db()
+        assert resume.summary == "Mine"
+
+
+class TestBackfillTextUnit:
+    pytestmark = pytest.mark.django_db(transaction=False)
+
+    def test_fills_missing_text_in_batches(
+        self, create_user, make_pdf, media_root
+    ):
+        user = create_user()
+        resumes = [
+            make_resume(user, make_pdf([f"Resume {i}", "page two"]))
+            for i in range(5)
+        ]
+        make_resume(user, make_pdf(["Ignored"]), summary="Written by hand")
+        Resume.objects.create(user=user, description="No file")
+
+        result = backfill_text(batch_size=2, workers=2)
+        assert result["scanned"] == result["filled"] == 5
+        assert result["pages"] == 10
+        summaries = dict(Resume.objects.values_list("pk", "summary"))
+        for i, resume in enumerate(resumes):
+            assert summaries[resume.pk] == f"Resume {i}\npage two"
+        assert "Written by hand" in summaries.values()
+        assert SearchDocument.objects.filter(
+            kind="resume", body__contains="page two"
+        ).count() == 5
+        assert backfill_text(workers=1)["scanned"] == 0
+
+
+class TestImapOrderedUnit:
+
+    def test_inline_keeps_order(self):
+        assert list(imap_ordered(abs, [-3, 1, -2])) == [3, 1, 2]
+
+    def test_pool_keeps_order(self):
+        assert list(imap_ordered(abs, range(-20, 0), workers=2)) == list(
+            range(20, 0, -1)
+        )
+
+    def test_input_is_read_lazily(self):
+        consumed = []
+
+        def items():
+            for i in range(100):
+                consumed.append(i)
+                yield -i
+
+        results = imap_ordered(abs, items(), workers=2, window=3)
+        assert [next(results), next(results)] == [0, 1]
+        assert len(consumed) <= 5
+        results.close()
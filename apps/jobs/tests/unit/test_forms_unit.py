@@ -0,0 +1,58 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.jobs.forms import JobApplicationDetailsForm
+from apps.jobs.models import Resume
+
+
+DETAILS = {"job_application_body": "Python", "comments": "-", "salary_range": "10k"}
+
+
+class TestJobApplicationDetailsFormUnit:
+    pytestmark = pytest.mark.django_db(transaction=False)
+
+    def test_building_the_form_reads_no_resumes(self, create_user):
+        user = create_user()
+        with CaptureQueriesContext(connection) as queries:
+            JobApplicationDetailsForm(user=user).as_p()
+        assert len(queries) == 0
+
+    def test_own_resume_is_one_exists_query(self, create_user):
+        user = create_user()
+        resume = Resume.objects.create(user=user, description="CV")
+
+        form = JobApplicationDetailsForm(
+            data={**DETAILS, "resume": resume.pk}, user=user
+        )
+        with CaptureQueriesContext(connection) as queries:
+            assert form.is_valid()
+        assert len(queries) == 1
+        assert "LIMIT 1" in queries[0]["sql"]
+        assert form.cleaned_data["resume"] == resume.pk
+
+    def test_other_users_resume_is_rejected(self, create_user):
+        user = create_user()
+        resume = Resume.objects.create(user=create_user("anna"), description="CV")
+        form = JobApplicationDetailsForm(
+            data={**DETAILS, "resume": resume.pk}, user=user
+        )
+        assert not form.is_valid()
+        assert "resume" in form.errors
+
+    @pytest.mark.parametrize("value, expected", [
+        ("", None),
+        ("upload_new", "upload_new"),
+    ])
+    def test_no_resume_or_upload(self, create_user, value, expected):
+        form = JobApplicationDetailsForm(
+            data={**DETAILS, "resume": value}, user=create_user()
+        )
+        assert form.is_valid()
+        assert form.cleaned_data["resume"] == expected
+
+    def test_garbage_is_rejected(self, create_user):
+        form = JobApplicationDetailsForm(
+            data={**DETAILS, "resume": "1 OR 1"}, user=create_user()
+        )
+        assert not form.is_valid()
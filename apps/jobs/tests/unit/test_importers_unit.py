@@ -0,0 +1,128 @@
+import io
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.jobs.importers import import_applications, read_csv
+from apps.jobs.models import ApplicationStat, JobApplication, SearchDocument
+
+CSV = """job_name,company,country,city,apply_date,valid_to,portal,link,status,comments
+Python developer,Acme,PL,Kraków,2025-01-10,2025-02-10,LinkedIn,https://a.pl,applied,Ola
+Data analyst,Initech,PL,Łódź,2025-01-11,2025-02-11,JustJoin,https://b.pl,interview,
+Broken row,,PL,Łódź,not-a-date,2025-02-11,JustJoin,https://c.pl,applied,
+Tester,Globex,PL,Łódź,2025-01-12,2025-02-12,JustJoin,https://d.pl,nonsense,
+"""
+
+
+def application_row(**kwargs):
+    row = {
+        "job_name": "Backend",
+        "company": "Acme",
+        "country": "PL",
+        "city": "Warszawa",
+        "apply_date": "2025-01-01",
+        "valid_to": "2025-02-01",
+        "portal": "LinkedIn",
+        "link": "https://example.com/job",
+        "status": "applied",
+    }
+    row.update(kwargs)
+    return row
+
+
+def rows():
+    return read_csv(io.StringIO(CSV))
+
+
+class TestImportApplicationsUnit:
+    pytestmark = pytest.mark.django_db(transaction=False)
+
+    def test_valid_rows_imported_and_errors_reported(self, create_user):
+        user = create_user()
+        result = import_applications(user, rows(), batch_size=1)
+
+        assert result.created == 2
+        assert [line for line, _ in result.errors] == [4, 5]
+        assert set(result.errors[0][1]) == {"company", "apply_date"}
+        assert set(result.errors[1][1]) == {"status"}
+
+        job_apps = JobApplication.objects.filter(owner=user).order_by("apply_date")
+        assert [a.job_name for a in job_apps] == ["Python developer", "Data analyst"]
+        assert [list(a.user.all()) for a in job_apps] == [[user], [user]]
+        assert job_apps[0].details.comments == "Ola"
+        assert not hasattr(job_apps[1], "details")
+
+    def test_stats_and_search_follow_import(self, create_user):
+        user = create_user()
+        import_applications(user, rows())
+        assert ApplicationStat.objects.get(
+            user=user, dimension="company", value="Acme"
+        ).count == 1
+        assert SearchDocument.objects.filter(user=user).count() == 2
+
+    def test_strict_rolls_back(self, create_user):
+        user = create_user()
+        result = import_applications(user, rows(), strict=True)
+        assert result.created == 0
+        assert len(result.errors) == 2
+        assert not JobApplication.objects.exists()
+
+    def test_batched_inserts(self, create_user):
+        user = create_user()
+
+        def count_queries(total):
+            rows = [
+                application_row(job_name=f"Job {i}", comments="note")
+                for i in range(total)
+            ]
+            with CaptureQueriesContext(connection) as queries:
+                result = import_applications(user, rows)
+            assert result.created == total
+            return len(queries)
+
+        count_queries(1)  # creates the stat rows the later imports update
+        # a handful of extra INSERTs where the backend caps query parameters
+        assert count_queries(200) - count_queries(20) <= 5
+
+    def test_queries_flat_in_rows(self, create_user):
+        user = create_user()
+
+        def count_queries(total):
+            # no details on odd rows, new stat values on every row
+            rows = [
+                application_row(
+                    job_name=f"Job {total} {i}", company=f"Company {total} {i}",
+                    **({"comments": "note"} if i % 2 == 0 else {}),
+                )
+                for i in range(total)
+            ]
+            with CaptureQueriesContext(connection) as queries:
+                result = import_applications(user, rows)
+            assert result.created == total
+            return len(queries)
+
+        assert count_queries(50) == count_queries(5)
+
+    def test_duplicates_flagged(self, create_user, create_application):
+        user = create_user()
+        create_application(user, job_name="Backend", company="Acme",
+                           link="https://example.com/job")
+        result = import_applications(user, [
+            application_row(company=" ACME ", link="https://www.example.com/job/"),
+            application_row(job_name="Frontend"),
+            application_row(job_name="frontend"),
+        ], batch_size=2)
+        assert result.duplicates == [2, 4]
+        assert result.created == 3
+
+    def test_skip_duplicates(self, create_user, create_application):
+        user = create_user()
+        create_application(user, job_name="Backend", company="Acme",
+                           link="https://example.com/job")
+        result = import_applications(user, [
+            application_row(), application_row(job_name="Frontend"),
+            application_row(job_name="Frontend"),
+        ], skip_duplicates=True)
+        assert result.duplicates == [2, 4]
+        assert result.created == 1
+        assert JobApplication.objects.filter(owner=user).count() == 2
@@ -0,0 +1,181 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from apps.jobs.loaders import (
+    Checkpoint, build_dataset_cache, count_rows, dataset_cache_source,
+    iter_cached_rows, iter_sampled_rows, load_resumes, open_dataset_cache,
+    sample_positions,
+)
+from apps.jobs.models import Resume
+from apps.jobs.search import SearchDocument
+
+
+ROWS = 23
+
+
+def render(html: str) -> bytes:
+    return b"%PDF-1.4 " + html.encode()
+
+
+@pytest.fixture
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path / "media"
+    return settings.MEDIA_ROOT
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    path = tmp_path / "Resume.csv"
+    pd.DataFrame({
+        "ID": range(ROWS),
+        "Resume_str": [f"  DATA ENGINEER  Summary of row {i}" for i in range(ROWS)],
+        "Resume_html": [f"<p>row {i}</p>" for i in range(ROWS)],
+        "Category": ["ENGINEERING" if i % 2 else "HR" for i in range(ROWS)],
+    }).to_csv(path, index=False)
+    return str(path)
+
+
+@pytest.fixture
+def dataset_cache(dataset, tmp_path):
+    path = str(tmp_path / "cache" / "resumes.arrow")
+    build_dataset_cache(dataset, path, chunksize=5)
+    return path
+
+
+class TestSamplingUnit:
+
+    def test_count_rows(self, dataset):
+        assert count_rows(dataset, chunksize=5) == ROWS
+
+    def test_positions_depend_on_seed_only(self):
+        first = sample_positions(ROWS, 10, seed=7)
+        assert list(first) == list(sample_positions(ROWS, 10, seed=7))
+        assert list(first) == sorted(set(first))
+        assert list(first) != list(sample_positions(ROWS, 10, seed=8))
+
+    def test_more_than_the_dataset(self):
+        with pytest.raises(ValueError):
+            sample_positions(ROWS, ROWS + 1, seed=7)
+
+    @pytest.mark.parametrize("chunksize", [1, 4, 5, ROWS, 100])
+    def test_chunks_yield_the_sampled_rows(self, dataset, chunksize):
+        positions = np.array([0, 4, 5, 9, 22])
+        rows = list(iter_sampled_rows(dataset, positions, chunksize))
+        assert [position for position, _ in rows] == [0, 4, 5, 9, 22]
+        assert [row.Resume_html for _, row in rows] == [
+            f"<p>row {i}</p>" for i in [0, 4, 5, 9, 22]
+        ]
+
+
+class TestDatasetCacheUnit:
+
+    def test_build(self, dataset, tmp_path):
+        path = str(tmp_path / "resumes.arrow")
+        result = build_dataset_cache(dataset, path, chunksize=5)
+
+        assert result["rows"] == ROWS
+        assert result["size"] > 0
+        assert dataset_cache_source(path) == dataset
+        table = open_dataset_cache(path)
+        assert table.num_rows == ROWS
+        assert table.column_names == ["Resume_str", "Resume_html", "Category"]
+        assert not (tmp_path / "resumes.arrow.tmp").exists()
+
+    @pytest.mark.parametrize("chunksize", [1, 2, 100])
+    def test_takes_the_sampled_rows(self, dataset_cache, chunksize):
+        table = open_dataset_cache(dataset_cache)
+        rows = list(iter_cached_rows(table, np.array([0, 4, 5, 22]), chunksize))
+        assert [position for position, _ in rows] == [0, 4, 5, 22]
+        assert [row.Resume_html for _, row in rows] == [
+            f"<p>row {i}</p>" for i in [0, 4, 5, 22]
+        ]
+
+
+@pytest.mark.django_db
+class TestLoadResumesUnit:
+
+    def test_creates_resumes_in_batches(
+        self, dataset, media_root, create_user
+    ):
+        users = [create_user("jan"), create_user("ola")]
+        progress = []
+        result = load_resumes(
+            dataset, 10, batch_size=4, seed=1, render=render, progress=progress.append
+        )
+
+        assert result["created"] == 10
+        assert progress == [4, 8, 10]
+        resumes = list(Resume.objects.order_by("pk"))
+        assert len(resumes) == 10
+        assert {resume.user_id for resume in resumes} <= {user.pk for user in users}
+        assert resumes[0].category in ("Engineering", "Hr")
+        assert resumes[0].job_title.strip() == "Data Engineer"
+        assert resumes[0].file.read().startswith(b"%PDF-1.4 <p>row ")
+        assert SearchDocument.objects.filter(kind="resume").count() == 10
+
+    def test_same_seed_same_rows(self, dataset, media_root, create_user):
+        create_user()
+        load_resumes(dataset, 6, batch_size=4, seed=3, render=render)
+        names = sorted(Resume.objects.values_list("file_name", flat=True))
+        Resume.objects.all().delete()
+        load_resumes(dataset, 6, batch_size=5, seed=3, render=render)
+        assert sorted(Resume.objects.values_list("file_name", flat=True)) == names
+
+    def test_cache_gives_the_same_resumes(
+        self, dataset, dataset_cache, media_root, create_user
+    ):
+        create_user()
+        fields = ("file_name", "job_title", "category", "description")
+        load_resumes(dataset, 7, batch_size=3, seed=2, render=render)
+        from_csv = sorted(Resume.objects.values_list(*fields))
+        Resume.objects.all().delete()
+        load_resumes(dataset_cache, 7, batch_size=3, seed=2, render=render)
+        assert sorted(Resume.objects.values_list(*fields)) == from_csv
+
+    def test_interrupted_run_resumes(self, dataset, media_root, create_user, tmp_path):
+        create_user()
+        checkpoint = str(tmp_path / "progress.json")
+        rendered = []
+
+        def flaky(html):
+            if len(rendered) == 9:
+                raise RuntimeError("renderer died")
+            rendered.append(html)
+            return render(html)
+
+        with pytest.raises(RuntimeError):
+            load_resumes(
+                dataset, 15, batch_size=4, seed=5,
+                checkpoint_path=checkpoint, render=flaky,
+            )
+        assert Resume.objects.count() == 8  # two committed batches
+        with open(checkpoint) as file:
+            assert json.load(file)["done"] == 8
+
+        result = load_resumes(
+            dataset, 15, batch_size=4, seed=5, checkpoint_path=checkpoint, render=render
+        )
+        assert result == {"created": 7, "skipped": 8, "seconds": result["seconds"]}
+        names = list(Resume.objects.values_list("file_name", flat=True))
+        assert len(names) == len(set(names)) == 15
+        assert not (tmp_path / "progress.json").exists()
+
+    def test_checkpoint_of_other_run_is_ignored(
+        self, dataset, media_root, create_user, tmp_path
+    ):
+        create_user()
+        checkpoint = str(tmp_path / "progress.json")
+        Checkpoint(checkpoint, {"filepath": dataset, "total": 6, "seed": 0}).save(4)
+
+        result = load_resumes(
+            dataset, 6, batch_size=4, seed=9, checkpoint_path=checkpoint, render=render
+        )
+        assert result["skipped"] == 0
+        assert Resume.objects.count() == 6
+
+    def test_no_users(self, dataset, media_root):
+        with pytest.raises(ValueError):
+            load_resumes(dataset, 2, render=render)
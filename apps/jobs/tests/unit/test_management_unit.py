@@ -0,0 +1,212 @@
+import pytest
+from datetime import timedelta
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command, CommandError
+from django.utils import timezone
+
+from apps.jobs.caching import cached_fragment, fragment_stats
+from apps.jobs.models import ApplicationStat, Resume, ResumeUpload
+from apps.jobs.uploads import start_upload
+
+
+class TestRebuildApplicationStatsUnit:
+    pytestmark = pytest.mark.django_db(transaction=False)
+
+    def test_rebuild_repairs_stats(self, create_user, create_application):
+        user = create_user()
+        create_application(user)
+        ApplicationStat.objects.all().delete()
+
+        call_command("rebuild_application_stats")
+        assert ApplicationStat.objects.get(
+            user=user, dimension="status", value="applied"
+        ).count == 1
+
+    def test_rebuild_single_user(self, create_user, create_application):
+        user, other = create_user(), create_user("anna")
+        create_application(user)
+        create_application(other)
+        ApplicationStat.objects.all().delete()
+
+        call_command("rebuild_application_stats", user=["anna"])
+        assert not ApplicationStat.objects.filter(user=user).exists()
+        assert ApplicationStat.objects.filter(user=other).exists()
+
+    def test_unknown_user(self):
+        with pytest.raises(CommandError):
+            call_command("rebuild_application_stats", user=["nobody"])
+
+
+class TestImportApplicationsUnit:
+    pytestmark = pytest.mark.django_db(transaction=False)
+
+    def test_import_from_csv(self, create_user, tmp_path, capsys):
+        user = create_user()
+        path = tmp_path / "applications.csv"
+        path.write_text(
+            "job_name,company,country,city,apply_date,valid_to,portal,link,status\n"
+            "Backend,Acme,PL,Łódź,2025-01-01,2025-02-01,NFJ,https://a.pl,applied\n"
+            "Frontend,Acme,PL,Łódź,yesterday,2025-02-01,NFJ,https://b.pl,applied\n",
+            encoding="utf-8",
+        )
+        call_command("import_applications", "jan", str(path))
+        captured = capsys.readouterr()
+        assert "Imported 1 job applications, 1 rows rejected" in captured.out
+        assert "Line 3, apply_date" in captured.err
+        assert user.owned_job_applications.count() == 1
+
+    def test_not_utf8(self, create_user, tmp_path):
+        create_user()
+        path = tmp_path / "applications.csv"
+        path.write_bytes("job_name,city\nBackend,Łódź\n".encode("cp1250"))
+        with pytest.raises(CommandError, match="UTF-8"):
+            call_command("import_applications", "jan", str(path))
+
+    def test_unknown_user(self, tmp_path):
+        with pytest.raises(CommandError):
+            call_command("import_applications", "nobody", str(tmp_path / "x.csv"))
+
+
+class TestFragmentCacheStatsUnit:
+
+    def test_report_and_reset(self, capsys):
+        cached_fragment("rows", 1, [], lambda: "x")
+        cached_fragment("rows", 1, [], lambda: "x")
+
+        call_command("fragment_cache_stats", reset=True)
+        assert "1 hits, 1 misses (50.0% hit rate)" in capsys.readouterr().out
+        assert fragment_stats() == {"hits": 0, "misses": 0}
+
+
+class TestDedupResumesUnit:
+    pytestmark = pytest.mark.django_db(transaction=False)
+
+    def test_dry_run(self, create_user, settings, tmp_path, capsys):
+        settings.MEDIA_ROOT = tmp_path
+        user = create_user()
+        for _ in range(2):
+            Resume.objects.create(
+                user=user, description="CV", job_title="Dev",
+                file=SimpleUploadedFile("cv.pdf", b"%PDF-1.4"),
+            )
+
+        call_command("dedup_resumes", dry_run=True)
+        assert "Scanned 2 files, 1 duplicates. Would free 8 bytes." in \
+            capsys.readouterr().out
+
+
+class TestCleanResumeUploadsUnit:
+    pytestmark = pytest.mark.django_db(transaction=False)
+
+    def test_reports_removed_uploads(self, create_user, settings, tmp_path, capsys):
+        settings.MEDIA_ROOT = tmp_path
+        upload = start_upload(create_user(), "cv.pdf", 10)
+        ResumeUpload.objects.update(updated_at=timezone.now() - timedelta(hours=3))
+
+        call_command("clean_resume_uploads", hours=2)
+        assert "Removed 1 stale uploads, 0 bytes." in capsys.readouterr().out
+        assert not (tmp_path / upload.path).exists()
+
+
+class TestExtractResumeTextUnit:
+    pytestmark = pytest.mark.django_db(transaction=False)
+
+    def test_reports_throughput(
+        self, create_user, make_pdf, settings, tmp_path, capsys
+    ):
+        settings.MEDIA_ROOT = tmp_path
+        Resume.objects.create(
+            user=create_user(), description="CV", job_title="Dev",
+            file=SimpleUploadedFile("cv.pdf", make_pdf(["One", "Two"])),
+        )
+
+        call_command("extract_resume_text", workers=1)
+        out = capsys.readouterr().out
+        assert "Extracted text of 1 of 1 resumes, 2 pages" in out
+        assert "pages/sec" in out
+
+
+class TestRenderResumeThumbnailsUnit:
+    pytestmark = pytest.mark.django_db(transaction=False)
+
+    def test_reports_counts(self, create_user, make_pdf, settings, tmp_path, capsys):
+        settings.MEDIA_ROOT = tmp_path
+        resume = Resume.objects.create(
+            user=create_user(), description="CV", job_title="Dev",
+            file=SimpleUploadedFile("cv.pdf", make_pdf(["One"])),
+        )
+
+        call_command("render_resume_thumbnails", workers=1)
+        assert "Checked 1 resumes, 1 previews updated" in capsys.readouterr().out
+        resume.refresh_from_db()
+        assert resume.thumbnail
+
+
+class TestResumeClassifierCommandsUnit:
+    pytestmark = pytest.mark.django_db(transaction=False)
+
+    def test_train_then_categorize(self, create_user, capsys):
+        user = create_user()
+        Resume.objects.bulk_create(
+            Resume(user=user, description=text, category=category)
+            for text, category in [
+                ("python developer", "Engineering"),
+                ("django developer", "Engineering"),
+                ("tax accountant", "Finance"),
+                ("tax audit", "Finance"),
+                ("tax", ""),
+            ]
+        )
+
+        call_command("train_resume_classifier", validation=0)
+        assert "Trained on 4 resumes, 2 categories" in capsys.readouterr().out
+        call_command("categorize_resumes")
+        assert "Categorized 1 resumes" in capsys.readouterr().out
+        assert Resume.objects.get(description="tax").category == "Finance"
+
+    def test_categorize_without_model(self):
+        with pytest.raises(CommandError):
+            call_command("categorize_resumes")
+
+
+class TestFindDuplicateApplicationsUnit:
+    pytestmark = pytest.mark.django_db(transaction=False)
+
+    def test_reports_groups(self, create_user, create_application, capsys):
+        user = create_user()
+        create_application(user, link="https://a.pl/1")
+        create_application(user, link="https://a.pl/1?utm_source=mail")
+        create_application(user, link="https://a.pl/2")
+
+        call_command("find_duplicate_applications", batch_size=1)
+        out = capsys.readouterr().out
+        assert "jan: Python Developer at Acme, 2 applications" in out
+        assert "Found 1 postings applied to more than once" in out
+
+
+class TestLoadResumesUnit:
+    pytestmark = pytest.mark.django_db(transaction=False)
+
+    def test_more_than_the_dataset(self, create_user, tmp_path):
+        create_user()
+        dataset = tmp_path / "Resume.csv"
+        dataset.write_text("ID,Resume_str,Resume_html,Category\n1,CV,<p>CV</p>,HR\n")
+
+        with pytest.raises(CommandError, match="only 1 rows"):
+            call_command(
+                "load_resumes", 2, filepath=str(dataset),
+                checkpoint=str(tmp_path / "progress.json"),
+            )
+        assert not Resume.objects.exists()
+
+
+class TestCacheResumeDatasetUnit:
+
+    def test_builds_the_cache(self, tmp_path, capsys):
+        dataset = tmp_path / "Resume.csv"
+        dataset.write_text("ID,Resume_str,Resume_html,Category\n1,CV,<p>CV</p>,HR\n")
+        output = tmp_path / "resumes.arrow"
+
+        call_command("cache_resume_dataset", source=str(dataset), output=str(output))
+        assert output.exists()
+        assert "Cached 1 resumes" in capsys.readouterr().out
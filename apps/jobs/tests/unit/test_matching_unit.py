@@ -0,0 +1,84 @@
+import pytest
+
+from apps.jobs import matching
+from apps.jobs.matching import rank_resumes, resume_vectors
+from apps.jobs.models import Resume
+
+
+pytestmark = pytest.mark.django_db(transaction=False)
+
+
+@pytest.fixture
+def resumes(create_user):
+    user = create_user()
+    return user, [
+        Resume.objects.create(
+            user=user, description="Backend", job_title="Python developer",
+            summary="Django REST APIs, PostgreSQL, Docker",
+        ),
+        Resume.objects.create(
+            user=user, description="Accounting", job_title="Accountant",
+            summary="Tax returns, audits and budgets",
+        ),
+        Resume.objects.create(
+            user=user, description="Frontend", job_title="JavaScript developer",
+            summary="React, TypeScript, CSS",
+        ),
+    ]
+
+
+class TestRankResumesUnit:
+
+    def test_best_match_first(self, resumes):
+        user, (backend, accounting, frontend) = resumes
+        ranking = rank_resumes(user.pk, "Senior Python developer, Django, Docker")
+        assert [pk for pk, _ in ranking] == [backend.pk, frontend.pk]
+        assert 0 < ranking[1][1] < ranking[0][1] <= 1
+
+    def test_limit(self, resumes):
+        user, (backend, _, _) = resumes
+        assert rank_resumes(user.pk, "developer django", limit=1)[0][0] == backend.pk
+
+    def test_no_match(self, resumes):
+        user, _ = resumes
+        assert rank_resumes(user.pk, "gardener") == []
+        assert rank_resumes(user.pk, "") == []
+
+    def test_only_own_resumes(self, resumes, create_user):
+        assert rank_resumes(create_user("anna").pk, "python developer") == []
+
+
+class TestResumeVectorsCacheUnit:
+
+    def test_built_once(self, resumes, monkeypatch):
+        user, _ = resumes
+        vectors = resume_vectors(user.pk)
+        monkeypatch.setattr(
+            matching.ResumeVectors, "build", pytest.fail, raising=True
+        )
+        assert resume_vectors(user.pk) is vectors
+
+    def test_shared_cache_after_process_restart(self, resumes, monkeypatch):
+        user, _ = resumes
+        vectors = resume_vectors(user.pk)
+        monkeypatch.setattr(matching, "_local", type(matching._local)())
+        monkeypatch.setattr(matching.ResumeVectors, "build", pytest.fail)
+        restored = resume_vectors(user.pk)
+        assert restored is not vectors
+        assert restored.vocabulary == vectors.vocabulary
+
+    def test_rebuilt_when_resumes_change(
+        self, resumes, django_capture_on_commit_callbacks
+    ):
+        user, (backend, _, _) = resumes
+        resume_vectors(user.pk)
+        backend.summary = "Kubernetes"
+        with django_capture_on_commit_callbacks(execute=True):
+            backend.save()
+        assert rank_resumes(user.pk, "kubernetes")[0][0] == backend.pk
+
+    def test_kept_when_applications_change(self, resumes, create_application):
+        user, _ = resumes
+        vectors = resume_vectors(user.pk)
+        create_application(user)
+        assert resume_vectors(user.pk) is vectors
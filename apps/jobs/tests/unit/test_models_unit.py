@@ -0,0 +1,74 @@
+import pytest
+from datetime import date, timedelta
+from django.db import connection
+
+from apps.jobs.models import JobApplication
+
+
+class TestJobApplicationQuerySetUnit:
+    pytestmark = pytest.mark.django_db(transaction=False)
+
+    @pytest.mark.parametrize("days", [-30, -1, 0, 1, 45])
+    def test_valid_days_annotation_matches_property(
+        self, create_user, create_application, days
+    ):
+        job_app = create_application(
+            create_user(), valid_to=date.today() + timedelta(days=days)
+        )
+        annotated = JobApplication.objects.with_valid_days().get(pk=job_app.pk)
+        assert annotated.remaining_days == job_app.valid_days == max(days, 0)
+
+    def test_expiring_within_is_inclusive_range(self, create_user, create_application):
+        user = create_user()
+        today = date.today()
+        inside = [
+            create_application(user, valid_to=today + timedelta(days=days))
+            for days in (0, 7)
+        ]
+        for days in (-1, 8):
+            create_application(user, valid_to=today + timedelta(days=days))
+        found = JobApplication.objects.expiring_within(7).order_by("valid_to")
+        assert list(found) == inside
+
+
+@pytest.mark.skipif(connection.vendor != "sqlite", reason="SQLite query plan")
+class TestOwnerMirrorUnit:
+    pytestmark = pytest.mark.django_db(transaction=False)
+
+    def test_owner_added_to_users(self, create_user):
+        user = create_user()
+        job_app = JobApplication.objects.create(
+            owner=user, job_name="Dev", company="Acme",
+            apply_date=date.today(), valid_to=date.today(),
+        )
+        assert list(job_app.user.all()) == [user]
+
+    def test_new_owner_replaces_the_old(self, create_user, create_application):
+        jan, ola = create_user("jan"), create_user("ola")
+        job_app = create_application(jan)
+        job_app.owner = ola
+        job_app.save()
+        assert list(job_app.user.all()) == [ola]
+
+    def test_owner_cannot_be_removed_from_users(
+        self, create_user, create_application
+    ):
+        jan, ola = create_user("jan"), create_user("ola")
+        job_app = create_application(jan)
+        job_app.user.set([ola])
+        assert set(job_app.user.all()) == {jan, ola}
+        job_app.user.clear()
+        assert list(job_app.user.all()) == [jan]
+        jan.job_applications.remove(job_app)
+        assert list(job_app.user.all()) == [jan]
+
+
+class TestExpiringWithinQueryPlanUnit:
+    pytestmark = pytest.mark.django_db(transaction=False)
+
+    def test_expiring_within_is_range_scan(self, create_user, list_queryset):
+        plan = list_queryset(create_user(), expiring_within=7).explain()
+        assert (
+            "jobapp_owner_valid_to_idx (owner_id=? AND valid_to>? AND valid_to<?)"
+            in plan
+        )
@@ -0,0 +1,70 @@
+import pytest
+from datetime import date
+from django.core.paginator import InvalidPage
+
+from apps.jobs.models import JobApplication
+from apps.jobs.pagination import KeysetPaginator, NEXT
+
+
+class TestKeysetPaginatorUnit:
+    pytestmark = pytest.mark.django_db(transaction=False)
+
+    @pytest.fixture
+    def applications(self, create_user, create_application):
+        user = create_user()
+        # three applications share every apply_date to exercise the pk tie-breaker
+        return [
+            create_application(user, apply_date=date(2025, 1, 1 + i // 3))
+            for i in range(10)
+        ]
+
+    def walk(self, paginator):
+        page = paginator.page()
+        pages = [page]
+        while page.has_next():
+            page = paginator.page(page.next_cursor)
+            pages.append(page)
+        return pages
+
+    def test_forward_walk_returns_every_row_once(self, applications):
+        paginator = KeysetPaginator(
+            JobApplication.objects.all(), "apply_date", per_page=3
+        )
+        pages = self.walk(paginator)
+        ids = [job_app.pk for page in pages for job_app in page]
+        expected = sorted(
+            applications, key=lambda a: (a.apply_date, a.pk), reverse=True
+        )
+        assert ids == [job_app.pk for job_app in expected]
+        assert [len(page) for page in pages] == [3, 3, 3, 1]
+        assert not pages[0].has_previous()
+        assert not pages[-1].has_next()
+
+    def test_backward_walk_mirrors_forward_walk(self, applications):
+        paginator = KeysetPaginator(
+            JobApplication.objects.all(), "apply_date", descending=False, per_page=4
+        )
+        pages = self.walk(paginator)
+        page = pages[-1]
+        backwards = [page]
+        while page.has_previous():
+            page = paginator.page(page.previous_cursor)
+            backwards.append(page)
+        assert [[a.pk for a in p] for p in reversed(backwards)] == \
+            [[a.pk for a in p] for p in pages]
+
+    def test_cursor_round_trip(self, applications):
+        paginator = KeysetPaginator(JobApplication.objects.all(), "apply_date")
+        cursor = paginator.encode_cursor(applications[0], NEXT)
+        assert paginator.decode_cursor(cursor) == (
+            NEXT, applications[0].apply_date, applications[0].pk
+        )
+
+    def test_invalid_cursor(self):
+        paginator = KeysetPaginator(JobApplication.objects.all(), "apply_date")
+        with pytest.raises(InvalidPage):
+            paginator.page("not-a-cursor")
+
+    def test_nullable_sort_field_rejected(self):
+        with pytest.raises(ValueError):
+            KeysetPaginator(JobApplication.objects.all(), "city")
@@ -0,0 +1,16 @@
+import pytest
+from django.db import connection
+
+from apps.jobs.models import JobApplication
+
+
+@pytest.mark.skipif(connection.vendor != "sqlite", reason="SQLite query plan")
+class TestSortQueryPlanUnit:
+    pytestmark = pytest.mark.django_db(transaction=False)
+
+    @pytest.mark.parametrize("order", ["asc", "desc"])
+    @pytest.mark.parametrize("sort", JobApplication.SORTABLE_FIELDS)
+    def test_sort_is_index_driven(self, create_user, list_queryset, sort, order):
+        plan = list_queryset(create_user(), sort, order)[:21].explain()
+        assert f"jobapp_owner_{sort}_idx" in plan
+        assert "TEMP B-TREE" not in plan
@@ -0,0 +1,86 @@
+import pytest
+
+from apps.jobs.models import JobApplicationDetails, Resume, SearchDocument
+from apps.jobs.search import rebuild_search_index, search
+
+
+def found(page):
+    return [(document.kind, document.object_id) for document in page]
+
+
+class TestSearchUnit:
+    pytestmark = pytest.mark.django_db(transaction=False)
+
+    def test_application_and_details_are_indexed(
+        self, create_user, create_application
+    ):
+        user = create_user()
+        job_app = create_application(user, job_name="Data Engineer", city="Gdańsk")
+        JobApplicationDetails.objects.create(
+            job_application=job_app,
+            job_application_body="Spark and Airflow pipelines",
+            comments="Recruiter called on Monday",
+        )
+        for query in ("engineer", "gdańsk", "airflow", "recruiter"):
+            assert found(search(user, query)) == [("application", job_app.pk)]
+
+    def test_resume_is_indexed(self, create_user):
+        user = create_user()
+        resume = Resume.objects.create(
+            user=user,
+            description="Backend resume",
+            job_title="Django developer",
+            summary="Ten years of PostgreSQL",
+        )
+        assert found(search(user, "postgresql")) == [("resume", resume.pk)]
+        assert found(search(user, "postgresql", kind="application")) == []
+
+    def test_results_are_scoped_to_user(self, create_user, create_application):
+        user, other = create_user(), create_user("anna")
+        create_application(other, job_name="Secret project")
+        assert found(search(user, "secret")) == []
+
+    def test_results_are_ranked(self, create_user, create_application):
+        user = create_user()
+        weak = create_application(user, job_name="Tester", company="Python shop")
+        strong = create_application(user, job_name="Python developer", company="Python")
+        assert found(search(user, "python")) == [
+            ("application", strong.pk), ("application", weak.pk)
+        ]
+
+    def test_update_and_delete_keep_index_current(
+        self, create_user, create_application
+    ):
+        user = create_user()
+        job_app = create_application(user, job_name="Golang developer")
+        job_app.job_name = "Rust developer"
+        job_app.save()
+        assert found(search(user, "golang")) == []
+        assert len(search(user, "rust")) == 1
+
+        job_app.delete()
+        assert found(search(user, "rust")) == []
+        assert not SearchDocument.objects.exists()
+
+    def test_query_syntax_is_ignored(self, create_user, create_application):
+        user = create_user()
+        create_application(user, job_name="C developer")
+        assert len(search(user, 'developer" OR (NEAR')) == 0
+        assert len(search(user, '"developer"*')) == 1
+        assert len(search(user, "   ")) == 0
+
+    def test_pagination(self, create_user, create_application):
+        user = create_user()
+        for i in range(5):
+            create_application(user, job_name=f"Analyst {i}")
+        first = search(user, "analyst", per_page=2)
+        last = search(user, "analyst", page=3, per_page=2)
+        assert len(first) == 2 and first.has_next() and not first.has_previous()
+        assert len(last) == 1 and not last.has_next() and last.has_previous()
+
+    def test_rebuild(self, create_user, create_application):
+        user = create_user()
+        create_application(user, job_name="Architect")
+        SearchDocument.objects.all().delete()
+        assert rebuild_search_index(batch_size=1) == 1
+        assert len(search(user, "architect")) == 1
@@ -0,0 +1,102 @@
+from collections import Counter
+
+import pytest
+
+from apps.jobs.models import ApplicationStat
+from apps.jobs.stats import (
+    apply_stats_delta, apply_stats_deltas, get_user_stats, rebuild_stats,
+)
+
+
+def stats_snapshot(user):
+    return {
+        (stat.dimension, stat.value): stat.count
+        for stat in ApplicationStat.objects.filter(user=user, count__gt=0)
+    }
+
+
+class TestApplicationStatsUnit:
+    pytestmark = pytest.mark.django_db(transaction=False)
+
+    def test_create_increments_every_dimension(self, create_user, create_application):
+        user = create_user()
+        create_application(user, company="Acme", portal="LinkedIn")
+        create_application(user, company="Acme", portal=None, status="interview")
+        assert stats_snapshot(user) == {
+            ("status", "applied"): 1,
+            ("status", "interview"): 1,
+            ("company", "Acme"): 2,
+            ("portal", "LinkedIn"): 1,
+            ("portal", ""): 1,
+        }
+
+    def test_status_change_moves_count(self, create_user, create_application):
+        user = create_user()
+        job_app = create_application(user)
+        job_app.status = "rejected"
+        job_app.save()
+        snapshot = stats_snapshot(user)
+        assert snapshot[("status", "rejected")] == 1
+        assert ("status", "applied") not in snapshot
+        assert snapshot[("company", "Acme")] == 1
+
+    def test_delete_decrements(self, create_user, create_application):
+        user = create_user()
+        job_app = create_application(user)
+        create_application(user)
+        job_app.delete()
+        assert stats_snapshot(user)[("status", "applied")] == 1
+
+    def test_deleting_the_user(self, create_user, create_application):
+        user = create_user()
+        create_application(user)
+        create_application(user, status="offer")
+        user.delete()
+        assert not ApplicationStat.objects.exists()
+
+    def test_negative_delta_creates_no_rows(self, create_user):
+        user = create_user()
+        apply_stats_delta(user.pk, Counter({("status", "offer"): -1}))
+        assert not ApplicationStat.objects.exists()
+
+    def test_deltas_in_fixed_queries(
+        self, create_user, django_assert_num_queries
+    ):
+        users = [create_user(f"user{i}") for i in range(3)]
+        deltas = {
+            user.pk: Counter({("company", f"Firm {i}"): 2 for i in range(30)})
+            for user in users
+        }
+        # savepoint, INSERT, one UPDATE for the dimension, release
+        with django_assert_num_queries(4):
+            apply_stats_deltas(deltas)
+        assert ApplicationStat.objects.filter(count=2).count() == 90
+
+    def test_owner_change_moves_between_users(self, create_user, create_application):
+        user, other = create_user(), create_user("anna")
+        job_app = create_application(user)
+        job_app.owner = other
+        job_app.save()
+        assert stats_snapshot(user) == {}
+        assert stats_snapshot(other)[("status", "applied")] == 1
+
+    def test_rebuild_matches_incremental(self, create_user, create_application):
+        user = create_user()
+        for status in ("applied", "applied", "offer"):
+            create_application(user, status=status, portal=None)
+        create_application(user, portal="")
+        incremental = stats_snapshot(user)
+        ApplicationStat.objects.update(count=0)
+        assert rebuild_stats() == len(incremental)
+        assert stats_snapshot(user) == incremental
+
+    def test_get_user_stats_is_single_query(
+        self, create_user, create_application, django_assert_num_queries
+    ):
+        user = create_user()
+        create_application(user, status="offer")
+        create_application(user, status="applied")
+        create_application(user, status="applied")
+        with django_assert_num_queries(1):
+            stats = get_user_stats(user)
+        assert stats["status"] == [("applied", 2), ("offer", 1)]
@@ -0,0 +1,159 @@
+import hashlib
+import io
+import pytest
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import IntegrityError
+
+from apps.jobs.models import Resume, ResumeBlob
+from apps.jobs.storage import BLOB_DIR, dedup_resume_files, recount_blobs
+from apps.jobs.uploads import append_chunk, finalize_upload, start_upload
+
+PDF = b"%PDF-1.4\nsame resume"
+
+
+@pytest.fixture
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    return tmp_path
+
+
+@pytest.fixture
+def content_mode(settings, media_root):
+    settings.RESUME_STORAGE_MODE = "content"
+    return media_root
+
+
+def make_resume(user, content=PDF, name="cv.pdf"):
+    return Resume.objects.create(
+        user=user,
+        description="CV",
+        job_title="Dev",
+        file=SimpleUploadedFile(name, content, content_type="application/pdf"),
+    )
+
+
+def stored_files(root):
+    return sorted(p for p in root.rglob("*") if p.is_file())
+
+
+class TestContentAddressedStorageUnit:
+    pytestmark = pytest.mark.django_db(transaction=False)
+
+    def test_named_mode_keeps_one_file_per_resume(self, create_user, media_root):
+        user = create_user()
+        make_resume(user)
+        make_resume(user)
+        assert len(stored_files(media_root)) == 2
+        assert not ResumeBlob.objects.exists()
+
+    def test_identical_files_share_one_blob(self, create_user, content_mode):
+        user, other = create_user(), create_user("anna")
+        first, second = make_resume(user), make_resume(other, name="other.pdf")
+
+        sha256 = hashlib.sha256(PDF).hexdigest()
+        assert first.file.name == second.file.name == \
+            f"{BLOB_DIR}/{sha256[:2]}/{sha256}.pdf"
+        assert len(stored_files(content_mode)) == 1
+        assert ResumeBlob.objects.get().ref_count == 2
+
+    def test_last_delete_removes_the_blob(
+        self, create_user, content_mode, django_capture_on_commit_callbacks
+    ):
+        user = create_user()
+        first, second = make_resume(user), make_resume(user)
+        with django_capture_on_commit_callbacks(execute=True):
+            first.delete()
+        assert ResumeBlob.objects.get().ref_count == 1
+        assert len(stored_files(content_mode)) == 1
+
+        with django_capture_on_commit_callbacks(execute=True):
+            second.delete()
+        assert not ResumeBlob.objects.exists()
+        assert stored_files(content_mode) == []
+
+    def test_replacing_a_file_releases_the_old_blob(self, create_user, content_mode):
+        user = create_user()
+        resume = make_resume(user)
+        resume.file = ContentFile(b"%PDF-1.4\nnew", name="new.pdf")
+        resume.save()
+        assert ResumeBlob.objects.get().name == resume.file.name
+
+    def test_failed_save_takes_no_reference(self, create_user, content_mode):
+        user = create_user()
+        make_resume(user)
+        with pytest.raises(IntegrityError):
+            Resume.objects.create(
+                user=user, description=None, file=SimpleUploadedFile("cv.pdf", PDF)
+            )
+        assert ResumeBlob.objects.get().ref_count == 1
+
+    def test_bulk_created_resumes_are_counted(self, create_user, content_mode):
+        user = create_user()
+        Resume.objects.bulk_create(
+            Resume(
+                user=user, description="CV", job_title="Dev",
+                file=SimpleUploadedFile(f"cv_{i}.pdf", PDF),
+            )
+            for i in range(3)
+        )
+        assert ResumeBlob.objects.get().ref_count == 3
+
+    def test_chunked_upload_of_known_bytes_is_shared(self, create_user, content_mode):
+        user = create_user()
+        existing = make_resume(user)
+        upload = start_upload(user, "again.pdf", len(PDF))
+        append_chunk(upload.pk, user, 0, io.BytesIO(PDF), len(PDF))
+        resume, _ = finalize_upload(upload.pk, user)
+
+        assert resume.file.name == existing.file.name
+        assert len(stored_files(content_mode)) == 1
+        assert ResumeBlob.objects.get().ref_count == 2
+
+
+class TestDedupResumeFilesUnit:
+    pytestmark = pytest.mark.django_db(transaction=False)
+
+    def test_dedups_in_place(self, create_user, media_root, settings):
+        user = create_user()
+        resumes = [make_resume(user), make_resume(user), make_resume(user, b"other")]
+        assert len(stored_files(media_root)) == 3
+
+        assert dedup_resume_files(dry_run=True)["deduplicated"] == 1
+        assert len(stored_files(media_root)) == 3
+
+        result = dedup_resume_files()
+        assert result == {
+            "scanned": 3, "deduplicated": 1, "missing": 0, "freed_bytes": len(PDF),
+        }
+        assert len(stored_files(media_root)) == 2
+        names = [Resume.objects.get(pk=r.pk).file.name for r in resumes]
+        assert names[0] == names[1] != names[2]
+        assert Resume.objects.get(pk=resumes[0].pk).file.read() == PDF
+        assert ResumeBlob.objects.get(name=names[0]).ref_count == 2
+
+        # the store keeps sharing once the mode is switched on
+        settings.RESUME_STORAGE_MODE = "content"
+        assert make_resume(user).file.name == names[0]
+        assert ResumeBlob.objects.get(name=names[0]).ref_count == 3
+
+    def test_shared_name_is_scanned_once(self, create_user, media_root):
+        user = create_user()
+        make_resume(user)
+        make_resume(user)
+        Resume.objects.update(file="resumes/gone.pdf")
+        result = dedup_resume_files(dry_run=True)
+        assert (result["scanned"], result["missing"]) == (1, 1)
+
+    def test_rerun_is_a_no_op(self, create_user, media_root):
+        user = create_user()
+        make_resume(user)
+        dedup_resume_files()
+        assert dedup_resume_files()["scanned"] == 0
+
+    def test_recount_blobs(self, create_user, content_mode):
+        user = create_user()
+        make_resume(user)
+        ResumeBlob.objects.update(ref_count=7)
+        recount_blobs()
+        assert ResumeBlob.objects.get().ref_count == 1
@@ -0,0 +1,132 @@
+import os
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from apps.jobs.models import Resume
+from apps.jobs.pdf import render_thumbnail
+from apps.jobs.thumbnails import ensure_thumbnail, render_all_thumbnails
+
+
+@pytest.fixture
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    return tmp_path
+
+
+def make_resume(user, content, **kwargs):
+    return Resume.objects.create(
+        user=user,
+        description="CV",
+        job_title="Dev",
+        file=SimpleUploadedFile("cv.pdf", content, content_type="application/pdf"),
+        **kwargs,
+    )
+
+
+class TestRenderThumbnailUnit:
+
+    def test_png_named_after_the_hash(self, make_pdf, tmp_path):
+        path = tmp_path / "cv.pdf"
+        path.write_bytes(make_pdf(["Jan Kowalski"]))
+        sha256, png = render_thumbnail(str(path), 100)
+        assert png == str(tmp_path / f"cv.{sha256[:16]}.png")
+        with open(png, "rb") as image:
+            assert image.read(8) == b"\x89PNG\r\n\x1a\n"
+
+    def test_existing_png_is_not_rendered_again(self, make_pdf, tmp_path):
+        path = tmp_path / "cv.pdf"
+        path.write_bytes(make_pdf(["Jan Kowalski"]))
+        _, png = render_thumbnail(str(path), 100)
+        os.utime(png, (0, 0))
+        assert render_thumbnail(str(path), 100)[1] == png
+        assert os.stat(png).st_mtime == 0
+
+    def test_broken_file(self, tmp_path):
+        path = tmp_path / "cv.pdf"
+        path.write_bytes(b"not a pdf")
+        assert render_thumbnail(str(path), 100)[1] is None
+
+
+class TestResumeThumbnailUnit:
+    pytestmark = pytest.mark.django_db(transaction=False)
+
+    def test_sync_mode_renders_after_commit(
+        self, create_user, make_pdf, media_root, settings,
+        django_capture_on_commit_callbacks,
+    ):
+        settings.RESUME_THUMBNAIL_MODE = "sync"
+        with django_capture_on_commit_callbacks(execute=True):
+            resume = make_resume(create_user(), make_pdf(["Text"]))
+        resume.refresh_from_db()
+        assert resume.thumbnail.endswith(".png")
+        assert (media_root / resume.thumbnail).exists()
+        assert resume.thumbnail_url.endswith(
+            f"/thumbnail/{resume.thumbnail.rsplit('.', 2)[-2]}.png"
+        )
+
+    def test_missing_thumbnail_url_points_to_the_renderer(
+        self, create_user, make_pdf, media_root
+    ):
+        resume = make_resume(create_user(), make_pdf(["Text"]))
+        assert resume.thumbnail == ""
+        assert resume.thumbnail_url.endswith(f"/resume/{resume.pk}/thumbnail/")
+
+    def test_new_file_clears_the_thumbnail(
+        self, create_user, make_pdf, media_root,
+        django_capture_on_commit_callbacks,
+    ):
+        resume = make_resume(create_user(), make_pdf(["Old"]))
+        old = media_root / ensure_thumbnail(resume)
+        assert old.exists()
+        resume.file = SimpleUploadedFile("new.pdf", make_pdf(["New"]))
+        with django_capture_on_commit_callbacks(execute=True):
+            resume.save()
+        resume.refresh_from_db()
+        assert resume.thumbnail == ""
+        assert not old.exists()
+
+    def test_delete_removes_the_thumbnail(
+        self, create_user, make_pdf, media_root,
+        django_capture_on_commit_callbacks,
+    ):
+        resume = make_resume(create_user(), make_pdf(["Text"]))
+        png = media_root / ensure_thumbnail(resume)
+        assert png.exists()
+        with django_capture_on_commit_callbacks(execute=True):
+            resume.delete()
+        assert not png.exists()
+
+    def test_shared_blob_keeps_its_thumbnail(
+        self, create_user, make_pdf, media_root, settings,
+        django_capture_on_commit_callbacks,
+    ):
+        settings.RESUME_STORAGE_MODE = "content"
+        user, content = create_user(), make_pdf(["Same"])
+        resume, twin = make_resume(user, content), make_resume(user, content)
+        assert resume.file.name == twin.file.name
+        png = media_root / ensure_thumbnail(resume)
+        with django_capture_on_commit_callbacks(execute=True):
+            resume.delete()
+        assert png.exists()
+        with django_capture_on_commit_callbacks(execute=True):
+            twin.delete()
+        assert not png.exists()
+
+    def test_broken_file_has_no_thumbnail(self, create_user, media_root):
+        resume = make_resume(create_user(), b"not a pdf")
+        assert ensure_thumbnail(resume) == ""
+
+    def test_render_all_is_a_noop_on_rerun(self, create_user, make_pdf, media_root):
+        user = create_user()
+        resumes = [make_resume(user, make_pdf([f"CV {i}"])) for i in range(3)]
+        make_resume(user, b"not a pdf")
+
+        result = render_all_thumbnails(batch_size=2, workers=1)
+        assert (result["scanned"], result["updated"], result["failed"]) == (4, 3, 1)
+        for resume in resumes:
+            resume.refresh_from_db()
+            assert (media_root / resume.thumbnail).exists()
+
+        result = render_all_thumbnails(batch_size=2, workers=1)
+        assert (result["scanned"], result["updated"], result["failed"]) == (4, 0, 1)
@@ -0,0 +1,182 @@
+import hashlib
+import io
+import pytest
+from datetime import timedelta
+from django.utils import timezone
+
+from apps.jobs import uploads
+from apps.jobs.models import Resume, ResumeUpload
+from apps.jobs.uploads import UploadError, append_chunk, finalize_upload, \
+    remove_stale_uploads, start_upload
+
+CONTENT = b"%PDF-1.4\n" + bytes(range(256)) * 40
+
+
+@pytest.fixture
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    settings.RESUME_UPLOAD_MAX_SIZE = 64 * 1024
+    settings.RESUME_UPLOAD_MAX_CHUNK = 4 * 1024
+    return tmp_path
+
+
+def send(upload, user, chunks):
+    for chunk in chunks:
+        upload = append_chunk(
+            upload.pk, user, upload.received, io.BytesIO(chunk), len(chunk)
+        )
+    return upload
+
+
+def split(data, size=4 * 1024):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestChunkedUploadUnit:
+    pytestmark = pytest.mark.django_db(transaction=False)
+
+    def test_upload_and_finalize(self, create_user, media_root):
+        user = create_user()
+        upload = start_upload(user, "cv.pdf", len(CONTENT), job_title="Dev")
+        upload = send(upload, user, split(CONTENT))
+        assert upload.received == len(CONTENT)
+
+        resume, digest = finalize_upload(upload.pk, user, description="My CV")
+        assert digest == hashlib.sha256(CONTENT).hexdigest()
+        assert resume.file.name == upload.path
+        assert (media_root / resume.file.name).read_bytes() == CONTENT
+        assert resume.file_name == "cv.pdf"
+        assert not ResumeUpload.objects.exists()
+
+    def test_rejects_large_and_non_pdf_files_up_front(self, create_user, media_root):
+        user = create_user()
+        with pytest.raises(UploadError) as error:
+            start_upload(user, "cv.pdf", 64 * 1024 + 1)
+        assert error.value.status == 413
+        with pytest.raises(UploadError):
+            start_upload(user, "cv.exe", 10)
+        assert not ResumeUpload.objects.exists()
+
+    def test_rejects_oversized_chunk_before_reading(self, create_user, media_root):
+        user = create_user()
+        upload = start_upload(user, "cv.pdf", len(CONTENT))
+        body = io.BytesIO(CONTENT)
+        with pytest.raises(UploadError) as error:
+            append_chunk(upload.pk, user, 0, body, len(CONTENT))
+        assert error.value.status == 413
+        assert body.tell() == 0
+
+    def test_rejects_bytes_past_the_announced_size(self, create_user, media_root):
+        user = create_user()
+        upload = start_upload(user, "cv.pdf", 10)
+        with pytest.raises(UploadError):
+            append_chunk(upload.pk, user, 0, io.BytesIO(b"x" * 11))
+        upload.refresh_from_db()
+        assert upload.received == 0
+
+    def test_wrong_offset_reports_where_to_resume(self, create_user, media_root):
+        user = create_user()
+        upload = start_upload(user, "cv.pdf", len(CONTENT))
+        upload = send(upload, user, split(CONTENT)[:2])
+        with pytest.raises(UploadError) as error:
+            append_chunk(upload.pk, user, 0, io.BytesIO(b"x"), 1)
+        assert error.value.status == 409
+        assert error.value.details == {"offset": 8 * 1024}
+
+    def test_resume_after_interrupted_chunk(self, create_user, media_root):
+        user = create_user()
+        upload = start_upload(user, "cv.pdf", len(CONTENT))
+        chunks = split(CONTENT)
+        upload = send(upload, user, chunks[:1])
+
+        class DroppedConnection(io.BytesIO):
+            def read(self, size=-1):
+                if self.tell():
+                    raise OSError("connection reset")
+                return super().read(100)
+
+        with pytest.raises(OSError):
+            append_chunk(upload.pk, user, upload.received, DroppedConnection(chunks[1]))
+        upload.refresh_from_db()
+        assert upload.received == len(chunks[0])
+
+        upload = send(upload, user, chunks[1:])
+        _, digest = finalize_upload(upload.pk, user)
+        assert digest == hashlib.sha256(CONTENT).hexdigest()
+        assert (media_root / upload.path).read_bytes() == CONTENT
+
+    def test_chunk_stored_while_reading_another_one(self, create_user, media_root):
+        user = create_user()
+        upload = start_upload(user, "cv.pdf", len(CONTENT))
+        chunks = split(CONTENT)
+
+        class SlowClient(io.BytesIO):
+            def read(self, size=-1):
+                if not self.tell():  # a retry of the chunk overtakes this one
+                    send(upload, user, chunks[:1])
+                return super().read(size)
+
+        with pytest.raises(UploadError) as error:
+            append_chunk(upload.pk, user, 0, SlowClient(chunks[0]))
+        assert error.value.status == 409
+        upload.refresh_from_db()
+        assert upload.received == len(chunks[0])
+        assert (media_root / upload.path).read_bytes() == chunks[0]
+
+    def test_hash_survives_a_lost_process_state(self, create_user, media_root):
+        user = create_user()
+        upload = start_upload(user, "cv.pdf", len(CONTENT))
+        chunks = split(CONTENT)
+        upload = send(upload, user, chunks[:3])
+        uploads._hashes.clear()  # e.g. the next chunk hits another worker
+
+        upload = send(upload, user, chunks[3:])
+        _, digest = finalize_upload(upload.pk, user)
+        assert digest == hashlib.sha256(CONTENT).hexdigest()
+
+    def test_kept_hashes_are_bounded(self, create_user, media_root, monkeypatch):
+        monkeypatch.setattr(uploads, "HASHES_KEPT", 2)
+        user = create_user()
+        started = [start_upload(user, "cv.pdf", len(CONTENT)) for _ in range(3)]
+        for upload in started:
+            send(upload, user, split(CONTENT)[:1])
+        assert list(uploads._hashes) == [started[1].pk, started[2].pk]
+
+        upload = send(
+            ResumeUpload.objects.get(pk=started[0].pk), user, split(CONTENT)[1:]
+        )
+        _, digest = finalize_upload(upload.pk, user)  # rehashed from disk
+        assert digest == hashlib.sha256(CONTENT).hexdigest()
+
+    def test_remove_stale_uploads(self, create_user, media_root):
+        user = create_user()
+        stale = send(start_upload(user, "cv.pdf", len(CONTENT)), user, [b"%PDF"])
+        active = start_upload(user, "cv.pdf", len(CONTENT))
+        ResumeUpload.objects.filter(pk=stale.pk).update(
+            updated_at=timezone.now() - timedelta(hours=25)
+        )
+
+        assert remove_stale_uploads(timedelta(hours=24), dry_run=True) == {
+            "removed": 1, "freed_bytes": 4,
+        }
+        assert ResumeUpload.objects.count() == 2
+        remove_stale_uploads(timedelta(hours=24))
+        assert list(ResumeUpload.objects.all()) == [active]
+        assert not (media_root / stale.path).exists()
+        assert (media_root / active.path).exists()
+        assert stale.pk not in uploads._hashes
+
+    def test_finalize_checks(self, create_user, media_root):
+        user = create_user()
+        upload = start_upload(user, "cv.pdf", len(CONTENT))
+        with pytest.raises(UploadError) as error:
+            finalize_upload(upload.pk, user)
+        assert error.value.status == 409
+
+        upload = send(upload, user, split(CONTENT))
+        with pytest.raises(UploadError):
+            finalize_upload(upload.pk, user, expected_sha256="0" * 64)
+        with pytest.raises(UploadError) as error:
+            finalize_upload(upload.pk, create_user("anna"))
+        assert error.value.status == 404
+        assert not Resume.objects.exists()
@@ -0,0 +1,121 @@
+import os
+import random
+import re
+
+import pandas as pd
+import pytest
+from django.conf import settings
+
+from apps.jobs.loaders import open_dataset_cache
+from apps.jobs.utils import (
+    first_lowercase, sanitize_name, sanitize_name_batch, strip_to_lower,
+    strip_to_lower_batch, to_camel_case, to_camel_case_batch,
+)
+
+# characters whose case mapping or class trips up naive versions: final
+# sigma, titlecase digraphs, dotted I, ß, a lowercase letter outside the
+# BMP, a lone surrogate
+ALPHABET = "ABCxyz _-\n\t1.,/ÉéßΣσςǅªİı𝐀𝐚\ud800"
+
+
+def reference_to_camel_case(s):
+    return ' '.join(word.capitalize() for word in s.split(' '))
+
+
+def reference_strip_to_lower(text, forget_last=0):
+    for i, c in enumerate(text):
+        if c.islower():
+            return reference_to_camel_case(text[:(i - forget_last)])
+    return text.lstrip(" _").rstrip(" _")
+
+
+def reference_sanitize_name(s):
+    s = s.replace(" ", "_")
+    s = re.sub(r"[^\w]", "", s)
+    return re.sub(r"_+", "_", s)
+
+
+def corpus(size: int = 5000, seed: int = 1) -> list:
+    rng = random.Random(seed)
+    texts = [
+        "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 16)))
+        for _ in range(size)
+    ]
+    return texts + [
+        "", " ", "_", "  HR ADMINISTRATOR/MARKETING\n\n  HR ADMINISTRATOR  Summary",
+        "ALL CAPS TEXT", "A" * 500 + "b", "Z" * 300,
+    ]
+
+
+class TestBatchUtilsUnit:
+    """The batch functions, and the scalar ones built on them, against the
+    original one-character-at-a-time implementations"""
+
+    @pytest.mark.parametrize("forget_last", [0, 1, 2, 5])
+    def test_strip_to_lower(self, forget_last):
+        texts = corpus()
+        expected = [reference_strip_to_lower(text, forget_last) for text in texts]
+        assert strip_to_lower_batch(texts, forget_last=forget_last) == expected
+        assert list(
+            strip_to_lower_batch(pd.Series(texts), forget_last=forget_last)
+        ) == expected
+        assert [strip_to_lower(text, forget_last) for text in texts] == expected
+
+    def test_to_camel_case(self):
+        texts = corpus()
+        expected = [reference_to_camel_case(text) for text in texts]
+        assert to_camel_case_batch(texts) == expected
+        assert list(to_camel_case_batch(pd.Series(texts))) == expected
+        assert [to_camel_case(text) for text in texts] == expected
+
+    def test_sanitize_name(self):
+        texts = corpus()
+        expected = [reference_sanitize_name(text) for text in texts]
+        assert sanitize_name_batch(texts) == expected
+        assert list(sanitize_name_batch(pd.Series(texts))) == expected
+        assert [sanitize_name(text) for text in texts] == expected
+
+    def test_first_lowercase(self):
+        assert [first_lowercase(text) for text in ["ABCd", "ÉÀé", "ª", "ABC", ""]] == [
+            3, 2, 0, None, None
+        ]
+
+    def test_series_keeps_index(self):
+        series = pd.Series(
+            ["DATA ENGINEER  Summary", "HR", "x"], index=[7, 3, 7], name="cv"
+        )
+        result = strip_to_lower_batch(series, forget_last=2)
+        assert isinstance(result, pd.Series)
+        assert list(result.index) == [7, 3, 7]
+        assert result.name == "cv"
+        assert list(result) == ["Data Engineer ", "HR", ""]
+
+    def test_empty(self):
+        assert to_camel_case_batch([]) == []
+        assert strip_to_lower_batch([]) == []
+        assert sanitize_name_batch([]) == []
+        empty = pd.Series([], dtype=object)
+        assert strip_to_lower_batch(empty, forget_last=2).empty
+        assert to_camel_case_batch(empty).empty
+        assert sanitize_name_batch(empty).empty
+
+    def test_series_without_lowercase(self):
+        series = pd.Series([" HR_", "IT"])
+        assert list(strip_to_lower_batch(series, forget_last=2)) == ["HR", "IT"]
+
+    @pytest.mark.skipif(
+        not os.path.exists(settings.RESUME_DATASET_CACHE),
+        reason="run cache_resume_dataset to check the full dataset",
+    )
+    def test_full_dataset(self):
+        texts = open_dataset_cache(settings.RESUME_DATASET_CACHE)["Resume_str"]
+        texts = [text or "" for text in texts.to_pylist()]
+        titles = strip_to_lower_batch(texts, forget_last=2)
+        assert titles == [reference_strip_to_lower(text, 2) for text in texts]
+        assert list(strip_to_lower_batch(pd.Series(texts), forget_last=2)) == titles
+        assert to_camel_case_batch(texts) == [
+            reference_to_camel_case(text) for text in texts
+        ]
+        assert sanitize_name_batch(titles) == [
+            reference_sanitize_name(title) for title in titles
+        ]
@@ -0,0 +1,129 @@
+import logging
+import os
+from functools import partial
+from time import perf_counter
+from django.conf import settings
+from django.db import connections
+
+from apps.jobs.caching import bump_data_version
+from apps.jobs.extraction import get_executor, process_pool
+from apps.jobs.models import Resume
+from apps.jobs.pdf import render_thumbnail, thumbnail_path
+from apps.jobs.storage import is_blob
+
+
+logger = logging.getLogger(__name__)
+
+
+def known_digest(resume: Resume):
+    """SHA-256 of the file when its name already says it, None otherwise"""
+    if is_blob(resume.file.name):
+        return os.path.splitext(os.path.basename(resume.file.name))[0]
+    return None
+
+
+def store_thumbnail(resume_id: int, user_id: int, file_name: str, sha256: str) -> str:
+    """Point the resume at the preview of `file_name`, return its storage name"""
+    name = thumbnail_path(file_name, sha256)
+    updated = (
+        Resume.objects
+        .filter(pk=resume_id, file=file_name)
+        .exclude(thumbnail=name)
+        .update(thumbnail=name)
+    )
+    if updated:
+        bump_data_version(user_id)  # cached resume rows embed the preview URL
+    return name
+
+
+def ensure_thumbnail(resume: Resume) -> str:
+    """
+    Render the preview of `resume` now unless it exists, for the first request
+    of a resume the background job has not reached. Returns '' on failure.
+    """
+    if not resume.file:
+        return ''
+    sha256, path = render_thumbnail(
+        resume.file.path, settings.RESUME_THUMBNAIL_WIDTH, known_digest(resume)
+    )
+    if path is None:
+        return ''
+    resume.thumbnail = store_thumbnail(
+        resume.pk, resume.user_id, resume.file.name, sha256
+    )
+    return resume.thumbnail
+
+
+def _store_result(resume_id: int, user_id: int, file_name: str, future) -> None:
+    try:
+        sha256, path = future.result()
+        if path is not None:
+            store_thumbnail(resume_id, user_id, file_name, sha256)
+    except Exception:
+        logger.exception("Thumbnail of resume %s failed", resume_id)
+    finally:
+        connections.close_all()
+
+
+def schedule_thumbnail(resume: Resume) -> None:
+    """Render the preview of a new file, in the process pool by default"""
+    mode = settings.RESUME_THUMBNAIL_MODE
+    if mode == 'off' or not resume.file:
+        return
+    if mode == 'sync':
+        ensure_thumbnail(resume)
+        return
+    future = get_executor().submit(
+        render_thumbnail,
+        resume.file.path,
+        settings.RESUME_THUMBNAIL_WIDTH,
+        known_digest(resume),
+    )
+    future.add_done_callback(
+        partial(_store_result, resume.pk, resume.user_id, resume.file.name)
+    )
+
+
+def render_all_thumbnails(batch_size: int = 100, workers: int = None) -> dict:
+    """
+    Pre-render the preview of every resume, in primary key order and in
+    parallel. Files whose preview already exists are only hashed (blobs of
+    the content-addressed storage not even that), so a rerun is a no-op.
+
+    Returns:
+        dict: numbers of scanned, updated and failed resumes, seconds spent
+    """
+    workers = workers or settings.RESUME_EXTRACTION_WORKERS
+    width = settings.RESUME_THUMBNAIL_WIDTH
+    result = {'scanned': 0, 'updated': 0, 'failed': 0, 'seconds': 0.0}
+    start = perf_counter()
+    last_pk = 0
+    with process_pool(workers) as pool:
+        while True:
+            batch = list(
+                Resume.objects
+                .filter(pk__gt=last_pk, file__isnull=False)
+                .exclude(file='')
+                .order_by('pk')
+                .only('pk', 'user_id', 'file', 'thumbnail')
+                [:batch_size]
+            )
+            if not batch:
+                break
+            last_pk = batch[-1].pk
+            rendered = pool.map(
+                render_thumbnail,
+                [resume.file.path for resume in batch],
+                [width] * len(batch),
+                [known_digest(resume) for resume in batch],
+                chunksize=max(1, len(batch) // (workers * 4)),
+            )
+            for resume, (sha256, path) in zip(batch, rendered):
+                if path is None:
+                    result['failed'] += 1
+                elif thumbnail_path(resume.file.name, sha256) != resume.thumbnail:
+                    store_thumbnail(resume.pk, resume.user_id, resume.file.name, sha256)
+                    result['updated'] += 1
+            result['scanned'] += len(batch)
+    result['seconds'] = perf_counter() - start
+    return result
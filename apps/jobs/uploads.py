@@ -0,0 +1,246 @@
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+from datetime import timedelta
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.utils import timezone
+
+from apps.jobs.models import Resume, ResumeUpload
+from apps.jobs.storage import resume_storage
+from apps.jobs.utils import resume_file_path
+
+
+READ_SIZE = 64 * 1024
+# chunks up to this size are spooled in memory, larger ones to a temp file
+SPOOL_SIZE = 1024 * 1024
+ALLOWED_EXTENSIONS = ('.pdf',)
+HASHES_KEPT = 64
+
+# running SHA-256 of the uploads this process received chunks of last:
+# upload id -> (offset, hash), at most HASHES_KEPT, least recent dropped
+# first. A hash state cannot be stored, a dropped one is rebuilt from disk.
+_hashes = OrderedDict()
+
+
+class UploadError(Exception):
+    """A request of the upload protocol that cannot be honoured"""
+
+    def __init__(self, message: str, status: int = 400, **details):
+        super().__init__(message)
+        self.status = status
+        self.details = details
+
+
+def start_upload(user, file_name: str, size: int, job_title: str = '') -> ResumeUpload:
+    """
+    Reserve the final storage path of a resume of `size` bytes.
+
+    Raises:
+        UploadError: the file is not a PDF or exceeds RESUME_UPLOAD_MAX_SIZE
+    """
+    if not file_name or not file_name.lower().endswith(ALLOWED_EXTENSIONS):
+        raise UploadError("Only PDF resumes can be uploaded.")
+    if size <= 0:
+        raise UploadError("The file is empty.")
+    if size > settings.RESUME_UPLOAD_MAX_SIZE:
+        raise UploadError(
+            f"The file is larger than {settings.RESUME_UPLOAD_MAX_SIZE} bytes.",
+            status=413,
+        )
+    resume = Resume(user=user, job_title=job_title)
+    # saving an empty file claims a unique name the chunks are appended to
+    path = default_storage.save(
+        resume_file_path(resume, file_name), ContentFile(b'')
+    )
+    return ResumeUpload.objects.create(
+        user=user,
+        file_name=file_name[:128],
+        job_title=job_title,
+        path=path,
+        size=size,
+    )
+
+
+def _running_hash(upload: ResumeUpload):
+    """
+    Return the SHA-256 of the first `upload.received` bytes. It is kept in
+    memory between chunks; only a process that never saw the earlier chunks
+    (restart, another worker) or dropped their hash hashes them again from
+    storage, once.
+    """
+    offset, sha256 = _hashes.pop(upload.pk, (None, None))
+    if offset == upload.received:
+        return sha256
+    sha256 = hashlib.sha256()
+    remaining = upload.received
+    with default_storage.open(upload.path, 'rb') as file:
+        while remaining:
+            data = file.read(min(READ_SIZE, remaining))
+            if not data:
+                break
+            sha256.update(data)
+            remaining -= len(data)
+    return sha256
+
+
+def _upload_at(queryset, upload_id: int, user, offset: int) -> ResumeUpload:
+    """
+    Return the upload `upload_id` of `user` whose stored part ends at `offset`.
+
+    Raises:
+        UploadError: unknown upload or wrong offset
+    """
+    upload = queryset.filter(pk=upload_id, user=user).first()
+    if upload is None:
+        raise UploadError("Unknown upload.", status=404)
+    if offset != upload.received:
+        raise UploadError(
+            "The chunk does not start at the end of the stored data.",
+            status=409,
+            offset=upload.received,
+        )
+    return upload
+
+
+def _spool_chunk(stream, limit: int):
+    """
+    Read `stream` into a temporary file, in memory up to SPOOL_SIZE bytes.
+
+    Raises:
+        UploadError: the stream holds more than `limit` bytes
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE)
+    try:
+        while data := stream.read(READ_SIZE):
+            if spool.tell() + len(data) > limit:
+                raise UploadError("The chunk is too large.", status=413)
+            spool.write(data)
+    except BaseException:
+        spool.close()
+        raise
+    spool.seek(0)
+    return spool
+
+
+def append_chunk(upload_id: int, user, offset: int, stream,
+                 length: int = None) -> ResumeUpload:
+    """
+    Write the bytes of `stream` at `offset` of an upload of `user`.
+
+    A chunk must start where the stored part ends; after a dropped
+    connection the client asks for `received` and sends the rest from
+    there. Bytes past `received` left by an interrupted chunk are
+    overwritten.
+
+    The request body is read into a spool first, so the row lock is only
+    held while the received bytes are copied to the file, never while a
+    slow client is sending them.
+
+    Args:
+        upload_id (int): id of the ResumeUpload
+        user (User): owner of the upload
+        offset (int): position of the first byte of the chunk
+        stream: file-like object the chunk is read from
+        length (int): announced chunk size (Content-Length), checked up front
+    Raises:
+        UploadError: unknown upload, wrong offset or size limits exceeded
+    """
+    max_chunk = settings.RESUME_UPLOAD_MAX_CHUNK
+    if length is not None and length > max_chunk:
+        raise UploadError(f"Chunks are limited to {max_chunk} bytes.", status=413)
+
+    upload = _upload_at(ResumeUpload.objects, upload_id, user, offset)
+    if length is not None and offset + length > upload.size:
+        raise UploadError("The chunk exceeds the announced size.", status=413)
+
+    with _spool_chunk(stream, min(max_chunk, upload.size - offset)) as chunk:
+        with transaction.atomic():
+            # checked again: another request may have stored this offset
+            # while the chunk was read
+            upload = _upload_at(
+                ResumeUpload.objects.select_for_update(), upload_id, user, offset
+            )
+            sha256 = _running_hash(upload)
+            written = 0
+            with open(default_storage.path(upload.path), 'r+b') as file:
+                file.seek(upload.received)
+                while data := chunk.read(READ_SIZE):
+                    written += len(data)
+                    file.write(data)
+                    sha256.update(data)
+                file.truncate()
+                file.flush()
+                os.fsync(file.fileno())
+
+            upload.received += written
+            upload.save(update_fields=['received', 'updated_at'])
+            _hashes[upload.pk] = (upload.received, sha256)
+            while len(_hashes) > HASHES_KEPT:
+                _hashes.popitem(last=False)
+    return upload
+
+
+def finalize_upload(upload_id: int, user, description: str = '',
+                    expected_sha256: str = '') -> tuple:
+    """
+    Turn a complete upload into a Resume pointing at the uploaded file.
+
+    Returns:
+        tuple: (Resume, hex SHA-256 of the file)
+    Raises:
+        UploadError: unknown or incomplete upload, or checksum mismatch
+    """
+    with transaction.atomic():
+        upload = (
+            ResumeUpload.objects
+            .select_for_update()
+            .filter(pk=upload_id, user=user)
+            .first()
+        )
+        if upload is None:
+            raise UploadError("Unknown upload.", status=404)
+        if upload.received != upload.size:
+            raise UploadError(
+                "The upload is not complete.", status=409, offset=upload.received
+            )
+        digest = _running_hash(upload).hexdigest()
+        if expected_sha256 and expected_sha256.lower() != digest:
+            raise UploadError("The checksum does not match.", sha256=digest)
+
+        resume = Resume(
+            user=user,
+            description=(description or upload.file_name)[:128],
+            job_title=upload.job_title or None,
+            file_name=upload.file_name,
+        )
+        # already in place, nothing is copied; shared if the bytes are known
+        resume.file.name = resume_storage.adopt(upload.path, digest)
+        resume.save()
+        upload.delete()
+    _hashes.pop(upload_id, None)
+    return resume, digest
+
+
+def remove_stale_uploads(max_age: timedelta, dry_run: bool = False) -> dict:
+    """
+    Delete the uploads that got no chunk for `max_age`, with their partial
+    files.
+
+    Returns:
+        dict: numbers of removed uploads and freed bytes
+    """
+    result = {'removed': 0, 'freed_bytes': 0}
+    stale = ResumeUpload.objects.filter(updated_at__lt=timezone.now() - max_age)
+    for upload in stale.order_by('pk').iterator():
+        result['removed'] += 1
+        result['freed_bytes'] += upload.received
+        if dry_run:
+            continue
+        _hashes.pop(upload.pk, None)
+        upload.delete()
+        default_storage.delete(upload.path)
+    return result
@@ -1,11 +1,55 @@
 from django.urls import path
 
+from .api import ApplicationListApiView, ApplicationDetailApiView, \
+    ApplicationBulkStatusApiView, ResumeUploadApiView, ResumeUploadChunkApiView, \
+    ResumeUploadFinalizeApiView
 from .views import ListJobApplicationView, CreateJobApplicationView, jobs_home_view, \
-    ResumeListView
+    ResumeListView, SearchView, ExportJobApplicationsView, ImportJobApplicationsView, \
+    BulkStatusView, ResumeDownloadView, ResumeLookupView, ResumeMatchView, \
+    ResumeThumbnailRenderView, ResumeThumbnailView
 
 urlpatterns = [
     path('', jobs_home_view, name='home'),
     path('list/', ListJobApplicationView.as_view(), name='list_of_applications'),
     path('create/', CreateJobApplicationView.as_view(), name='create_application'),
     path('resume_list/', ResumeListView.as_view(), name='resume_list'),
+    path('resume_lookup/', ResumeLookupView.as_view(), name='resume_lookup'),
+    path('resume_match/', ResumeMatchView.as_view(), name='resume_match'),
+    path(
+        'resume/<int:pk>/download/', ResumeDownloadView.as_view(),
+        name='resume_download',
+    ),
+    path(
+        'resume/<int:pk>/thumbnail/', ResumeThumbnailRenderView.as_view(),
+        name='resume_thumbnail_render',
+    ),
+    path(
+        'resume/<int:pk>/thumbnail/<str:digest>.png', ResumeThumbnailView.as_view(),
+        name='resume_thumbnail',
+    ),
+    path('search/', SearchView.as_view(), name='search'),
+    path('export/', ExportJobApplicationsView.as_view(), name='export_applications'),
+    path('import/', ImportJobApplicationsView.as_view(), name='import_applications'),
+    path('bulk_status/', BulkStatusView.as_view(), name='bulk_status'),
+    path(
+        'api/applications/', ApplicationListApiView.as_view(),
+        name='api_applications',
+    ),
+    path(
+        'api/applications/<int:pk>/', ApplicationDetailApiView.as_view(),
+        name='api_application',
+    ),
+    path(
+        'api/applications/status/', ApplicationBulkStatusApiView.as_view(),
+        name='api_bulk_status',
+    ),
+    path('api/uploads/', ResumeUploadApiView.as_view(), name='api_uploads'),
+    path(
+        'api/uploads/<int:pk>/', ResumeUploadChunkApiView.as_view(),
+        name='api_upload',
+    ),
+    path(
+        'api/uploads/<int:pk>/finalize/', ResumeUploadFinalizeApiView.as_view(),
+        name='api_upload_finalize',
+    ),
 ]
@@ -1,12 +1,23 @@
+import hashlib
 import os
 import re
+from urllib.parse import parse_qsl, urlencode, urlsplit
+import pandas as pd
 from django.utils import timezone
 # from apps.jobs.models import Resume
 
 
+# the characters str.islower() can be true for: a-z and anything not ASCII
+LOWER_CANDIDATE_RE = re.compile(r"[a-z]|[^\x00-\x7f]")
+NON_WORD_RE = re.compile(r"[^\w]")
+UNDERSCORES_RE = re.compile(r"_+")
+# a text up to its first candidate, and the candidate
+LOWER_HEAD_RE = re.compile(r"^([^a-z\x80-\U0010ffff]*)([a-z]|[^\x00-\x7f])")
+WORD_RE = re.compile(r"[^ ]+")
+
+
 def to_camel_case(s):
-    parts = s.split(' ')  # or split by spaces if needed
-    return ' '.join(word.capitalize() for word in parts)
+    return to_camel_case_batch([s])[0]
 
 
 def strip_to_lower(text: str, forget_last: int = 0) -> str:
@@ -19,22 +30,154 @@ def strip_to_lower(text: str, forget_last: int = 0) -> str:
     Returns:
         str: Stripped and lowercased string.
     """
-    for i, c in enumerate(text):
-        if c.islower():
-            substring = text[:(i - forget_last)]
-            return to_camel_case(substring)
-    text = text.lstrip(" _").rstrip(" _")
-    return text
+    return strip_to_lower_batch([text], forget_last)[0]
 
 
 def sanitize_name(s: str) -> str:
-    # Replace spaces with underscores
-    s = s.replace(" ", "_")
-    # Remove non-alphanumeric characters (keep underscores)
-    s = re.sub(r"[^\w]", "", s)
-    # Collapse multiple underscores into one
-    s = re.sub(r"_+", "_", s)
-    return s
+    return sanitize_name_batch([s])[0]
+
+
+def _camel(text: str) -> str:
+    return ' '.join(word.capitalize() for word in text.split(' '))
+
+
+def _capitalize(match) -> str:
+    return match.group().capitalize()
+
+
+def first_lowercase(text: str):
+    """Index of the first character for which str.islower() is true, or None"""
+    position = 0
+    while match := LOWER_CANDIDATE_RE.search(text, position):
+        if match.group().islower():
+            return match.start()
+        position = match.end()
+    return None
+
+
+def to_camel_case_batch(values):
+    """
+    Capitalize every space separated word of every string of a Series or
+    list, same kind out. A Series goes through Series.str.replace.
+    """
+    if isinstance(values, pd.Series):
+        return values.str.replace(WORD_RE, _capitalize, regex=True)
+    return [_camel(text) for text in values]
+
+
+def strip_to_lower_batch(values, forget_last: int = 0):
+    """
+    The leading text of every string of a Series or list up to its first
+    lowercase character, less `forget_last` characters, camel cased; a
+    string without lowercase characters is only stripped of spaces and
+    underscores. Same kind out, a Series computed with Series.str methods.
+    """
+    if not isinstance(values, pd.Series):
+        results = []
+        for text in values:
+            index = first_lowercase(text)
+            if index is None:
+                results.append(text.strip(" _"))
+            else:
+                # a negative end counts from the end of the text
+                results.append(_camel(text[:index - forget_last]))
+        return results
+
+    parts = values.str.extract(LOWER_HEAD_RE)
+    candidates = parts[1].fillna('')
+    found = candidates.str.islower().to_numpy()
+    # a non-ASCII candidate that is not lowercase, e.g. É: the first
+    # lowercase character is further on, the list path searches for it
+    rescan = candidates.ne('').to_numpy() & ~found
+    heads = parts[0][found]
+    if forget_last:
+        lengths = heads.str.len().to_numpy()
+        texts = values[found]
+        heads = heads.str[:-forget_last]
+        # a head shorter than forget_last gives a negative end, which
+        # counts from the end of the text
+        for length in range(forget_last):
+            short = lengths == length
+            heads[short] = texts[short].str[:length - forget_last].to_numpy()
+    results = values.copy()
+    results[found] = to_camel_case_batch(heads).to_numpy()
+    results[~found] = values[~found].str.strip(" _").to_numpy()
+    if rescan.any():
+        results[rescan] = strip_to_lower_batch(list(values[rescan]), forget_last)
+    return results
+
+
+def sanitize_name_batch(values):
+    """
+    Every string of a Series or list with spaces turned into underscores,
+    other non-word characters removed and runs of underscores collapsed.
+    Same kind out, a Series computed with Series.str.replace.
+    """
+    if isinstance(values, pd.Series):
+        return (
+            values.str.replace(" ", "_", regex=False)
+            .str.replace(NON_WORD_RE, "", regex=True)
+            .str.replace(UNDERSCORES_RE, "_", regex=True)
+        )
+    return [
+        UNDERSCORES_RE.sub("_", NON_WORD_RE.sub("", text.replace(" ", "_")))
+        for text in values
+    ]
+
+
+# query parameters that only say where a click came from
+TRACKING_PARAM_RE = re.compile(
+    r"^(utm_\w+|gclid|fbclid|msclkid|mc_\w+|ref|refid|trk\w*|trackingid)$",
+    re.IGNORECASE,
+)
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def canonical_link(url: str) -> str:
+    """
+    Return a job posting URL in a form that is the same for every way of
+    writing it: no scheme, lowercased host without "www.", no default port,
+    fragment, trailing slash or tracking parameters, remaining query
+    parameters sorted.
+
+    Args:
+        url (str): link as entered, may be None
+    Returns:
+        str: canonical link, '' for an empty one
+    """
+    if not url:
+        return ''
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or '').removeprefix('www.')
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port and port != DEFAULT_PORTS.get(parts.scheme.lower()):
+        host = f"{host}:{port}"
+    query = urlencode(sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not TRACKING_PARAM_RE.match(key)
+    ))
+    link = host + parts.path.rstrip('/')
+    return f"{link}?{query}" if query else link
+
+
+def normalize_text(text: str) -> str:
+    """Casefold and collapse whitespace, for comparing what users typed"""
+    return ' '.join((text or '').casefold().split())
+
+
+def application_fingerprint(link: str, company: str, job_name: str) -> str:
+    """
+    Return a 32 character hash identifying a job posting, equal for two
+    applications to the same posting however their fields were typed.
+    """
+    key = '\n'.join(
+        [canonical_link(link), normalize_text(company), normalize_text(job_name)]
+    )
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
 
 
 def resume_file_path(
@@ -53,7 +196,7 @@ def resume_file_path(
     """
     ext = filename.split('.')[-1]  # get file extension
     timestamp = timezone.now().strftime("%Y%m%d%H%M%S")
-    job_title = instance.job_title.replace(' ', '').replace('_', '')
+    job_title = (instance.job_title or '').replace(' ', '').replace('_', '')
 
     # Replace spaces and special characters
     sanitized_job_title = sanitize_name(job_title)
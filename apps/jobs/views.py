@@ -1,37 +1,123 @@
+import csv
+import io
+import os
+from datetime import date
+from django.contrib import messages
+from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.shortcuts import render
+from django.core.paginator import InvalidPage
+from django.db.models.functions import Lower
+from django.http import FileResponse, Http404, JsonResponse, StreamingHttpResponse
+from django.shortcuts import redirect, render
 from django.urls import reverse_lazy
 from django.utils import timezone
+from django.utils.http import url_has_allowed_host_and_scheme
+from django.views import View
+from django.views.generic import TemplateView
 from django.views.generic.edit import FormView
 from django.views.generic.list import ListView
 
 from .models import JobApplication, Resume
-from .forms import JobApplicationForm, JobApplicationDetailsForm
+from .forms import JobApplicationForm, JobApplicationDetailsForm, \
+    ImportJobApplicationsForm, BulkStatusForm
+from .bulk import bulk_set_status
+from .downloads import file_download
+from .duplicates import find_duplicate, fingerprint_of
+from .export import EXPORT_FORMATS, iter_export_rows
+from .importers import import_applications, read_csv
+from .matching import rank_resumes
+from .pagination import KeysetPaginator
+from .search import search
+from .storage import resume_storage
+from .thumbnails import ensure_thumbnail
+from .stats import get_user_stats
 
 
 class ListJobApplicationView(LoginRequiredMixin, ListView):
     template_name = 'jobs/list_of_applications.html'
     model = JobApplication
     paginate_by = 20
+    default_sort = "apply_date"
+    # sort keys that are not columns, mapped to the indexed column they follow
+    sort_aliases = {"valid_days": "valid_to"}
     login_url = '/users/login/'   # redirect if not logged in
     redirect_field_name = 'next'  # (default, can omit)
 
+    def get_sort(self):
+        """Return (sort_by, order), unknown values fall back to the defaults"""
+        sort_by = self.request.GET.get("sort")
+        if sort_by not in JobApplication.SORTABLE_FIELDS + tuple(self.sort_aliases):
+            sort_by = self.default_sort
+        order = "asc" if self.request.GET.get("order") == "asc" else "desc"
+        return sort_by, order
+
+    def get_sort_field(self):
+        sort_by, _ = self.get_sort()
+        return self.sort_aliases.get(sort_by, sort_by)
+
+    def get_expiring_within(self):
+        """
+        Return ?expiring_within=N as a non-negative int, None if missing or
+        bad, capped at the days left until the last representable date
+        """
+        try:
+            days = int(self.request.GET.get("expiring_within", ""))
+        except ValueError:
+            return None
+        if days < 0:
+            return None
+        return min(days, (date.max - timezone.now().date()).days)
+
     def get_queryset(self):
-        sort_by = self.request.GET.get("sort", "apply_date")
-        order = self.request.GET.get("order", "desc")
-        sort_field = f"-{sort_by}" if order == "desc" else sort_by
+        _, order = self.get_sort()
+        sort_field = self.get_sort_field()
+        prefix = "-" if order == "desc" else ""
         queryset = (
             JobApplication
             .objects
-            .filter(user=self.request.user)
-            .order_by(sort_field)
+            .filter(owner=self.request.user)
+            .with_valid_days()
+            .order_by(f"{prefix}{sort_field}", f"{prefix}id")
         )
+        expiring_within = self.get_expiring_within()
+        if expiring_within is not None:
+            queryset = queryset.expiring_within(expiring_within)
         return queryset
 
+    @property
+    def cursor_mode(self):
+        """Keyset pagination is opt-in with ?pagination=cursor"""
+        return self.request.GET.get("pagination") == "cursor"
+
+    def paginate_queryset(self, queryset, page_size):
+        if not self.cursor_mode:
+            return super().paginate_queryset(queryset, page_size)
+
+        _, order = self.get_sort()
+        paginator = KeysetPaginator(
+            queryset,
+            self.get_sort_field(),
+            descending=order == "desc",
+            per_page=page_size,
+        )
+        cursor = self.request.GET.get("cursor")
+        try:
+            page = paginator.page(cursor)
+        except InvalidPage as e:
+            raise Http404(f"Invalid cursor ({cursor}): {e}")
+        return (paginator, page, page.object_list, page.has_other_pages())
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["sort_by"] = self.request.GET.get("sort", "apply_date")
-        context["order"] = self.request.GET.get("order", "desc")
+        context["sort_by"], context["order"] = self.get_sort()
+        context["cursor_mode"] = self.cursor_mode
+        context["expiring_within"] = self.get_expiring_within()
+        context["status_choices"] = JobApplication.STATUS_CHOICES
+        # filters that every sort and pagination link has to carry over
+        context["filter_params"] = (
+            f"&expiring_within={context['expiring_within']}"
+            if context["expiring_within"] is not None else ""
+        )
         return context
 
 
@@ -47,7 +133,6 @@ class CreateJobApplicationView(LoginRequiredMixin, FormView):
         # Add second form to context for template rendering
         if 'second_form' not in context:
             context['second_form'] = self.second_form_class(user=self.request.user)
-            context['resumes'] = self.request.user.resumes.all()
         return context
 
     def get_success_url(self):
@@ -56,10 +141,8 @@ class CreateJobApplicationView(LoginRequiredMixin, FormView):
     def form_valid(self, form):
         # Save the object without committing to DB yet
         job_app = form.save(commit=False)
-        job_app.save()  # Save the job application first
-
-        # Add the logged-in user
-        job_app.user.add(self.request.user)
+        job_app.owner = self.request.user
+        job_app.save()  # signals add the owner to job_app.user
 
         return super().form_valid(form)
 
@@ -89,32 +172,46 @@ class CreateJobApplicationView(LoginRequiredMixin, FormView):
 
     def forms_valid(self, form, second_form):
         job_app = form.save(commit=False)
+        job_app.owner = self.request.user
+        duplicate = find_duplicate(self.request.user, fingerprint_of(job_app))
+        if duplicate is not None:
+            messages.warning(
+                self.request,
+                f"You already applied for {duplicate.job_name} at "
+                f"{duplicate.company} on {duplicate.apply_date:%Y-%m-%d}.",
+            )
         job_app.save()
-        job_app.user.add(self.request.user)
 
         job_details = second_form.save(commit=False)
         job_details.job_application = job_app
+        job_details.save()
 
         # Handle new resume upload
         new_file = second_form.cleaned_data.get('new_resume')
+        resume_id = second_form.cleaned_data.get('resume')
         if new_file:
             resume = Resume.objects.create(
                 user=self.request.user,
                 description=new_file.name,
+                file_name=new_file.name,
                 file=new_file
             )
-            job_details.resume = resume
-        else:
-            resume_id = second_form.cleaned_data.get('resume')
-            if resume_id and resume_id != 'upload_new':
-                job_details.resume = Resume.objects.get(id=resume_id)
+            job_details.resume.add(resume)
+        elif resume_id and resume_id != second_form.UPLOAD_NEW:
+            # already checked to belong to the user, link it by id
+            job_details.resume.add(resume_id)
 
-        job_details.save()
         return super().form_valid(form)
 
 
+@login_required(login_url='/users/login/')
 def jobs_home_view(request):
-    return render(request, template_name='jobs/home.html')
+    stats = get_user_stats(request.user)
+    context = {
+        'stats': stats,
+        'total': sum(count for _, count in stats['status']),
+    }
+    return render(request, template_name='jobs/home.html', context=context)
 
 
 class ResumeListView(LoginRequiredMixin, ListView):
@@ -127,3 +224,233 @@ class ResumeListView(LoginRequiredMixin, ListView):
     def get_queryset(self):
         # Return only resumes that belong to the logged-in user
         return Resume.objects.filter(user=self.request.user)
+
+
+class ResumeDownloadView(LoginRequiredMixin, View):
+    """Send a resume file to its owner, the only one allowed to read it"""
+    login_url = '/users/login/'
+    redirect_field_name = 'next'
+
+    def get(self, request, pk, *args, **kwargs):
+        row = (
+            Resume.objects
+            .filter(pk=pk, user=request.user)
+            .values_list('file', 'file_name')
+            .first()
+        )
+        if row is None or not row[0]:
+            raise Http404("No such resume")
+        name, file_name = row
+        response = file_download(request, name, file_name or os.path.basename(name))
+        if response is None:
+            raise Http404("The file of this resume is missing")
+        return response
+
+
+class ResumeThumbnailRenderView(LoginRequiredMixin, View):
+    """Render a missing preview on first request, then go to its hashed URL"""
+    login_url = '/users/login/'
+    redirect_field_name = 'next'
+
+    def get(self, request, pk, *args, **kwargs):
+        resume = Resume.objects.filter(pk=pk, user=request.user).first()
+        if resume is None:
+            raise Http404("No such resume")
+        if not resume.thumbnail or not resume_storage.exists(resume.thumbnail):
+            if not ensure_thumbnail(resume):
+                raise Http404("This resume has no preview")
+        return redirect(resume.thumbnail_url)
+
+
+class ResumeThumbnailView(LoginRequiredMixin, View):
+    """
+    Serve a preview under a URL that contains the hash of the PDF, so the
+    browser may keep it for a year: another file gets another URL.
+    """
+    login_url = '/users/login/'
+    redirect_field_name = 'next'
+    max_age = 365 * 24 * 60 * 60
+
+    def get(self, request, pk, digest, *args, **kwargs):
+        thumbnail = (
+            Resume.objects
+            .filter(pk=pk, user=request.user)
+            .values_list('thumbnail', flat=True)
+            .first()
+        )
+        if not thumbnail or thumbnail.rsplit('.', 2)[-2] != digest:
+            raise Http404("No such preview")
+        if not resume_storage.exists(thumbnail):
+            return redirect('jobs:resume_thumbnail_render', pk=pk)
+        response = FileResponse(
+            resume_storage.open(thumbnail, 'rb'), content_type='image/png'
+        )
+        response['Cache-Control'] = f'private, max-age={self.max_age}, immutable'
+        return response
+
+
+class ResumeLookupView(LoginRequiredMixin, View):
+    """
+    JSON page of the user's resumes whose file name starts with ?q=, for the
+    resume picker of the create form. Pages follow ?cursor= tokens.
+    """
+    per_page = 20
+    raise_exception = True
+
+    def get(self, request, *args, **kwargs):
+        resumes = (
+            Resume.objects
+            .filter(user=request.user)
+            .only('id', 'file_name', 'description')
+        )
+        prefix = request.GET.get('q', '').strip()
+        if prefix:
+            # LOWER(file_name) LIKE 'prefix%', served by resume_user_file_name_idx
+            resumes = (
+                resumes
+                .alias(file_name_lower=Lower('file_name'))
+                .filter(file_name_lower__startswith=prefix.lower())
+            )
+        paginator = KeysetPaginator(
+            resumes, 'id', descending=False, per_page=self.per_page
+        )
+        try:
+            page = paginator.page(request.GET.get('cursor'))
+        except InvalidPage as e:
+            return JsonResponse({'errors': {'cursor': [str(e)]}}, status=400)
+        return JsonResponse({
+            'results': [
+                {'id': resume.pk, 'text': resume.file_name or resume.description}
+                for resume in page
+            ],
+            'next': page.next_cursor,
+        })
+
+
+class ResumeMatchView(LoginRequiredMixin, View):
+    """
+    JSON list of the user's resumes that best fit the job description posted
+    as `text`, for the resume picker of the create form.
+    """
+    limit = 5
+    raise_exception = True
+
+    def post(self, request, *args, **kwargs):
+        text = request.POST.get('text', '')
+        ranking = rank_resumes(request.user.pk, text, self.limit)
+        names = {
+            pk: file_name or description
+            for pk, file_name, description in Resume.objects
+            .filter(pk__in=[pk for pk, _ in ranking])
+            .values_list('pk', 'file_name', 'description')
+        }
+        return JsonResponse({
+            'results': [
+                {'id': pk, 'text': names[pk], 'score': round(score, 3)}
+                for pk, score in ranking
+                if pk in names
+            ],
+        })
+
+
+class SearchView(LoginRequiredMixin, TemplateView):
+    template_name = 'jobs/search_results.html'
+    paginate_by = 20
+    login_url = '/users/login/'
+    redirect_field_name = 'next'
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        query = self.request.GET.get("q", "")
+        kind = self.request.GET.get("kind")
+        if kind not in ("application", "resume"):
+            kind = None
+        try:
+            page_number = max(int(self.request.GET.get("page", 1)), 1)
+        except ValueError:
+            page_number = 1
+
+        context["query"] = query
+        context["kind"] = kind
+        context["page_obj"] = search(
+            self.request.user,
+            query,
+            kind=kind,
+            page=page_number,
+            per_page=self.paginate_by,
+        )
+        return context
+
+
+class ExportJobApplicationsView(LoginRequiredMixin, View):
+    login_url = '/users/login/'
+    redirect_field_name = 'next'
+
+    def get(self, request, *args, **kwargs):
+        export_format = request.GET.get("format", "csv")
+        if export_format not in EXPORT_FORMATS:
+            raise Http404(f"Unknown export format: {export_format}")
+        encode, content_type = EXPORT_FORMATS[export_format]
+
+        response = StreamingHttpResponse(
+            encode(iter_export_rows(request.user)),
+            content_type=content_type,
+        )
+        filename = f"job_applications.{export_format}"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+
+class ImportJobApplicationsView(LoginRequiredMixin, FormView):
+    template_name = 'jobs/import_applications.html'
+    form_class = ImportJobApplicationsForm
+    login_url = '/users/login/'
+    redirect_field_name = 'next'
+
+    def form_valid(self, form):
+        file = io.TextIOWrapper(
+            form.cleaned_data['file'].file, encoding='utf-8-sig', newline=''
+        )
+        try:
+            result = import_applications(self.request.user, read_csv(file))
+        except UnicodeDecodeError:
+            form.add_error('file', "Save the file as CSV UTF-8 and upload it again.")
+            return self.form_invalid(form)
+        except csv.Error as e:
+            form.add_error('file', f"The file is not a valid CSV file: {e}.")
+            return self.form_invalid(form)
+        return self.render_to_response(
+            self.get_context_data(form=form, result=result)
+        )
+
+
+class BulkStatusView(LoginRequiredMixin, FormView):
+    """Move the applications ticked on the list to one status, then go back"""
+    form_class = BulkStatusForm
+    http_method_names = ['post']
+    login_url = '/users/login/'
+    redirect_field_name = 'next'
+
+    def get_success_url(self):
+        url = self.request.POST.get('next')
+        if url and url_has_allowed_host_and_scheme(
+            url, allowed_hosts={self.request.get_host()}
+        ):
+            return url
+        return reverse_lazy('jobs:list_of_applications')
+
+    def form_valid(self, form):
+        status = form.cleaned_data['status']
+        updated = bulk_set_status(
+            self.request.user, form.cleaned_data['ids'], status
+        )
+        label = dict(JobApplication.STATUS_CHOICES)[status]
+        messages.success(
+            self.request, f"{updated} job applications moved to {label}."
+        )
+        return redirect(self.get_success_url())
+
+    def form_invalid(self, form):
+        for errors in form.errors.values():
+            messages.error(self.request, " ".join(errors))
+        return redirect(self.get_success_url())
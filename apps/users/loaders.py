@@ -0,0 +1,168 @@
+import hashlib
+import os
+from functools import lru_cache, partial
+from itertools import islice
+from time import perf_counter
+from django.contrib.auth.models import User, UserManager
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import transaction
+
+from apps.jobs.extraction import imap_ordered
+from apps.users.models import SiteLinks, UserProfile
+from apps.users.utils import hash_password
+
+
+SITES = ['linkedIn', 'github']
+SHARED_PICTURES_DIR = 'profile_pics/shared/'
+
+
+@lru_cache(maxsize=None)
+def read_picture(path: str) -> bytes:
+    """Content of a source picture, read once per process"""
+    with open(path, 'rb') as file:
+        return file.read()
+
+
+def picture_upload(path: str) -> SimpleUploadedFile:
+    """A copy of a source picture, stored under the user's name on save"""
+    return SimpleUploadedFile(
+        name=os.path.basename(path),
+        content=read_picture(path),
+        content_type='image/jpeg',
+    )
+
+
+def store_shared_picture(path: str) -> str:
+    """
+    Store a source picture once, named after its content, and return its
+    name in storage. A picture already stored by an earlier run is reused.
+    """
+    content = read_picture(path)
+    digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+    ext = os.path.splitext(path)[1].lower() or '.jpg'
+    name = f"{SHARED_PICTURES_DIR}{digest}{ext}"
+    if default_storage.exists(name):
+        return name
+    return default_storage.save(name, ContentFile(content))
+
+
+def build_rows(user_data: dict, password: str, picture=None):
+    """
+    The User, UserProfile and SiteLinks of one generated user, unsaved.
+    `picture` is an upload or the name of a stored file.
+    """
+    user = User(
+        username=User.normalize_username(user_data['username']),
+        email=UserManager.normalize_email(user_data['email']),
+        first_name=user_data['first_name'],
+        last_name=user_data['last_name'],
+        password=password,
+        is_active=True,
+    )
+    profile = UserProfile(
+        user=user,
+        phone_number=user_data.get('phone_number', ''),
+        country=user_data.get('country', ''),
+        city=user_data.get('city', ''),
+        profile_picture=picture,
+    )
+    links = [
+        SiteLinks(
+            user=user,
+            name=site.capitalize(),
+            url=user_data[f"{site}_url"],
+            description=f"User's {site.capitalize()} profile",
+        )
+        for site in SITES
+        if user_data.get(f"{site}_url")
+    ]
+    return user, profile, links
+
+
+def load_users(
+    users_data, batch_size: int = 1000, workers: int = 1,
+    fast_hashes: bool = False, shared_pictures: bool = False, progress=None,
+) -> dict:
+    """
+    Create users with their profiles and site links from generated data,
+    `batch_size` at a time: one bulk_create per model and batch, in one
+    transaction per batch. bulk_create sets the primary keys of the new
+    users, so the profiles and links refer to them without more queries.
+
+    Passwords are hashed by `workers` processes while earlier batches are
+    stored. With `fast_hashes` they get FAST_HASH_ITERATIONS rounds only,
+    for load-test data.
+
+    Every profile gets its own copy of its picture, unless
+    `shared_pictures`: then each distinct source picture is stored once
+    and all profiles using it point at that file, so time and disk use
+    follow the number of pictures, not of users. Nothing deletes profile
+    pictures, so a shared one stays as long as any profile needs it.
+
+    Users whose username is taken, in the database or earlier in the
+    data, are skipped.
+
+    Args:
+        users_data (iterable): dicts as made by generate_users
+        batch_size (int): users inserted per transaction
+        workers (int): processes hashing the passwords
+        fast_hashes (bool): hash with FAST_HASH_ITERATIONS rounds
+        shared_pictures (bool): store each source picture once
+        progress (callable): called with the number of users processed
+    Returns:
+        dict: numbers of created and skipped users, seconds spent
+    """
+    result = {'created': 0, 'skipped': 0, 'seconds': 0.0}
+    start = perf_counter()
+    users_data = list(users_data)
+    names = [User.normalize_username(data['username']) for data in users_data]
+    taken = set()
+    for offset in range(0, len(names), batch_size):
+        taken.update(
+            User.objects
+            .filter(username__in=names[offset:offset + batch_size])
+            .values_list('username', flat=True)
+        )
+    fresh = []
+    for name, user_data in zip(names, users_data):
+        if name not in taken:
+            taken.add(name)
+            fresh.append(user_data)
+    result['skipped'] = len(users_data) - len(fresh)
+
+    stored = {}
+
+    def picture(path: str):
+        if not path:
+            return None
+        if not shared_pictures:
+            return picture_upload(path)
+        if path not in stored:
+            stored[path] = store_shared_picture(path)
+        return stored[path]
+
+    passwords = imap_ordered(
+        partial(hash_password, fast=fast_hashes),
+        (user_data['password'] for user_data in fresh),
+        workers=workers,
+    )
+    stream = zip(fresh, passwords)
+    while batch := list(islice(stream, batch_size)):
+        rows = [
+            build_rows(user_data, password, picture(user_data.get('profile_picture')))
+            for user_data, password in batch
+        ]
+        with transaction.atomic():
+            User.objects.bulk_create([user for user, _, _ in rows])
+            UserProfile.objects.bulk_create([profile for _, profile, _ in rows])
+            SiteLinks.objects.bulk_create(
+                [link for _, _, links in rows for link in links]
+            )
+        result['created'] += len(rows)
+        if progress:
+            progress(result['created'] + result['skipped'])
+
+    result['seconds'] = perf_counter() - start
+    return result
@@ -1,12 +1,10 @@
-import os
 from sys import stdout
 from tqdm import tqdm
-from django.contrib.auth.models import User
-from django.core.files.uploadedfile import SimpleUploadedFile
 from django.core.management import BaseCommand
 
 from media.input_data.generate_data import generate_users
-from apps.users.models import UserProfile, SiteLinks
+from apps.users.loaders import load_users
+from apps.users.utils import FAST_HASH_ITERATIONS
 
 
 class Command(BaseCommand):
@@ -18,63 +16,57 @@ class Command(BaseCommand):
             type=int,
             help='Indicates the number of users to be created'
         )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of users inserted per transaction',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Number of processes hashing the passwords',
+        )
+        parser.add_argument(
+            '--fast-hashes',
+            action='store_true',
+            help=(
+                f'Hash passwords with {FAST_HASH_ITERATIONS} PBKDF2 rounds, for '
+                'load-test data; they are re-hashed on first login'
+            ),
+        )
+
+        parser.add_argument(
+            '--shared-pictures',
+            action='store_true',
+            help='Store each sample picture once and share it between profiles',
+        )
 
     def handle(self, *args, **kwargs):
         """Create random users with associated UserProfile"""
         total = kwargs['total']
         users_data = generate_users(total)
-        userprofiles = []
-        userlinks = []
-        for user_data in tqdm(
-            users_data,
-            desc="Creating users",
-            unit="user",
-            file=stdout
-        ):
-            # Create User
-            user = User.objects.create_user(
-                username=user_data['username'],
-                email=user_data['email'],
-                first_name=user_data['first_name'],
-                last_name=user_data['last_name'],
-                password=user_data['password'],
-                is_active=True,
+        with tqdm(
+            desc="Creating users", unit="user", total=total, file=stdout
+        ) as bar:
+            result = load_users(
+                users_data,
+                batch_size=kwargs['batch_size'],
+                workers=kwargs['workers'],
+                fast_hashes=kwargs['fast_hashes'],
+                shared_pictures=kwargs['shared_pictures'],
+                progress=lambda done: bar.update(done - bar.n),
             )
 
-            if user:
-                # Create UserProfile
-                profile_picture_path = user_data.get('profile_picture')
-                image_file = SimpleUploadedFile(
-                    name=os.path.basename(profile_picture_path),
-                    content=open(profile_picture_path, 'rb').read(),
-                    content_type='image/jpeg'
-                ) if profile_picture_path else None
-
-                userprofile = UserProfile(
-                    user=user,
-                    phone_number=user_data.get('phone_number', ''),
-                    country=user_data.get('country', ''),
-                    city=user_data.get('city', ''),
-                    profile_picture=image_file
-                )
-                userprofiles.append(userprofile)
-
-                # Create SiteLinks
-                for site in ['linkedIn', 'github']:
-                    url_key = f"{site}_url"
-                    if user_data.get(url_key):
-                        site_links_data = SiteLinks(
-                            user=user,
-                            name=site.capitalize(),
-                            url=user_data[url_key],
-                            description=f"User's {site.capitalize()} profile"
-                        )
-                        userlinks.append(site_links_data)
-
-        UserProfile.objects.bulk_create(userprofiles)
-        SiteLinks.objects.bulk_create(userlinks)
-        total_created = len(userprofiles)
-
+        created, seconds = result['created'], result['seconds']
+        skipped = (
+            f" Skipped {result['skipped']} with a taken username."
+            if result['skipped'] else ""
+        )
         self.stdout.write(
-            self.style.SUCCESS(f"✅ Created {total_created} users.")
+            self.style.SUCCESS(
+                f"✅ Created {created} users in {seconds:.1f} s "
+                f"({created / (seconds or 1e-9):.1f}/sec).{skipped}"
+            )
         )
@@ -0,0 +1,58 @@
+import pytest
+from time import perf_counter
+from django.contrib.auth.models import User
+
+from apps.users.loaders import load_users
+from media.input_data.generate_data import random_pic
+from apps.users.tests.unit.test_loaders_unit import user_data
+
+ROW_BY_ROW = 10
+TOTAL = 10000
+
+
+@pytest.mark.django_db
+def test_users_per_second(settings, tmp_path):
+    """Users created per second, one create_user each versus load_users"""
+    settings.MEDIA_ROOT = tmp_path
+
+    start = perf_counter()
+    for data in (user_data(f"old{i}") for i in range(ROW_BY_ROW)):
+        User.objects.create_user(
+            username=data["username"], email=data["email"], password=data["password"]
+        )
+    old_rate = ROW_BY_ROW / (perf_counter() - start)
+
+    rates = [("create_user", old_rate)]
+    for label, total, fast in [
+        ("bulk", ROW_BY_ROW, False),
+        ("bulk, fast", TOTAL, True),
+    ]:
+        prefix = "fast" if fast else "bulk"
+        data = [user_data(f"{prefix}{i}") for i in range(total)]
+        result = load_users(data, fast_hashes=fast)
+        assert result["created"] == total
+        rates.append((label, total / result["seconds"]))
+
+    print("\nmode           users/sec  speedup")
+    for label, rate in rates:
+        print(f"{label:<14} {rate:>9.1f} {rate / old_rate:>8.1f}x")
+
+
+def disk_usage(path) -> int:
+    return sum(file.stat().st_size for file in path.rglob("*") if file.is_file())
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("shared", [False, True])
+def test_picture_storage(settings, tmp_path, shared):
+    """Seconds and bytes written seeding users with sample pictures"""
+    settings.MEDIA_ROOT = tmp_path
+    data = [
+        dict(user_data(f"pic{i}"), profile_picture=random_pic()) for i in range(2000)
+    ]
+    result = load_users(data, fast_hashes=True, shared_pictures=shared)
+    files = sum(1 for file in tmp_path.rglob("*") if file.is_file())
+    print(
+        f"\nshared={shared}: {result['seconds']:.2f} s, {files} files, "
+        f"{disk_usage(tmp_path) / 2**20:.1f} MiB"
+    )
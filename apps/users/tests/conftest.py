@@ -1,10 +1,18 @@
 # apps/users/tests/conftest.py
+import os
 import pytest
 
 
 def pytest_collection_modifyitems(config, items):
+    run_benchmarks = os.environ.get("RUN_BENCHMARKS")
     for item in items:
         if "tests/unit/" in str(item.fspath):
             item.add_marker(pytest.mark.unit)
         elif "tests/integration/" in str(item.fspath):
             item.add_marker(pytest.mark.integration)
+        elif "tests/benchmarks/" in str(item.fspath):
+            item.add_marker(pytest.mark.benchmark)
+            if not run_benchmarks:
+                item.add_marker(
+                    pytest.mark.skip(reason="set RUN_BENCHMARKS=1 to run benchmarks")
+                )
@@ -0,0 +1,111 @@
+import os
+import zlib
+
+import pytest
+from django.contrib.auth.models import User
+
+from apps.users.loaders import SHARED_PICTURES_DIR, load_users, read_picture
+from apps.users.models import SiteLinks, UserProfile
+from media.input_data.generate_data import DIR_PATH
+
+
+def user_data(username: str, picture: bool = False, **kwargs) -> dict:
+    pics = os.path.join(DIR_PATH, "profile_pics")
+    data = {
+        "username": username,
+        "email": f"{username}@EXAMPLE.com",
+        "first_name": username.capitalize(),
+        "last_name": "Nowak",
+        "password": f"{username}-secret",
+        "country": "Poland",
+        "city": "Kraków",
+        "phone_number": f"+48{zlib.crc32(username.encode()) % 10**9:09d}",
+        "profile_picture": (
+            os.path.join(pics, sorted(os.listdir(pics))[0]) if picture else None
+        ),
+        "linkedIn_url": f"https://www.linkedin.com/in/{username}",
+        "github_url": f"https://github.com/{username}",
+    }
+    data.update(kwargs)
+    return data
+
+
+@pytest.fixture
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    return tmp_path
+
+
+class TestLoadUsersUnit:
+    pytestmark = pytest.mark.django_db(transaction=False)
+
+    def test_creates_users_profiles_and_links(self, media_root):
+        data = [user_data(f"user{i}", picture=i == 0) for i in range(7)]
+        progress = []
+        result = load_users(
+            data, batch_size=3, fast_hashes=True, progress=progress.append
+        )
+
+        assert result["created"] == 7
+        assert progress == [3, 6, 7]
+        user = User.objects.get(username="user0")
+        assert user.email == "user0@example.com"
+        assert user.is_active
+        assert user.check_password("user0-secret")
+        assert user.userprofile.city == "Kraków"
+        assert user.userprofile.profile_picture.name.startswith("profile_pics/user0_")
+        assert sorted(user.sitelinks.values_list("name", flat=True)) == [
+            "Github", "Linkedin"
+        ]
+        assert UserProfile.objects.count() == 7
+        assert SiteLinks.objects.count() == 14
+
+    def test_queries_per_batch(self, media_root, django_assert_max_num_queries):
+        data = [user_data(f"user{i}") for i in range(50)]
+        # per batch: a username lookup, savepoint, 3 inserts and release
+        with django_assert_max_num_queries(2 * 6):
+            load_users(data, batch_size=25, fast_hashes=True)
+        assert User.objects.count() == 50
+
+    def test_skips_taken_usernames(self, media_root):
+        User.objects.create_user(username="anna")
+        data = [
+            user_data("anna"),
+            user_data("ola"),
+            user_data("ola", linkedIn_url="https://www.linkedin.com/in/ola2"),
+        ]
+        result = load_users(data, fast_hashes=True)
+        assert (result["created"], result["skipped"]) == (1, 2)
+        assert User.objects.filter(username="ola").count() == 1
+
+    def test_hashes_in_a_pool(self, media_root):
+        data = [user_data(f"user{i}") for i in range(4)]
+        load_users(data, batch_size=2, workers=2, fast_hashes=True)
+        assert all(
+            user.check_password(f"{user.username}-secret")
+            for user in User.objects.all()
+        )
+
+    def test_shared_pictures_stored_once(self, media_root):
+        read_picture.cache_clear()
+        data = [user_data(f"user{i}", picture=True) for i in range(5)]
+        load_users(data, batch_size=2, fast_hashes=True, shared_pictures=True)
+
+        names = set(
+            UserProfile.objects.values_list("profile_picture", flat=True)
+        )
+        assert len(names) == 1
+        assert names.pop().startswith(SHARED_PICTURES_DIR)
+        assert len(os.listdir(media_root / SHARED_PICTURES_DIR)) == 1
+        assert read_picture.cache_info().misses == 1
+
+        # a later run reuses the stored file
+        load_users(
+            [user_data("late", picture=True)], fast_hashes=True, shared_pictures=True
+        )
+        assert len(os.listdir(media_root / SHARED_PICTURES_DIR)) == 1
+
+    def test_copied_pictures(self, media_root):
+        data = [user_data(f"user{i}", picture=True) for i in range(3)]
+        load_users(data, fast_hashes=True)
+        assert len(os.listdir(media_root / "profile_pics")) == 3
@@ -0,0 +1,21 @@
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+
+from apps.users.tests.unit.test_loaders_unit import user_data
+
+
+class TestLoadUsersUnit:
+    pytestmark = pytest.mark.django_db(transaction=False)
+
+    def test_fast_hashes(self, settings, tmp_path, monkeypatch, capsys):
+        settings.MEDIA_ROOT = tmp_path
+        # generate_users also rewrites its sample JSON file
+        monkeypatch.setattr(
+            "apps.users.management.commands.load_users.generate_users",
+            lambda total: [user_data(f"user{i}") for i in range(total)],
+        )
+
+        call_command("load_users", 5, fast_hashes=True, batch_size=2)
+        assert User.objects.count() == 5
+        assert "Created 5 users" in capsys.readouterr().out
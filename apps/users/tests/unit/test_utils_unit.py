@@ -0,0 +1,19 @@
+from django.contrib.auth.hashers import check_password, identify_hasher
+
+from apps.users.utils import FAST_HASH_ITERATIONS, hash_password
+
+
+class TestHashPasswordUnit:
+
+    def test_fast_hash_verifies_and_asks_for_upgrade(self):
+        encoded = hash_password("s3cret!", fast=True)
+        assert encoded.startswith(f"pbkdf2_sha256${FAST_HASH_ITERATIONS}$")
+        assert check_password("s3cret!", encoded)
+        assert not check_password("other", encoded)
+        assert identify_hasher(encoded).must_update(encoded)
+
+    def test_default_hash(self, settings):
+        settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+        encoded = hash_password("s3cret!")
+        assert encoded.startswith("md5$")
+        assert check_password("s3cret!", encoded)
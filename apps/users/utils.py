@@ -1,4 +1,5 @@
 import os
+from django.contrib.auth.hashers import PBKDF2PasswordHasher, make_password
 from django.utils import timezone
 # from apps.users.models import UserProfile
 
@@ -61,6 +62,24 @@ def format_phone_number(phone_number: str, country: str = 'poland') -> str:
     )
 
 
+# PBKDF2 rounds of --fast-hashes seed passwords. The stored hash names its
+# own round count, so they still verify, and Django re-hashes them with the
+# full count on the first login.
+FAST_HASH_ITERATIONS = 1000
+
+
+def hash_password(password: str, fast: bool = False) -> str:
+    """
+    Return the password as stored in User.password: with the default
+    hasher, or with FAST_HASH_ITERATIONS rounds of PBKDF2 when `fast`.
+    Needs no app registry, so a spawned pool process can run it.
+    """
+    if not fast:
+        return make_password(password)
+    hasher = PBKDF2PasswordHasher()
+    return hasher.encode(password, hasher.salt(), iterations=FAST_HASH_ITERATIONS)
+
+
 def user_profile_picture_path(
     instance: "UserProfile",  # type: ignore # noqa: F821
     filename: str
@@ -38,17 +38,97 @@ document.addEventListener("DOMContentLoaded", function() {
         });
     }
 
-    // Existing resumes
-    if (fileInput && dropdownBtn && resumeInput) {
-        document.querySelectorAll('.resume-item').forEach(function(item) {
-            item.addEventListener('click', function(e) {
-                e.preventDefault();
-                const id = item.getAttribute('data-id');
-                const text = item.textContent;
-                dropdownBtn.textContent = text;    // update button label
-                resumeInput.value = id;             // store selected resume ID
-                fileInput.value = '';               // clear file input if previously used
+    // Existing resumes, fetched a page at a time as the user types
+    const resumeMenu = document.getElementById('resumeMenu');
+    const resumeSearch = document.getElementById('resumeSearch');
+    const resumeResults = document.getElementById('resumeResults');
+    const moreResumes = document.getElementById('moreResumes');
+    const jobBody = document.getElementById('id_job_application_body');
+    const resumeMatches = document.getElementById('resumeMatches');
+    const matchesSection = document.getElementById('resumeMatchesSection');
+    let nextCursor = null;
+    let searchTimer = null;
+    let matchTimer = null;
+
+    function resumeItem(resume, label) {
+        const link = document.createElement('a');
+        link.className = 'dropdown-item resume-item';
+        link.href = '#';
+        link.dataset.id = resume.id;
+        link.textContent = label || resume.text;
+        const item = document.createElement('li');
+        item.appendChild(link);
+        return item;
+    }
+
+    // Resumes ranked against the job description, refreshed as it is typed
+    function matchResumes() {
+        const csrfToken = document.querySelector('[name=csrfmiddlewaretoken]').value;
+        fetch(resumeMenu.dataset.matchUrl, {
+            method: 'POST',
+            headers: {'X-CSRFToken': csrfToken},
+            body: new URLSearchParams({text: jobBody.value}),
+        })
+            .then(function(response) { return response.json(); })
+            .then(function(data) {
+                resumeMatches.innerHTML = '';
+                data.results.forEach(function(resume) {
+                    const score = Math.round(resume.score * 100);
+                    resumeMatches.appendChild(resumeItem(resume, resume.text + ' (' + score + '%)'));
+                });
+                matchesSection.classList.toggle('d-none', !data.results.length);
             });
+    }
+
+    function loadResumes(cursor) {
+        const params = new URLSearchParams({q: resumeSearch.value});
+        if (cursor) {
+            params.set('cursor', cursor);
+        }
+        fetch(resumeMenu.dataset.lookupUrl + '?' + params)
+            .then(function(response) { return response.json(); })
+            .then(function(data) {
+                if (!cursor) {
+                    resumeResults.innerHTML = '';
+                }
+                data.results.forEach(function(resume) {
+                    resumeResults.appendChild(resumeItem(resume));
+                });
+                nextCursor = data.next;
+                moreResumes.classList.toggle('d-none', !nextCursor);
+            });
+    }
+
+    if (resumeMenu && fileInput && dropdownBtn && resumeInput) {
+        dropdownBtn.addEventListener('show.bs.dropdown', function() {
+            if (!resumeResults.children.length) {
+                loadResumes(null);
+            }
         });
+        resumeSearch.addEventListener('input', function() {
+            clearTimeout(searchTimer);
+            searchTimer = setTimeout(function() { loadResumes(null); }, 250);
+        });
+        moreResumes.addEventListener('click', function(e) {
+            e.preventDefault();
+            e.stopPropagation();
+            loadResumes(nextCursor);
+        });
+        resumeMenu.addEventListener('click', function(e) {
+            const item = e.target.closest('.resume-item');
+            if (!item) {
+                return;
+            }
+            e.preventDefault();
+            dropdownBtn.textContent = item.textContent;  // update button label
+            resumeInput.value = item.dataset.id;         // store selected resume ID
+            fileInput.value = '';                        // clear file input if previously used
+        });
+        if (jobBody) {
+            jobBody.addEventListener('input', function() {
+                clearTimeout(matchTimer);
+                matchTimer = setTimeout(matchResumes, 500);
+            });
+        }
     }
-});
\ No newline at end of file
+});